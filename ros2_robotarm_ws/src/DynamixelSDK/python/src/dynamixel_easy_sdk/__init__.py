@@ -19,14 +19,20 @@
 
 # Author: Hyungyu Kim
 
+from .bus_tuner import BusTuner
 from .connector import Connector
 from .control_table import ControlTable
+from .control_table_snapshot import ControlTableSnapshot
 from .data_types import (
+    BaudRateMeasurement,
+    BusTuningReport,
     CommandType,
     ControlTableItem,
     Direction,
     OperatingMode,
     ProfileConfiguration,
+    ProfileReport,
+    SnapshotDiff,
     StagedCommand,
     StatusRequest,
 )
@@ -35,15 +41,22 @@ from .dynamixel_error import DxlRuntimeError
 from .dynamixel_error import getErrorMessage
 from .group_executor import GroupExecutor
 from .motor import Motor
+from .motor_profile import MotorProfile
 
 __all__ = [
+    'BusTuner',
     'Connector',
     'ControlTable',
+    'ControlTableSnapshot',
+    'BaudRateMeasurement',
+    'BusTuningReport',
     'CommandType',
     'ControlTableItem',
     'Direction',
     'OperatingMode',
     'ProfileConfiguration',
+    'ProfileReport',
+    'SnapshotDiff',
     'StagedCommand',
     'StatusRequest',
     'DxlError',
@@ -51,4 +64,5 @@ __all__ = [
     'getErrorMessage',
     'GroupExecutor',
     'Motor',
+    'MotorProfile',
 ]
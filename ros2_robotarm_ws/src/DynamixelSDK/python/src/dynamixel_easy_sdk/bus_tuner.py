@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from dynamixel_easy_sdk.control_table import ControlTable
+from dynamixel_easy_sdk.data_types import BaudRateMeasurement
+from dynamixel_easy_sdk.data_types import BusTuningReport
+from dynamixel_easy_sdk.data_types import ControlTableItem
+from dynamixel_easy_sdk.dynamixel_error import DxlError
+from dynamixel_easy_sdk.dynamixel_error import DxlRuntimeError
+from dynamixel_sdk import GroupSyncRead
+
+# Control table value of 'Baud Rate' for each bus speed (X / P / Y series)
+BAUD_RATE_VALUES = {
+    9600: 0,
+    57600: 1,
+    115200: 2,
+    1000000: 3,
+    2000000: 4,
+    3000000: 5,
+    4000000: 6,
+    4500000: 7,
+}
+
+# 'Baud Rate' encoding by model file name prefix, first match wins.
+# Models without a known encoding are never written, Protocol 1.0 models use other values.
+# MX models answering Protocol 2.0 run the 2.0 firmware, which uses the X series values.
+MODEL_BAUD_RATE_VALUES = (
+    ('xl320', {9600: 0, 57600: 1, 115200: 2, 1000000: 3}),
+    ('mx_', BAUD_RATE_VALUES),
+    ('x', BAUD_RATE_VALUES),
+    ('2x', BAUD_RATE_VALUES),
+    ('ph', BAUD_RATE_VALUES),
+    ('pm', BAUD_RATE_VALUES),
+    ('ym', BAUD_RATE_VALUES),
+)
+
+BAUD_RATE_ITEM_NAMES = ('Baud Rate', 'Baud Rate (Bus)')
+RETURN_DELAY_TIME_UNIT_US = 2
+BITS_PER_BYTE = 10  # start + 8 data + stop
+
+# Protocol 2.0 packet overhead: header(4) + id(1) + length(2) + instruction(1) + crc(2)
+INSTRUCTION_OVERHEAD = 10
+
+
+class BusTuner:
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.port_handler = connector._port_handler
+        self.packet_handler = connector._packet_handler
+        self.model_numbers: Dict[int, int] = {}
+
+    def getCandidateBaudRates(self, motor_ids: Optional[List[int]] = None) -> List[int]:
+        # With motor_ids, only the speeds every one of them can be set to
+        baud_rates = set(BAUD_RATE_VALUES)
+        for motor_id in motor_ids or []:
+            baud_rates &= set(self.getBaudRateValues(motor_id))
+        return [
+            baud_rate for baud_rate in sorted(baud_rates)
+            if self.port_handler.getCFlagBaud(baud_rate) > 0
+        ]
+
+    def getBaudRateValues(self, motor_id: int) -> Dict[int, int]:
+        model_name = ControlTable.getModelName(self._getModelNumber(motor_id))
+        for prefix, values in MODEL_BAUD_RATE_VALUES:
+            if model_name.startswith(prefix):
+                return values
+        raise DxlRuntimeError(DxlError.EASY_SDK_FUNCTION_NOT_SUPPORTED)
+
+    def discover(self, baud_rates: Optional[List[int]] = None) -> Dict[int, List[int]]:
+        if baud_rates is None:
+            baud_rates = self.getCandidateBaudRates()
+
+        initial_baud_rate = self.connector.getBaudRate()
+        found = {}
+        try:
+            for baud_rate in baud_rates:
+                self.connector.setBaudRate(baud_rate)
+                ids = self._broadcastPing()
+                if ids:
+                    found[baud_rate] = sorted(ids)
+        finally:
+            self.connector.setBaudRate(initial_baud_rate)
+        return found
+
+    def measure(self, motor_ids: List[int], attempts: int = 100) -> BaudRateMeasurement:
+        measurement = BaudRateMeasurement(self.connector.getBaudRate(), list(motor_ids))
+        round_trip_sum = 0.0
+        succeeded = 0
+
+        for _ in range(attempts):
+            for motor_id in motor_ids:
+                start = time.perf_counter()
+                _, dxl_comm_result, dxl_error = self.packet_handler.ping(self.port_handler, motor_id)
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                measurement.attempts += 1
+                if dxl_comm_result != DxlError.SDK_COMM_SUCCESS or dxl_error != 0:
+                    measurement.errors += 1
+                    continue
+                succeeded += 1
+                round_trip_sum += elapsed_ms
+                measurement.round_trip_max_ms = max(measurement.round_trip_max_ms, elapsed_ms)
+
+        if measurement.attempts:
+            measurement.error_rate = measurement.errors / measurement.attempts
+        if succeeded:
+            measurement.round_trip_avg_ms = round_trip_sum / succeeded
+        return measurement
+
+    def setReturnDelayTime(self, motor_ids: List[int], delay_us: int) -> None:
+        value = delay_us // RETURN_DELAY_TIME_UNIT_US
+        if not (0 <= value <= 254):
+            raise DxlRuntimeError('Return Delay Time must be between 0 and 508 us')
+
+        items = {}
+        for motor_id in motor_ids:
+            self._checkTorqueOff(motor_id)
+            items[motor_id] = self._getControlTableItem(motor_id, ('Return Delay Time',))
+
+        for motor_id, item in items.items():
+            self._writeItem(motor_id, item, value)
+
+    def changeBaudRate(self, motor_ids: List[int], baud_rate: int) -> None:
+        if baud_rate not in BAUD_RATE_VALUES or self.port_handler.getCFlagBaud(baud_rate) <= 0:
+            raise DxlRuntimeError(f'Unsupported baud rate: {baud_rate}')
+
+        initial_baud_rate = self.connector.getBaudRate()
+        if baud_rate == initial_baud_rate:
+            return
+
+        items = {}
+        values = {}
+        for motor_id in motor_ids:
+            self._checkTorqueOff(motor_id)
+            items[motor_id] = self._getControlTableItem(motor_id, BAUD_RATE_ITEM_NAMES)
+            values[motor_id] = self.getBaudRateValues(motor_id)
+            if baud_rate not in values[motor_id]:
+                raise DxlRuntimeError(f'ID {motor_id} does not support {baud_rate} bps')
+            if initial_baud_rate not in values[motor_id]:
+                raise DxlRuntimeError(
+                    f'Current baud rate cannot be restored on ID {motor_id}: {initial_baud_rate}')
+
+        # Each device answers at the old speed and switches right after its status packet.
+        # A failed write may still have been applied, so every attempted device is rolled back.
+        attempted = []
+        try:
+            for motor_id in motor_ids:
+                attempted.append(motor_id)
+                self._writeItem(motor_id, items[motor_id], values[motor_id][baud_rate])
+        except DxlRuntimeError:
+            self._rollbackBaudRate(attempted, items, values, baud_rate, initial_baud_rate)
+            raise
+
+        self.connector.setBaudRate(baud_rate)
+        missing = set(motor_ids) - set(self._broadcastPing())
+        if missing:
+            self._rollbackBaudRate(motor_ids, items, values, baud_rate, initial_baud_rate)
+            raise DxlRuntimeError(
+                f'Lost contact with ID {sorted(missing)} at {baud_rate} bps, rolled back to {initial_baud_rate} bps')
+
+    def estimateLoopFrequency(self, motor_ids: List[int], read_address: int, read_length: int,
+                              write_length: int = 0, iterations: int = 100) -> float:
+        group = GroupSyncRead(self.port_handler, self.packet_handler, read_address, read_length)
+        for motor_id in motor_ids:
+            if not group.addParam(motor_id):
+                raise DxlRuntimeError(DxlError.EASY_SDK_ADD_PARAM_FAIL)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            dxl_comm_result = group.txRxPacket()
+            if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
+                raise DxlRuntimeError(DxlError(dxl_comm_result))
+        read_time = (time.perf_counter() - start) / iterations
+
+        # Sync write has no status packet, so its cost is the wire time of the instruction
+        write_time = 0.0
+        if write_length > 0:
+            write_bytes = INSTRUCTION_OVERHEAD + 4 + len(motor_ids) * (1 + write_length)
+            write_time = write_bytes * BITS_PER_BYTE / self.connector.getBaudRate()
+
+        return 1.0 / (read_time + write_time)
+
+    def tune(self, motor_ids: Optional[List[int]] = None, return_delay_time_us: Optional[int] = 0,
+             attempts: int = 100, max_error_rate: float = 0.0,
+             read_address: Optional[int] = None, read_length: int = 0,
+             write_length: int = 0) -> BusTuningReport:
+        initial_baud_rate = self.connector.getBaudRate()
+        if motor_ids is None:
+            motor_ids = sorted(self._broadcastPing())
+        if not motor_ids:
+            raise DxlRuntimeError(DxlError.SDK_COMM_RX_TIMEOUT)
+
+        if return_delay_time_us is not None:
+            self.setReturnDelayTime(motor_ids, return_delay_time_us)
+
+        report = BusTuningReport(initial_baud_rate, initial_baud_rate, return_delay_time_us, list(motor_ids))
+        best_baud_rate = initial_baud_rate
+
+        for baud_rate in self.getCandidateBaudRates(motor_ids):
+            if baud_rate < initial_baud_rate:
+                continue
+            try:
+                self.changeBaudRate(motor_ids, baud_rate)
+            except DxlRuntimeError:
+                break
+
+            measurement = self.measure(motor_ids, attempts)
+            if read_address is not None and measurement.errors == 0:
+                measurement.loop_frequency_hz = self.estimateLoopFrequency(
+                    motor_ids, read_address, read_length, write_length)
+            report.measurements.append(measurement)
+
+            if measurement.error_rate > max_error_rate:
+                break
+            best_baud_rate = baud_rate
+
+        self.changeBaudRate(motor_ids, best_baud_rate)
+        report.final_baud_rate = best_baud_rate
+        return report
+
+    def _rollbackBaudRate(self, motor_ids, items, values, baud_rate, initial_baud_rate):
+        self.connector.setBaudRate(baud_rate)
+        for motor_id in motor_ids:
+            try:
+                self._writeItem(motor_id, items[motor_id], values[motor_id][initial_baud_rate])
+            except DxlRuntimeError:
+                pass
+        self.connector.setBaudRate(initial_baud_rate)
+
+    def _broadcastPing(self) -> List[int]:
+        try:
+            return list(self.connector.broadcastPing())
+        except DxlRuntimeError:
+            return []
+
+    def _getModelNumber(self, motor_id: int) -> int:
+        if motor_id not in self.model_numbers:
+            self.model_numbers[motor_id] = self.connector.ping(motor_id)
+        return self.model_numbers[motor_id]
+
+    def _getControlTableItem(self, motor_id: int, names) -> ControlTableItem:
+        control_table = ControlTable.getControlTable(self._getModelNumber(motor_id))
+        for name in names:
+            if name in control_table:
+                return control_table[name]
+        raise DxlRuntimeError(DxlError.EASY_SDK_FUNCTION_NOT_SUPPORTED)
+
+    def _checkTorqueOff(self, motor_id: int) -> None:
+        item = self._getControlTableItem(motor_id, ('Torque Enable',))
+        if self._readItem(motor_id, item) != 0:
+            raise DxlRuntimeError(DxlError.EASY_SDK_TORQUE_STATUS_MISMATCH)
+
+    def _readItem(self, motor_id: int, item: ControlTableItem) -> int:
+        if item.size == 1:
+            return self.connector.read1ByteData(motor_id, item.address)
+        elif item.size == 2:
+            return self.connector.read2ByteData(motor_id, item.address)
+        elif item.size == 4:
+            return self.connector.read4ByteData(motor_id, item.address)
+        raise DxlRuntimeError(DxlError.EASY_SDK_FUNCTION_NOT_SUPPORTED)
+
+    def _writeItem(self, motor_id: int, item: ControlTableItem, value: int) -> None:
+        if item.size == 1:
+            self.connector.write1ByteData(motor_id, item.address, value)
+        elif item.size == 2:
+            self.connector.write2ByteData(motor_id, item.address, value)
+        elif item.size == 4:
+            self.connector.write4ByteData(motor_id, item.address, value)
+        else:
+            raise DxlRuntimeError(DxlError.EASY_SDK_FUNCTION_NOT_SUPPORTED)
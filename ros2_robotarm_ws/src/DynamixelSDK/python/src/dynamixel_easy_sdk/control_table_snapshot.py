@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import json
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from dynamixel_easy_sdk.data_types import ControlTableItem
+from dynamixel_easy_sdk.data_types import ProfileReport
+from dynamixel_easy_sdk.data_types import SnapshotDiff
+from dynamixel_easy_sdk.dynamixel_error import DxlRuntimeError
+from dynamixel_easy_sdk.motor_profile import ProfileTransaction
+
+SNAPSHOT_FORMAT = 'dynamixel_control_table_snapshot'
+SNAPSHOT_VERSION = 1
+
+# Unused addresses between two items are read along with them unless the gap is wider
+# than MAX_SNAPSHOT_GAP, and no single read is longer than MAX_SNAPSHOT_SPAN.
+MAX_SNAPSHOT_GAP = 64
+MAX_SNAPSHOT_SPAN = 512
+
+# Read-only, or changing them would drop the device off the bus in the middle of a restore
+RESTORE_EXCLUDED_FIELDS = (
+    'Model Number',
+    'Model Information',
+    'Firmware Version',
+    'ID',
+    'Baud Rate',
+    'Protocol Type',
+)
+
+
+def getSnapshotSpans(control_table: Dict[str, ControlTableItem],
+                     max_gap: int = MAX_SNAPSHOT_GAP,
+                     max_span: int = MAX_SNAPSHOT_SPAN) -> List[Tuple[int, int]]:
+    spans = []
+    for item in sorted(control_table.values(), key=lambda item: item.address):
+        end = item.address + item.size
+        if spans:
+            start, length = spans[-1]
+            if item.address - (start + length) <= max_gap and end - start <= max_span:
+                spans[-1] = (start, max(length, end - start))
+                continue
+        spans.append((item.address, item.size))
+    return spans
+
+
+class ControlTableSnapshot:
+
+    def __init__(self, model_numbers: Dict[int, int], values: Dict[int, Dict[str, int]],
+                 baud_rate: Optional[int] = None, created: Optional[float] = None):
+        self.model_numbers = {int(motor_id): model_number for motor_id, model_number in model_numbers.items()}
+        self.values = {int(motor_id): dict(fields) for motor_id, fields in values.items()}
+        self.baud_rate = baud_rate
+        self.created = time.time() if created is None else created
+
+    @classmethod
+    def capture(cls, connector, motor_ids: Optional[List[int]] = None,
+                max_gap: int = MAX_SNAPSHOT_GAP,
+                max_span: int = MAX_SNAPSHOT_SPAN) -> 'ControlTableSnapshot':
+        if motor_ids is None:
+            motor_ids = sorted(connector.broadcastPing())
+        if not motor_ids:
+            return cls({}, {}, connector.getBaudRate())
+
+        transaction = ProfileTransaction(connector, motor_ids)
+        spans = {
+            motor_id: getSnapshotSpans(control_table, max_gap, max_span)
+            for motor_id, control_table in transaction.control_tables.items()
+        }
+
+        # a bulk read carries one span per ID, so round k reads the k-th span of every ID
+        data = {motor_id: {} for motor_id in motor_ids}
+        round_index = 0
+        while True:
+            round_spans = {
+                motor_id: motor_spans[round_index]
+                for motor_id, motor_spans in spans.items() if round_index < len(motor_spans)
+            }
+            if not round_spans:
+                break
+            for motor_id, span_data in transaction.readSpans(round_spans).items():
+                data[motor_id][round_spans[motor_id][0]] = span_data
+            round_index += 1
+
+        values = {}
+        for motor_id, control_table in transaction.control_tables.items():
+            values[motor_id] = {}
+            for name, item in control_table.items():
+                for start, span_data in data[motor_id].items():
+                    offset = item.address - start
+                    if 0 <= offset and offset + item.size <= len(span_data):
+                        values[motor_id][name] = int.from_bytes(span_data[offset:offset + item.size], 'little')
+                        break
+        return cls(transaction.model_numbers, values, connector.getBaudRate())
+
+    @classmethod
+    def fromDict(cls, data: Dict) -> 'ControlTableSnapshot':
+        if data.get('format') != SNAPSHOT_FORMAT:
+            raise DxlRuntimeError('Not a control table snapshot')
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise DxlRuntimeError(f'Unsupported snapshot version: {data.get("version")}')
+        devices = data['devices']
+        return cls(
+            {motor_id: device['model_number'] for motor_id, device in devices.items()},
+            {motor_id: device['values'] for motor_id, device in devices.items()},
+            data.get('baud_rate'),
+            data.get('created'))
+
+    def toDict(self) -> Dict:
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'created': self.created,
+            'baud_rate': self.baud_rate,
+            'devices': {
+                str(motor_id): {
+                    'model_number': self.model_numbers[motor_id],
+                    'values': self.values[motor_id],
+                }
+                for motor_id in sorted(self.model_numbers)
+            },
+        }
+
+    @classmethod
+    def load(cls, file_name: str) -> 'ControlTableSnapshot':
+        with open(file_name, encoding='utf-8') as infile:
+            return cls.fromDict(json.load(infile))
+
+    def save(self, file_name: str) -> None:
+        with open(file_name, 'w', encoding='utf-8') as outfile:
+            json.dump(self.toDict(), outfile, separators=(',', ':'))
+
+    def diff(self, other: 'ControlTableSnapshot') -> SnapshotDiff:
+        result = SnapshotDiff()
+        result.missing = sorted(set(self.model_numbers) - set(other.model_numbers))
+        result.added = sorted(set(other.model_numbers) - set(self.model_numbers))
+        for motor_id in sorted(set(self.model_numbers) & set(other.model_numbers)):
+            if self.model_numbers[motor_id] != other.model_numbers[motor_id]:
+                result.model_changed.append(motor_id)
+                continue
+            before = self.values[motor_id]
+            after = other.values[motor_id]
+            changes = {
+                name: (value, after[name])
+                for name, value in before.items() if name in after and after[name] != value
+            }
+            if changes:
+                result.changes[motor_id] = changes
+        return result
+
+    def diffLive(self, connector, motor_ids: Optional[List[int]] = None) -> SnapshotDiff:
+        return self.diff(ControlTableSnapshot.capture(connector, motor_ids))
+
+    def restore(self, connector, motor_ids: Optional[List[int]] = None, verify: bool = True) -> ProfileReport:
+        # only EEPROM fields are restored, and ProfileTransaction writes only the ones that differ
+        if motor_ids is None:
+            motor_ids = sorted(self.model_numbers)
+        unknown = [motor_id for motor_id in motor_ids if motor_id not in self.model_numbers]
+        if unknown:
+            raise DxlRuntimeError(f'IDs {unknown} are not in the snapshot')
+
+        transaction = ProfileTransaction(connector, motor_ids)
+        model_changed = [
+            motor_id for motor_id in motor_ids
+            if transaction.model_numbers[motor_id] != self.model_numbers[motor_id]
+        ]
+        if model_changed:
+            raise DxlRuntimeError(f'IDs {model_changed} are a different model than in the snapshot')
+
+        targets = {}
+        for motor_id in motor_ids:
+            fields = {
+                name: value for name, value in self.values[motor_id].items()
+                if name not in RESTORE_EXCLUDED_FIELDS and transaction.isEeprom(motor_id, name)
+            }
+            if fields:
+                targets[motor_id] = fields
+        return transaction.apply(targets, verify)
+
+
+def _main(argv=None):
+    import argparse
+
+    from dynamixel_easy_sdk.connector import Connector
+
+    parser = argparse.ArgumentParser(description='Snapshot, diff and restore DYNAMIXEL control tables.')
+    parser.add_argument('command', choices=['snapshot', 'diff', 'restore'])
+    parser.add_argument('files', nargs='+', help='snapshot file(s); diff takes two, or one to compare with the bus')
+    parser.add_argument('--device', default='/dev/ttyUSB0')
+    parser.add_argument('--baudrate', type=int, default=57600)
+    parser.add_argument('--ids', type=int, nargs='+', help='default: every ID answering a broadcast ping')
+    args = parser.parse_args(argv)
+
+    if args.command == 'diff' and len(args.files) == 2:
+        result = ControlTableSnapshot.load(args.files[0]).diff(ControlTableSnapshot.load(args.files[1]))
+        connector = None
+    else:
+        connector = Connector(args.device, args.baudrate)
+
+    try:
+        if args.command == 'snapshot':
+            snapshot = ControlTableSnapshot.capture(connector, args.ids)
+            snapshot.save(args.files[0])
+            print(f'Saved {len(snapshot.model_numbers)} device(s) to {args.files[0]}')
+            return
+        if args.command == 'restore':
+            report = ControlTableSnapshot.load(args.files[0]).restore(connector, args.ids)
+            for motor_id, changes in sorted(report.changes.items()):
+                for name, (before, after) in changes.items():
+                    print(f'ID {motor_id:3d}  {name:32s} {before} -> {after}')
+            print(f'Restored {sum(len(changes) for changes in report.changes.values())} field(s)')
+            return
+        if connector is not None:
+            result = ControlTableSnapshot.load(args.files[0]).diffLive(connector, args.ids)
+    finally:
+        if connector is not None:
+            connector.closePort()
+
+    for motor_id in result.missing:
+        print(f'ID {motor_id:3d}  missing')
+    for motor_id in result.added:
+        print(f'ID {motor_id:3d}  added')
+    for motor_id in result.model_changed:
+        print(f'ID {motor_id:3d}  model changed')
+    for motor_id, changes in sorted(result.changes.items()):
+        for name, (before, after) in changes.items():
+            print(f'ID {motor_id:3d}  {name:32s} {before} -> {after}')
+
+
+if __name__ == '__main__':
+    _main()
@@ -20,9 +20,12 @@
 # Author: Hyungyu Kim
 
 from dataclasses import dataclass
+from dataclasses import field
 from enum import IntEnum
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 
 @dataclass
@@ -73,6 +76,42 @@ class StagedCommand:
     allowable_operating_modes: Optional[List[OperatingMode]] = None
 
 
+@dataclass
+class BaudRateMeasurement:
+    baud_rate: int
+    motor_ids: List[int]
+    attempts: int = 0
+    errors: int = 0
+    error_rate: float = 0.0
+    round_trip_avg_ms: float = 0.0
+    round_trip_max_ms: float = 0.0
+    loop_frequency_hz: Optional[float] = None
+
+
+@dataclass
+class BusTuningReport:
+    initial_baud_rate: int
+    final_baud_rate: int
+    return_delay_time: Optional[int]
+    motor_ids: List[int]
+    measurements: List[BaudRateMeasurement] = field(default_factory=list)
+
+
+@dataclass
+class ProfileReport:
+    changes: Dict[int, Dict[str, Tuple[int, int]]] = field(default_factory=dict)
+    torque_cycled: List[int] = field(default_factory=list)
+    verified: bool = False
+
+
+@dataclass
+class SnapshotDiff:
+    changes: Dict[int, Dict[str, Tuple[int, int]]] = field(default_factory=dict)
+    missing: List[int] = field(default_factory=list)  # only in the first snapshot
+    added: List[int] = field(default_factory=list)  # only in the second snapshot
+    model_changed: List[int] = field(default_factory=list)
+
+
 def toSignedInt(value: int, size: int) -> int:
     bits = size * 8
     if value >= (1 << (bits - 1)):
@@ -228,6 +228,9 @@ class Motor:
     def reboot(self) -> None:
         self.connector.reboot(self.id)
 
+    def clearMultiTurn(self) -> None:
+        self.connector.clearMultiTurn(self.id)
+
     def factoryResetAll(self) -> None:
         self.connector.factoryReset(self.id, 0xFF)
 
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import contextlib
+import heapq
+import threading
+import time
+
+from .robotis_def import *
+
+PRIORITY_CONTROL = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_CONTROL: 'control',
+    PRIORITY_NORMAL: 'normal',
+    PRIORITY_BACKGROUND: 'background',
+}
+
+
+class BusArbiter:
+    # The packet handlers and groups do not consult the arbiter. Every caller sharing the
+    # port has to run its transactions through execute() or inside hold().
+    def __init__(self, port):
+        self.port = port
+        self.condition = threading.Condition()
+        self.waiting = []  # heap of [priority, deadline, sequence]
+        self.sequence = 0
+        self.is_busy = False
+        self.owner_priority = None
+        self.grant_time = 0.0
+        self.resetStats()
+
+    def resetStats(self):
+        with self.condition:
+            self.stats = {}
+            for priority in PRIORITY_NAMES:
+                self.stats[priority] = {
+                    'granted': 0,
+                    'deadline_missed': 0,
+                    'bypassed': 0,  # times a waiting transaction was passed over by a higher class
+                    'wait_sum_ms': 0.0,
+                    'wait_max_ms': 0.0,
+                    'hold_sum_ms': 0.0,
+                    'hold_max_ms': 0.0,
+                }
+
+    def acquire(self, priority=PRIORITY_NORMAL, deadline_ms=None):
+        start = time.perf_counter()
+        deadline = float('inf') if deadline_ms is None else start + deadline_ms / 1000.0
+
+        with self.condition:
+            self.sequence += 1
+            entry = [priority, deadline, self.sequence]
+            heapq.heappush(self.waiting, entry)
+
+            while True:
+                if not self.is_busy and self.waiting[0] is entry:
+                    heapq.heappop(self.waiting)
+                    self.grant(entry, start)
+                    return True
+
+                now = time.perf_counter()
+                if now >= deadline:
+                    self.waiting.remove(entry)
+                    heapq.heapify(self.waiting)
+                    self.stats[priority]['deadline_missed'] += 1
+                    self.condition.notify_all()
+                    return False
+
+                self.condition.wait(None if deadline == float('inf') else deadline - now)
+
+    def release(self):
+        with self.condition:
+            if not self.is_busy:
+                raise RuntimeError('release() without a granted acquire()')
+            hold_ms = (time.perf_counter() - self.grant_time) * 1000.0
+            stats = self.stats[self.owner_priority]
+            stats['hold_sum_ms'] += hold_ms
+            stats['hold_max_ms'] = max(stats['hold_max_ms'], hold_ms)
+
+            self.is_busy = False
+            self.owner_priority = None
+            self.grant_time = 0.0
+            self.condition.notify_all()
+
+    def execute(self, transaction, *args, priority=PRIORITY_NORMAL, deadline_ms=None):
+        # runs one whole transaction (e.g. ph.read4ByteTxRx or group.txRxPacket) on the bus
+        if not self.acquire(priority, deadline_ms):
+            return COMM_PORT_BUSY, None
+        try:
+            return COMM_SUCCESS, transaction(*args)
+        finally:
+            self.release()
+
+    @contextlib.contextmanager
+    def hold(self, priority=PRIORITY_NORMAL, deadline_ms=None):
+        # with arbiter.hold(PRIORITY_CONTROL, 5.0) as granted: run the transaction if granted
+        granted = self.acquire(priority, deadline_ms)
+        try:
+            yield granted
+        finally:
+            if granted:
+                self.release()
+
+    def grant(self, entry, start):
+        priority = entry[0]
+        wait_ms = (time.perf_counter() - start) * 1000.0
+
+        stats = self.stats[priority]
+        stats['granted'] += 1
+        stats['wait_sum_ms'] += wait_ms
+        stats['wait_max_ms'] = max(stats['wait_max_ms'], wait_ms)
+        for waiting in self.waiting:
+            if waiting[0] > priority:
+                self.stats[waiting[0]]['bypassed'] += 1
+
+        self.is_busy = True
+        self.owner_priority = priority
+        self.grant_time = time.perf_counter()
+
+    def getStats(self):
+        with self.condition:
+            report = {}
+            for priority, stats in self.stats.items():
+                entry = dict(stats)
+                entry['wait_avg_ms'] = stats['wait_sum_ms'] / stats['granted'] if stats['granted'] else 0.0
+                entry['hold_avg_ms'] = stats['hold_sum_ms'] / stats['granted'] if stats['granted'] else 0.0
+                report[PRIORITY_NAMES[priority]] = entry
+            report['queued'] = len(self.waiting)
+            return report
@@ -20,6 +20,7 @@
 # Author: Ryu Woon Jung (Leon)
 
 from .robotis_def import *
+from .group_sync_write import DEFAULT_FULL_REFRESH_INTERVAL
 
 
 class GroupBulkWrite:
@@ -31,8 +32,22 @@ class GroupBulkWrite:
         self.param = []
         self.data_list = {}
 
+        self.delta_mode = False
+        self.full_refresh_interval = DEFAULT_FULL_REFRESH_INTERVAL
+        self.tx_count = 0
+        self.last_sent = {}
+
         self.clearParam()
 
+    def setDeltaMode(self, enable, full_refresh_interval=DEFAULT_FULL_REFRESH_INTERVAL):
+        self.delta_mode = enable
+        self.full_refresh_interval = full_refresh_interval
+        self.resetDelta()
+
+    def resetDelta(self):
+        self.tx_count = 0
+        self.last_sent.clear()
+
     def makeParam(self):
         if self.ph.getProtocolVersion() == 1.0 or not self.data_list:
             return
@@ -103,7 +118,52 @@ class GroupBulkWrite:
         if self.ph.getProtocolVersion() == 1.0 or len(self.data_list.keys()) == 0:
             return COMM_NOT_AVAILABLE
 
+        if self.delta_mode:
+            return self.txDeltaPacket()
+
         if self.is_param_changed is True or len(self.param) == 0:
             self.makeParam()
 
         return self.ph.bulkWriteTxOnly(self.port, self.param, len(self.param))
+
+    def txDeltaPacket(self):
+        # a control table item only accepts whole writes, so every changed entry is sent in full
+        full_refresh = self.full_refresh_interval > 0 and self.tx_count % self.full_refresh_interval == 0
+        self.tx_count += 1
+
+        changed = []
+        for dxl_id, (data, start_address, data_length) in self.data_list.items():
+            if full_refresh or self.last_sent.get(dxl_id) != [list(data), start_address, data_length]:
+                changed.append(dxl_id)
+
+        if not changed:
+            return COMM_SUCCESS
+
+        # entries sharing one field fit in a smaller sync write
+        fields = set((self.data_list[dxl_id][1], self.data_list[dxl_id][2]) for dxl_id in changed)
+        if len(changed) > 1 and len(fields) == 1:
+            start_address, data_length = fields.pop()
+            param = []
+            for dxl_id in changed:
+                param.append(dxl_id)
+                param.extend(self.data_list[dxl_id][0])
+            result = self.ph.syncWriteTxOnly(self.port, start_address, data_length, param, len(param))
+        else:
+            param = []
+            for dxl_id in changed:
+                data, start_address, data_length = self.data_list[dxl_id]
+                param.append(dxl_id)
+                param.append(DXL_LOBYTE(start_address))
+                param.append(DXL_HIBYTE(start_address))
+                param.append(DXL_LOBYTE(data_length))
+                param.append(DXL_HIBYTE(data_length))
+                param.extend(data)
+            result = self.ph.bulkWriteTxOnly(self.port, param, len(param))
+
+        if result == COMM_SUCCESS:
+            for dxl_id in changed:
+                data, start_address, data_length = self.data_list[dxl_id]
+                self.last_sent[dxl_id] = [list(data), start_address, data_length]
+        else:
+            self.resetDelta()
+        return result
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import time
+
+from .robotis_def import *
+
+
+class GroupRegWrite:
+    # Stages a per-ID write on every device with REG_WRITE, then applies all of them
+    # at once with a broadcast ACTION. Works on Protocol 1.0, which has no bulk write.
+    def __init__(self, port, ph, wait_status=True):
+        self.port = port
+        self.ph = ph
+
+        # wait_status=False pipelines the REG_WRITE packets without reading status packets.
+        # Only use it when Status Return Level is 0 or 1, otherwise the replies collide
+        # with the next instruction on the bus.
+        self.wait_status = wait_status
+
+        self.data_list = {}
+        self.last_error = 0
+        self.stage_time = 0.0
+        self.action_time = 0.0
+
+        self.clearParam()
+
+    def addParam(self, dxl_id, start_address, data_length, data):
+        if dxl_id in self.data_list:  # dxl_id already exist
+            return False
+
+        if len(data) > data_length:  # input data is longer than set
+            return False
+
+        self.data_list[dxl_id] = [data, start_address, data_length]
+        return True
+
+    def removeParam(self, dxl_id):
+        if dxl_id not in self.data_list:  # NOT exist
+            return
+
+        del self.data_list[dxl_id]
+
+    def changeParam(self, dxl_id, start_address, data_length, data):
+        if dxl_id not in self.data_list:  # NOT exist
+            return False
+
+        if len(data) > data_length:  # input data is longer than set
+            return False
+
+        self.data_list[dxl_id] = [data, start_address, data_length]
+        return True
+
+    def clearParam(self):
+        self.data_list.clear()
+
+    def txPacket(self):
+        # ACTION is only sent when every device staged its write. On a failed transmission or a
+        # status error the staged writes are reset and nothing moves; a status error returns
+        # COMM_SUCCESS with getLastError() set, like a single write.
+        if len(self.data_list.keys()) == 0:
+            return COMM_NOT_AVAILABLE
+
+        self.last_error = 0
+        start = time.perf_counter()
+
+        attempted = []
+        for dxl_id, (data, start_address, data_length) in self.data_list.items():
+            attempted.append(dxl_id)
+            error = 0
+            if self.wait_status:
+                result, error = self.ph.regWriteTxRx(self.port, dxl_id, start_address, data_length, list(data))
+            else:
+                result = self.ph.regWriteTxOnly(self.port, dxl_id, start_address, data_length, list(data))
+            if result != COMM_SUCCESS or error != 0:
+                self.last_error = error
+                self.resetStaged(attempted)
+                return result
+
+        staged = time.perf_counter()
+        result = self.ph.action(self.port, BROADCAST_ID)
+        end = time.perf_counter()
+
+        # stage_time is roughly the start skew the same writes would have had if sent one by one
+        self.stage_time = (staged - start) * 1000.0
+        self.action_time = (end - staged) * 1000.0
+        return result
+
+    def resetStaged(self, dxl_ids=None):
+        # A device keeps one registered instruction, which the next ACTION from anyone applies.
+        # Registering the value the address already holds makes that ACTION a no-op.
+        result = COMM_SUCCESS
+        for dxl_id in list(self.data_list) if dxl_ids is None else dxl_ids:
+            _, start_address, data_length = self.data_list[dxl_id]
+            data, dxl_comm_result, _ = self.ph.readTxRx(self.port, dxl_id, start_address, data_length)
+            if dxl_comm_result == COMM_SUCCESS:
+                if self.wait_status:
+                    dxl_comm_result, _ = self.ph.regWriteTxRx(self.port, dxl_id, start_address, data_length, data)
+                else:
+                    dxl_comm_result = self.ph.regWriteTxOnly(self.port, dxl_id, start_address, data_length, data)
+            if dxl_comm_result != COMM_SUCCESS:
+                result = dxl_comm_result
+        return result
+
+    def getLastError(self):
+        return self.last_error
+
+    def getTiming(self):
+        return {'stage_ms': self.stage_time, 'action_ms': self.action_time}
@@ -21,6 +21,8 @@
 
 from .robotis_def import *
 
+DEFAULT_FULL_REFRESH_INTERVAL = 50
+
 
 class GroupSyncWrite:
     def __init__(self, port, ph, start_address, data_length):
@@ -33,8 +35,22 @@ class GroupSyncWrite:
         self.param = []
         self.data_dict = {}
 
+        self.delta_mode = False
+        self.full_refresh_interval = DEFAULT_FULL_REFRESH_INTERVAL
+        self.tx_count = 0
+        self.last_sent = {}
+
         self.clearParam()
 
+    def setDeltaMode(self, enable, full_refresh_interval=DEFAULT_FULL_REFRESH_INTERVAL):
+        self.delta_mode = enable
+        self.full_refresh_interval = full_refresh_interval
+        self.resetDelta()
+
+    def resetDelta(self):
+        self.tx_count = 0
+        self.last_sent.clear()
+
     def makeParam(self):
         if not self.data_dict:
             return
@@ -87,8 +103,42 @@ class GroupSyncWrite:
         if len(self.data_dict.keys()) == 0:
             return COMM_NOT_AVAILABLE
 
+        if self.delta_mode:
+            return self.txDeltaPacket()
+
         if self.is_param_changed is True or not self.param:
             self.makeParam()
 
         return self.ph.syncWriteTxOnly(self.port, self.start_address, self.data_length, self.param,
                                        len(self.data_dict.keys()) * (1 + self.data_length))
+
+    def txDeltaPacket(self):
+        # a control table item only accepts whole writes, so every changed ID gets its full data
+        full_refresh = self.full_refresh_interval > 0 and self.tx_count % self.full_refresh_interval == 0
+        self.tx_count += 1
+
+        changed = [dxl_id for dxl_id, data in self.data_dict.items()
+                   if full_refresh or self.last_sent.get(dxl_id) != list(data)]
+
+        if not changed:
+            return COMM_SUCCESS
+
+        if len(changed) == len(self.data_dict):
+            if self.is_param_changed is True or not self.param:
+                self.makeParam()
+            result = self.ph.syncWriteTxOnly(self.port, self.start_address, self.data_length, self.param,
+                                             len(self.data_dict.keys()) * (1 + self.data_length))
+        else:
+            param = []
+            for dxl_id in changed:
+                param.append(dxl_id)
+                param.extend(self.data_dict[dxl_id])
+            result = self.ph.syncWriteTxOnly(self.port, self.start_address, self.data_length, param,
+                                             len(changed) * (1 + self.data_length))
+
+        if result == COMM_SUCCESS:
+            for dxl_id in changed:
+                self.last_sent[dxl_id] = list(self.data_dict[dxl_id])
+        else:
+            self.resetDelta()
+        return result
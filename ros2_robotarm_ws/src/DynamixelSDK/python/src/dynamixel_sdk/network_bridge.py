@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import ipaddress
+import select
+import socket
+import struct
+import threading
+import time
+
+from .port_handler import DEFAULT_BAUDRATE
+from .port_handler import PortHandler
+from .port_handler_network import DEFAULT_NETWORK_PORT
+from .port_handler_network import FRAME_CLEAR
+from .port_handler_network import FRAME_CONFIG
+from .port_handler_network import FRAME_DATA
+from .port_handler_network import FRAME_ECHO
+from .port_handler_network import MAX_FRAME_PAYLOAD
+from .port_handler_network import packFrame
+from .port_handler_network import unpackFrames
+
+# Status bytes are coalesced until the bus is quiet for this long, so a sync read
+# answered by several devices goes back to the client as a single frame
+DEFAULT_BATCH_WINDOW_US = 200
+# The bridge has no authentication, anyone who can connect controls the bus
+DEFAULT_BRIDGE_ADDRESS = '127.0.0.1'
+IDLE_POLL_INTERVAL = 0.1
+SERIAL_POLL_INTERVAL = 0.0005
+
+
+def isLoopbackAddress(address):
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(address)).is_loopback
+    except (socket.gaierror, ValueError):
+        return False
+
+
+class NetworkBridge:
+    def __init__(self, port_handler, address=DEFAULT_BRIDGE_ADDRESS, port=DEFAULT_NETWORK_PORT, protocol='tcp',
+                 batch_window_us=DEFAULT_BATCH_WINDOW_US, allow_remote=False):
+        if protocol not in ('tcp', 'udp'):
+            raise ValueError('protocol must be tcp or udp')
+        if not allow_remote and not isLoopbackAddress(address):
+            raise ValueError('%s is reachable from the network, set allow_remote to expose the bus' % address)
+
+        self.port_handler = port_handler
+        self.address = (address, port)
+        self.protocol = protocol
+        self.batch_window = batch_window_us / 1000000.0
+
+        self.server = None
+        self.client = None
+        self.client_address = None
+        self.stream_buffer = b''
+        self.rx_pending = bytearray()
+        self.last_rx_time = 0.0
+
+        self.is_running = False
+        self.thread = None
+
+    def open(self):
+        if self.protocol == 'tcp':
+            self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.server.bind(self.address)
+            self.server.listen(1)
+        else:
+            self.server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.server.bind(self.address)
+            self.server.setblocking(False)
+        return self.server.getsockname()
+
+    def start(self):
+        address = self.open()
+        self.is_running = True
+        self.thread = threading.Thread(target=self.serveForever, daemon=True)
+        self.thread.start()
+        return address
+
+    def stop(self):
+        self.is_running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.client is not None and self.client is not self.server:
+            self.client.close()
+        if self.server is not None:
+            self.server.close()
+        self.client = None
+        self.server = None
+
+    def serveForever(self):
+        if self.server is None:
+            self.open()
+        self.is_running = True
+
+        while self.is_running:
+            if self.client is None:
+                self.waitClient()
+                continue
+            self.pollOnce()
+
+    def waitClient(self):
+        if self.protocol == 'udp':
+            self.client = self.server
+            return
+
+        readable, _, _ = select.select([self.server], [], [], IDLE_POLL_INTERVAL)
+        if not readable:
+            return
+        self.client, self.client_address = self.server.accept()
+        self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.client.setblocking(False)
+        self.stream_buffer = b''
+        del self.rx_pending[:]
+
+    def pollOnce(self):
+        serial_fd = self.getSerialFileno()
+        watch = [self.client]
+        if serial_fd is not None:
+            watch.append(serial_fd)
+
+        if self.rx_pending:
+            timeout = max(0.0, self.last_rx_time + self.batch_window - time.perf_counter())
+        elif serial_fd is None:
+            timeout = SERIAL_POLL_INTERVAL
+        else:
+            timeout = IDLE_POLL_INTERVAL
+        readable, _, _ = select.select(watch, [], [], timeout)
+
+        if self.client in readable:
+            self.receiveFrames()
+            if self.client is None:
+                return
+
+        if self.port_handler.is_open:
+            available = self.port_handler.getBytesAvailable()
+            if available > 0:
+                self.rx_pending.extend(self.port_handler.readPort(available))
+                self.last_rx_time = time.perf_counter()
+
+        if self.rx_pending and (time.perf_counter() - self.last_rx_time >= self.batch_window
+                                or len(self.rx_pending) >= MAX_FRAME_PAYLOAD):
+            payload = bytes(self.rx_pending[:MAX_FRAME_PAYLOAD])
+            del self.rx_pending[:MAX_FRAME_PAYLOAD]
+            self.sendFrame(FRAME_DATA, payload)
+
+    def receiveFrames(self):
+        if self.protocol == 'udp':
+            while True:
+                try:
+                    datagram, self.client_address = self.server.recvfrom(65536)
+                except OSError:
+                    # BlockingIOError when drained, or an ICMP error of an earlier reply
+                    break
+                frames, _ = unpackFrames(datagram)
+                for frame_type, payload in frames:
+                    self.handleFrame(frame_type, payload)
+            return
+
+        try:
+            data = self.client.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''  # e.g. ConnectionResetError, the client is gone either way
+        if not data:
+            self.dropClient()
+            return
+
+        frames, self.stream_buffer = unpackFrames(self.stream_buffer + data)
+        for frame_type, payload in frames:
+            # An answer can fail and drop the client, the rest of the batch is for nobody
+            if self.client is None:
+                return
+            self.handleFrame(frame_type, payload)
+
+    def dropClient(self):
+        self.client.close()
+        self.client = None
+        self.client_address = None
+        self.stream_buffer = b''
+        del self.rx_pending[:]
+
+    def handleFrame(self, frame_type, payload):
+        if frame_type == FRAME_DATA:
+            self.port_handler.writePort(payload)
+        elif frame_type == FRAME_CONFIG:
+            baudrate = struct.unpack('<I', payload)[0]
+            if baudrate != self.port_handler.getBaudRate() or not self.port_handler.is_open:
+                self.port_handler.setBaudRate(baudrate)
+        elif frame_type == FRAME_CLEAR:
+            del self.rx_pending[:]
+            available = self.port_handler.getBytesAvailable()
+            if available > 0:
+                self.port_handler.readPort(available)
+            self.sendFrame(FRAME_CLEAR, payload)
+        elif frame_type == FRAME_ECHO:
+            self.sendFrame(FRAME_ECHO, payload)
+
+    def sendFrame(self, frame_type, payload=b''):
+        frame = packFrame(frame_type, payload)
+        if self.protocol == 'udp':
+            if self.client_address is not None:
+                self.server.sendto(frame, self.client_address)
+            return
+
+        if self.client is None:
+            return
+        self.client.setblocking(True)
+        try:
+            self.client.sendall(frame)
+        except OSError:
+            self.dropClient()
+            return
+        self.client.setblocking(False)
+
+    def getSerialFileno(self):
+        fd = getattr(self.port_handler, 'fd', None)
+        if fd is not None and fd >= 0:
+            return fd
+        ser = getattr(self.port_handler, 'ser', None)
+        if ser is not None:
+            return ser.fileno()
+        return None
+
+
+def _main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Expose a DYNAMIXEL serial bus over TCP or UDP.')
+    parser.add_argument('device')
+    parser.add_argument('--baudrate', type=int, default=DEFAULT_BAUDRATE)
+    parser.add_argument('--address', default=DEFAULT_BRIDGE_ADDRESS)
+    parser.add_argument('--allow-remote', action='store_true',
+                        help='allow an address other than loopback, the bridge has no authentication')
+    parser.add_argument('--port', type=int, default=DEFAULT_NETWORK_PORT)
+    parser.add_argument('--udp', action='store_true')
+    parser.add_argument('--batch-us', type=int, default=DEFAULT_BATCH_WINDOW_US)
+    args = parser.parse_args(argv)
+
+    port_handler = PortHandler(args.device)
+    if not port_handler.setBaudRate(args.baudrate):
+        raise SystemExit('Failed to open %s at %d bps' % (args.device, args.baudrate))
+
+    try:
+        bridge = NetworkBridge(port_handler, args.address, args.port, 'udp' if args.udp else 'tcp', args.batch_us,
+                               args.allow_remote)
+    except ValueError as e:
+        port_handler.closePort()
+        raise SystemExit(str(e))
+    print('Bridging %s to %s:%d (%s)' % ((args.device,) + bridge.open() + (bridge.protocol,)))
+    try:
+        bridge.serveForever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        port_handler.closePort()
+
+
+if __name__ == '__main__':
+    _main()
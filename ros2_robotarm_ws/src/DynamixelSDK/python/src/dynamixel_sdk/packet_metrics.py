@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import threading
+import time
+
+from .robotis_def import *
+from .packet_capture import INSTRUCTION_NAMES
+
+# Upper bounds (ms) of the latency histogram buckets, +Inf bucket is implicit
+LATENCY_BUCKETS_MS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+RESULT_NAMES = {
+    COMM_SUCCESS: 'success',
+    COMM_PORT_BUSY: 'port_busy',
+    COMM_TX_FAIL: 'tx_fail',
+    COMM_RX_FAIL: 'rx_fail',
+    COMM_TX_ERROR: 'tx_error',
+    COMM_RX_WAITING: 'rx_waiting',
+    COMM_RX_TIMEOUT: 'rx_timeout',
+    COMM_RX_CORRUPT: 'rx_corrupt',
+    COMM_NOT_AVAILABLE: 'not_available',
+}
+
+METRIC_PREFIX = 'dynamixel'
+
+
+class PacketMetrics:
+    def __init__(self, latency_buckets_ms=LATENCY_BUCKETS_MS):
+        self.latency_buckets_ms = tuple(latency_buckets_ms)
+        self.exporter = None
+        self.reset()
+
+    def reset(self):
+        self.start_time = time.monotonic()
+
+        self.instructions = {}  # (instruction, dxl_id) -> [count, tx_bytes]
+        self.statuses = {}  # dxl_id -> [count, rx_bytes, error_count]
+        self.results = {}  # result -> count
+        self.latency = {}  # instruction -> [bucket counts (+Inf last), sum_ms, count]
+        self.errors = {}  # (dxl_id, instruction) -> {error class: count}
+        self.resync_bytes = 0
+
+        # last instruction packet, failed receptions are counted against its ID
+        self.tx_instruction = None
+        self.tx_id = None
+
+        # instruction waiting for its first status, the latency of later ones is not measured
+        self.pending_instruction = None
+        self.pending_time = 0.0
+
+    def onTx(self, instruction, dxl_id, length):
+        key = (instruction, dxl_id)
+        entry = self.instructions.get(key)
+        if entry is None:
+            entry = self.instructions[key] = [0, 0]
+        entry[0] += 1
+        entry[1] += length
+
+        self.tx_instruction = instruction
+        self.tx_id = dxl_id
+        self.pending_instruction = instruction
+        self.pending_time = time.perf_counter()
+
+    def onResult(self, result):
+        self.results[result] = self.results.get(result, 0) + 1
+
+    def onRx(self, dxl_id, length, result, error):
+        self.results[result] = self.results.get(result, 0) + 1
+
+        if result == COMM_SUCCESS:
+            entry = self.statuses.get(dxl_id)
+            if entry is None:
+                entry = self.statuses[dxl_id] = [0, 0, 0]
+            entry[0] += 1
+            entry[1] += length
+            if error != 0:
+                entry[2] += 1
+                self.countError(dxl_id, 'status_error_0x%02X' % error)
+        else:
+            # without a status the ID is the one the instruction was sent to (broadcast for sync/bulk)
+            self.countError(self.tx_id if dxl_id is None else dxl_id, RESULT_NAMES.get(result, str(result)))
+
+        if self.pending_instruction is None:
+            return
+
+        elapsed_ms = (time.perf_counter() - self.pending_time) * 1000.0
+        histogram = self.latency.get(self.pending_instruction)
+        if histogram is None:
+            histogram = self.latency[self.pending_instruction] = [[0] * (len(self.latency_buckets_ms) + 1), 0.0, 0]
+
+        bucket = len(self.latency_buckets_ms)
+        for idx, bound in enumerate(self.latency_buckets_ms):
+            if elapsed_ms <= bound:
+                bucket = idx
+                break
+        histogram[0][bucket] += 1
+        histogram[1] += elapsed_ms
+        histogram[2] += 1
+
+        self.pending_instruction = None
+        self.pending_time = 0.0
+
+    def countError(self, dxl_id, error_class):
+        classes = self.errors.get((dxl_id, self.tx_instruction))
+        if classes is None:
+            classes = self.errors[(dxl_id, self.tx_instruction)] = {}
+        classes[error_class] = classes.get(error_class, 0) + 1
+
+    def onResync(self, length):
+        self.resync_bytes += length
+
+    def snapshot(self):
+        instructions = {}
+        for (instruction, dxl_id), (count, tx_bytes) in list(self.instructions.items()):
+            name = INSTRUCTION_NAMES.get(instruction, str(instruction))
+            instructions.setdefault(name, {})[dxl_id] = {'count': count, 'tx_bytes': tx_bytes}
+
+        statuses = {}
+        for dxl_id, (count, rx_bytes, errors) in list(self.statuses.items()):
+            statuses[dxl_id] = {'count': count, 'rx_bytes': rx_bytes, 'errors': errors}
+
+        latency = {}
+        for instruction, (buckets, sum_ms, count) in list(self.latency.items()):
+            name = INSTRUCTION_NAMES.get(instruction, str(instruction))
+            latency[name] = {
+                'buckets_ms': list(self.latency_buckets_ms),
+                'counts': list(buckets),
+                'sum_ms': sum_ms,
+                'count': count,
+            }
+
+        errors = {}
+        for (dxl_id, instruction), classes in list(self.errors.items()):
+            name = INSTRUCTION_NAMES.get(instruction, str(instruction))
+            errors.setdefault(name, {})[dxl_id] = dict(classes)
+
+        results = {}
+        for result, count in list(self.results.items()):
+            results[RESULT_NAMES.get(result, str(result))] = count
+
+        return {
+            'elapsed_sec': time.monotonic() - self.start_time,
+            'instructions': instructions,
+            'statuses': statuses,
+            'results': results,
+            'latency_ms': latency,
+            'errors': errors,
+            'resync_bytes': self.resync_bytes,
+        }
+
+    def toPrometheusText(self, prefix=METRIC_PREFIX):
+        snapshot = self.snapshot()
+        lines = []
+
+        instruction_samples = []
+        for name, per_id in sorted(snapshot['instructions'].items()):
+            for dxl_id, entry in sorted(per_id.items()):
+                instruction_samples.append(('{instruction="%s",id="%d"}' % (name, dxl_id), entry))
+        for metric, field in (('instructions_total', 'count'), ('tx_bytes_total', 'tx_bytes')):
+            lines.append('# TYPE %s_%s counter' % (prefix, metric))
+            for labels, entry in instruction_samples:
+                lines.append('%s_%s%s %d' % (prefix, metric, labels, entry[field]))
+
+        status_samples = sorted(snapshot['statuses'].items())
+        for metric, field in (('status_total', 'count'), ('rx_bytes_total', 'rx_bytes'),
+                              ('status_errors_total', 'errors')):
+            lines.append('# TYPE %s_%s counter' % (prefix, metric))
+            for dxl_id, entry in status_samples:
+                lines.append('%s_%s{id="%d"} %d' % (prefix, metric, dxl_id, entry[field]))
+
+        lines.append('# TYPE %s_results_total counter' % prefix)
+        for name, count in sorted(snapshot['results'].items()):
+            lines.append('%s_results_total{result="%s"} %d' % (prefix, name, count))
+
+        lines.append('# TYPE %s_errors_total counter' % prefix)
+        for name, per_id in sorted(snapshot['errors'].items()):
+            for dxl_id, classes in sorted(per_id.items(), key=lambda item: -1 if item[0] is None else item[0]):
+                for error_class, count in sorted(classes.items()):
+                    lines.append('%s_errors_total{instruction="%s",id="%s",class="%s"} %d' % (
+                        prefix, name, '' if dxl_id is None else dxl_id, error_class, count))
+
+        lines.append('# TYPE %s_resync_bytes_total counter' % prefix)
+        lines.append('%s_resync_bytes_total %d' % (prefix, snapshot['resync_bytes']))
+
+        lines.append('# TYPE %s_latency_ms histogram' % prefix)
+        for name, histogram in sorted(snapshot['latency_ms'].items()):
+            cumulative = 0
+            for bound, count in zip(histogram['buckets_ms'] + ['+Inf'], histogram['counts']):
+                cumulative += count
+                lines.append('%s_latency_ms_bucket{instruction="%s",le="%s"} %d' % (prefix, name, bound, cumulative))
+            lines.append('%s_latency_ms_sum{instruction="%s"} %f' % (prefix, name, histogram['sum_ms']))
+            lines.append('%s_latency_ms_count{instruction="%s"} %d' % (prefix, name, histogram['count']))
+
+        return '\n'.join(lines) + '\n'
+
+    def startExporter(self, port=9400, address='127.0.0.1'):
+        from http.server import BaseHTTPRequestHandler
+        from http.server import ThreadingHTTPServer
+
+        if self.exporter is not None:
+            return self.exporter.server_address
+
+        metrics = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.toPrometheusText().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.exporter = ThreadingHTTPServer((address, port), MetricsRequestHandler)
+        thread = threading.Thread(target=self.exporter.serve_forever, daemon=True)
+        thread.start()
+        return self.exporter.server_address
+
+    def stopExporter(self):
+        if self.exporter is None:
+            return
+        self.exporter.shutdown()
+        self.exporter.server_close()
+        self.exporter = None
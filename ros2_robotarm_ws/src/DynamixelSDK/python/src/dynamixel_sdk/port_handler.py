@@ -34,12 +34,20 @@ class PortHandler(object):
         self.baudrate = DEFAULT_BAUDRATE
         self.packet_start_time = 0.0
         self.packet_timeout = 0.0
+        self.packet_timeout_cap = None
         self.tx_time_per_byte = 0.0
 
         self.is_using = False
         self.port_name = port_name
         self.ser = None
 
+        # Instruction packet buffer of the packet handler, allocated on first use
+        self.tx_buffer = None
+        self.tx_view = None
+
+        self.capture = None
+        self.metrics = None
+
     def openPort(self):
         return self.setBaudRate(self.baudrate)
 
@@ -74,14 +82,32 @@ class PortHandler(object):
         return self.ser.in_waiting
 
     def readPort(self, length):
+        data = self.ser.read(length)
+        if self.capture is not None and data:
+            self.capture.recordRx(data)
+
         if (sys.version_info > (3, 0)):
-            return self.ser.read(length)
+            return data
         else:
-            return [ord(ch) for ch in self.ser.read(length)]
+            return [ord(ch) for ch in data]
 
     def writePort(self, packet):
+        if self.capture is not None:
+            self.capture.recordTx(packet)
         return self.ser.write(packet)
 
+    def setCapture(self, capture):
+        self.capture = capture
+
+    def getCapture(self):
+        return self.capture
+
+    def setMetrics(self, metrics):
+        self.metrics = metrics
+
+    def getMetrics(self):
+        return self.metrics
+
     def setPacketTimeout(self, packet_length):
         self.packet_start_time = self.getCurrentTime()
         self.packet_timeout = (self.tx_time_per_byte * packet_length) + (LATENCY_TIMER * 2.0) + 2.0
@@ -90,8 +116,19 @@ class PortHandler(object):
         self.packet_start_time = self.getCurrentTime()
         self.packet_timeout = msec
 
+    def setPacketTimeoutCap(self, msec):
+        # upper bound (ms) for any packet timeout, None to disable
+        self.packet_timeout_cap = msec
+
+    def getPacketTimeoutCap(self):
+        return self.packet_timeout_cap
+
     def isPacketTimeout(self):
-        if self.getTimeSinceStart() > self.packet_timeout:
+        packet_timeout = self.packet_timeout
+        if self.packet_timeout_cap is not None and self.packet_timeout_cap < packet_timeout:
+            packet_timeout = self.packet_timeout_cap
+
+        if self.getTimeSinceStart() > packet_timeout:
             self.packet_timeout = 0
             return True
 
@@ -42,6 +42,9 @@ ERRBIT_CHECKSUM = 16  # Instruction packet checksum is incorrect.
 ERRBIT_OVERLOAD = 32  # The current load cannot be controlled by the set torque.
 ERRBIT_INSTRUCTION = 64  # Undefined instruction or delivering the action command without the reg_write command.
 
+PACKET_HEADER = b'\xff\xff'
+STATUS_PACKET_OVERHEAD = 6  # HEADER0 HEADER1 ID LENGTH ERROR CHKSUM
+
 
 class Protocol1PacketHandler(object):
     def getProtocolVersion(self):
@@ -94,16 +97,19 @@ class Protocol1PacketHandler(object):
         return ""
 
     def txPacket(self, port, txpacket):
-        checksum = 0
         total_packet_length = txpacket[PKT_LENGTH] + 4  # 4: HEADER0 HEADER1 ID LENGTH
 
         if port.is_using:
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_PORT_BUSY)
             return COMM_PORT_BUSY
         port.is_using = True
 
         # check max packet length
         if total_packet_length > TXPACKET_MAX_LEN:
             port.is_using = False
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_TX_ERROR)
             return COMM_TX_ERROR
 
         # make packet header
@@ -111,27 +117,34 @@ class Protocol1PacketHandler(object):
         txpacket[PKT_HEADER1] = 0xFF
 
         # add a checksum to the packet
-        for idx in range(2, total_packet_length - 1):  # except header, checksum
-            checksum += txpacket[idx]
-
-        txpacket[total_packet_length - 1] = ~checksum & 0xFF
+        checksum = ~sum(txpacket[2:total_packet_length - 1]) & 0xFF  # except header, checksum
+        txpacket[total_packet_length - 1] = checksum
 
-        #print "[TxPacket] %r" % txpacket
+        # the packet goes out of a buffer preallocated on the port, so no bytes object is built per packet.
+        # The handler is shared between ports, the port buffer is only used while is_using is held.
+        if port.tx_buffer is None:
+            port.tx_buffer = bytearray(TXPACKET_MAX_LEN)
+            port.tx_view = memoryview(port.tx_buffer)
+        port.tx_buffer[0:total_packet_length] = txpacket[0:total_packet_length]
 
         # tx packet
         port.clearPort()
-        written_packet_length = port.writePort(txpacket)
+        written_packet_length = port.writePort(port.tx_view[:total_packet_length])
         if total_packet_length != written_packet_length:
             port.is_using = False
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_TX_FAIL)
             return COMM_TX_FAIL
 
+        if port.metrics is not None:
+            port.metrics.onTx(txpacket[PKT_INSTRUCTION], txpacket[PKT_ID], total_packet_length)
+
         return COMM_SUCCESS
 
     def rxPacket(self, port):
-        rxpacket = []
+        rxpacket = bytearray()
 
         result = COMM_TX_FAIL
-        checksum = 0
         rx_length = 0
         wait_length = 6  # minimum length (HEADER0 HEADER1 ID LENGTH ERROR CHKSUM)
 
@@ -140,9 +153,9 @@ class Protocol1PacketHandler(object):
             rx_length = len(rxpacket)
             if rx_length >= wait_length:
                 # find packet header
-                for idx in range(0, (rx_length - 1)):
-                    if (rxpacket[idx] == 0xFF) and (rxpacket[idx + 1] == 0xFF):
-                        break
+                idx = rxpacket.find(PACKET_HEADER)
+                if idx < 0:
+                    idx = rx_length - 1  # the last byte may still be the first half of a header
 
                 if idx == 0:  # found at the beginning of the packet
                     if (rxpacket[PKT_ID] > 0xFD) or (rxpacket[PKT_LENGTH] > RXPACKET_MAX_LEN) or (
@@ -151,6 +164,8 @@ class Protocol1PacketHandler(object):
                         # remove the first byte in the packet
                         del rxpacket[0]
                         rx_length -= 1
+                        if port.metrics is not None:
+                            port.metrics.onResync(1)
                         continue
 
                     # re-calculate the exact length of the rx packet
@@ -169,13 +184,8 @@ class Protocol1PacketHandler(object):
                         else:
                             continue
 
-                    # calculate checksum
-                    for i in range(2, wait_length - 1):  # except header, checksum
-                        checksum += rxpacket[i]
-                    checksum = ~checksum & 0xFF
-
                     # verify checksum
-                    if rxpacket[wait_length - 1] == checksum:
+                    if rxpacket[wait_length - 1] == ~sum(rxpacket[2:wait_length - 1]) & 0xFF:
                         result = COMM_SUCCESS
                     else:
                         result = COMM_RX_CORRUPT
@@ -185,6 +195,8 @@ class Protocol1PacketHandler(object):
                     # remove unnecessary packets
                     del rxpacket[0: idx]
                     rx_length -= idx
+                    if port.metrics is not None:
+                        port.metrics.onResync(idx)
 
             else:
                 # check timeout
@@ -197,7 +209,11 @@ class Protocol1PacketHandler(object):
 
         port.is_using = False
 
-        #print "[RxPacket] %r" % rxpacket
+        if port.metrics is not None:
+            if result == COMM_SUCCESS:
+                port.metrics.onRx(rxpacket[PKT_ID], rx_length, result, rxpacket[PKT_ERROR])
+            else:
+                port.metrics.onRx(None, rx_length, result, 0)
 
         return rxpacket, result
 
@@ -519,5 +535,75 @@ class Protocol1PacketHandler(object):
 
         return result
 
+    def bulkReadRx(self, port, param, param_length):
+        # Parses the status packets of every device in one pass over a single buffer,
+        # instead of one rxPacket per device
+        data_lengths = {}
+        wait_length = 0
+        for i in range(0, param_length, 3):
+            data_lengths[param[i + 1]] = param[i]
+            wait_length += param[i] + STATUS_PACKET_OVERHEAD
+
+        data_dict = {}
+        rxpacket = bytearray()
+        result = COMM_SUCCESS
+
+        while len(data_dict) < len(data_lengths):
+            if wait_length > len(rxpacket):
+                rxpacket.extend(port.readPort(wait_length - len(rxpacket)))
+
+            while len(rxpacket) >= STATUS_PACKET_OVERHEAD:
+                # find packet header
+                idx = rxpacket.find(PACKET_HEADER)
+                if idx != 0:
+                    idx = len(rxpacket) - 1 if idx < 0 else idx
+                    del rxpacket[0: idx]
+                    if port.metrics is not None:
+                        port.metrics.onResync(idx)
+                    continue
+
+                if (rxpacket[PKT_ID] > 0xFD) or (rxpacket[PKT_LENGTH] > RXPACKET_MAX_LEN) or (
+                        rxpacket[PKT_ERROR] > 0x7F):
+                    del rxpacket[0]
+                    if port.metrics is not None:
+                        port.metrics.onResync(1)
+                    continue
+
+                packet_length = rxpacket[PKT_LENGTH] + PKT_LENGTH + 1
+                if len(rxpacket) < packet_length:
+                    break
+
+                if rxpacket[packet_length - 1] != ~sum(rxpacket[2:packet_length - 1]) & 0xFF:
+                    result = COMM_RX_CORRUPT
+                    break
+
+                dxl_id = rxpacket[PKT_ID]
+                if dxl_id in data_lengths and dxl_id not in data_dict:
+                    data_length = data_lengths[dxl_id]
+                    data_dict[dxl_id] = rxpacket[PKT_PARAMETER0: PKT_PARAMETER0 + data_length], rxpacket[PKT_ERROR]
+                    wait_length -= data_length + STATUS_PACKET_OVERHEAD
+                if port.metrics is not None:
+                    port.metrics.onRx(dxl_id, packet_length, COMM_SUCCESS, rxpacket[PKT_ERROR])
+
+                del rxpacket[0: packet_length]
+
+            if result != COMM_SUCCESS or len(data_dict) == len(data_lengths):
+                break
+
+            # check timeout
+            if port.isPacketTimeout():
+                if len(rxpacket) == 0:
+                    result = COMM_RX_TIMEOUT
+                else:
+                    result = COMM_RX_CORRUPT
+                break
+
+        port.is_using = False
+
+        if port.metrics is not None and result != COMM_SUCCESS:
+            port.metrics.onRx(None, len(rxpacket), result, 0)
+
+        return data_dict, result
+
     def bulkWriteTxOnly(self, port, param, param_length):
         return COMM_NOT_AVAILABLE
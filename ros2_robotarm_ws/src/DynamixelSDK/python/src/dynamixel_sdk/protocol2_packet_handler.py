@@ -211,6 +211,8 @@ class Protocol2PacketHandler(object):
 
     def txPacket(self, port, txpacket):
         if port.is_using:
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_PORT_BUSY)
             return COMM_PORT_BUSY
         port.is_using = True
 
@@ -223,6 +225,8 @@ class Protocol2PacketHandler(object):
 
         if total_packet_length > TXPACKET_MAX_LEN:
             port.is_using = False
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_TX_ERROR)
             return COMM_TX_ERROR
 
         # make packet header
@@ -242,8 +246,13 @@ class Protocol2PacketHandler(object):
         written_packet_length = port.writePort(txpacket)
         if total_packet_length != written_packet_length:
             port.is_using = False
+            if port.metrics is not None:
+                port.metrics.onResult(COMM_TX_FAIL)
             return COMM_TX_FAIL
 
+        if port.metrics is not None:
+            port.metrics.onTx(txpacket[PKT_INSTRUCTION], txpacket[PKT_ID], total_packet_length)
+
         return COMM_SUCCESS
 
     def rxPacket(self, port, fast_option):
@@ -274,6 +283,8 @@ class Protocol2PacketHandler(object):
                         # remove the first byte in the packet
                         del rxpacket[0]
                         rx_length -= 1
+                        if port.metrics is not None:
+                            port.metrics.onResync(1)
                         continue
 
                     if wait_length != (DXL_MAKEWORD(rxpacket[PKT_LENGTH_L], rxpacket[PKT_LENGTH_H]) + PKT_LENGTH_H + 1):
@@ -304,6 +315,8 @@ class Protocol2PacketHandler(object):
                     # remove unnecessary packets
                     del rxpacket[0: idx]
                     rx_length -= idx
+                    if port.metrics is not None:
+                        port.metrics.onResync(idx)
 
             else:
                 if port.isPacketTimeout():
@@ -315,6 +328,12 @@ class Protocol2PacketHandler(object):
 
         port.is_using = False
 
+        if port.metrics is not None:
+            if result == COMM_SUCCESS:
+                port.metrics.onRx(rxpacket[PKT_ID], rx_length, result, rxpacket[PKT_ERROR])
+            else:
+                port.metrics.onRx(None, rx_length, result, 0)
+
         if result == COMM_SUCCESS and fast_option == False:
             rxpacket = self.removeStuffing(rxpacket)
 
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import random
+import time
+
+from .robotis_def import *
+
+DEFAULT_RETRIABLE_RESULTS = (COMM_RX_TIMEOUT, COMM_RX_CORRUPT, COMM_RX_FAIL, COMM_TX_FAIL)
+
+
+def getResult(value):
+    # picks the COMM_* code out of a packet handler return value:
+    # result, (result, error), (data, result) or (data, result, error)
+    if isinstance(value, int):
+        return value
+    if len(value) == 3:
+        return value[1]
+    if len(value) == 2 and isinstance(value[0], int):
+        return value[0]
+    return value[1]
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts=3, attempt_timeout_ms=None, deadline_ms=None,
+                 retriable_results=DEFAULT_RETRIABLE_RESULTS, jitter_ms=0.0):
+        self.max_attempts = max_attempts
+        self.attempt_timeout_ms = attempt_timeout_ms
+        self.deadline_ms = deadline_ms
+        self.retriable_results = set(retriable_results)
+        self.jitter_ms = jitter_ms
+        self.resetStats()
+
+    def resetStats(self):
+        self.stats = {
+            'transactions': 0,
+            'attempts': 0,
+            'retries': 0,
+            'failures': 0,
+            'deadline_exhausted': 0,
+            'results': {},
+        }
+
+    def getStats(self):
+        stats = dict(self.stats)
+        stats['results'] = dict(self.stats['results'])
+        return stats
+
+    def run(self, port, transaction, *args, deadline_ms=None):
+        # deadline_ms overrides the policy deadline, e.g. with what is left of the control cycle
+        if deadline_ms is None:
+            deadline_ms = self.deadline_ms
+        start = time.perf_counter()
+        deadline = None if deadline_ms is None else start + deadline_ms / 1000.0
+
+        self.stats['transactions'] += 1
+        previous_cap = port.getPacketTimeoutCap()
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                attempt_start = time.perf_counter()
+                port.setPacketTimeoutCap(self.getAttemptTimeout(attempt_start, deadline))
+
+                value = transaction(*args)
+                result = getResult(value)
+                self.stats['attempts'] += 1
+                self.stats['results'][result] = self.stats['results'].get(result, 0) + 1
+
+                if result == COMM_SUCCESS or result not in self.retriable_results:
+                    if result != COMM_SUCCESS:
+                        self.stats['failures'] += 1
+                    return value
+
+                if attempt >= self.max_attempts:
+                    self.stats['failures'] += 1
+                    return value
+
+                delay = random.uniform(0.0, self.jitter_ms) / 1000.0 if self.jitter_ms > 0 else 0.0
+                if deadline is not None:
+                    # give up if another attempt like the last one cannot finish in time
+                    attempt_time = time.perf_counter() - attempt_start
+                    if time.perf_counter() + delay + attempt_time > deadline:
+                        self.stats['failures'] += 1
+                        self.stats['deadline_exhausted'] += 1
+                        return value
+
+                if delay > 0.0:
+                    time.sleep(delay)
+                self.stats['retries'] += 1
+        finally:
+            port.setPacketTimeoutCap(previous_cap)
+
+    def getAttemptTimeout(self, now, deadline):
+        timeout = self.attempt_timeout_ms
+        if deadline is not None:
+            remaining = max(0.0, (deadline - now) * 1000.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
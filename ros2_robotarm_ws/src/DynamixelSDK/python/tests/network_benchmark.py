@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+#*******************************************************************************
+#***********************     Network Port Benchmark      ***********************
+#  Required Environment to run this example :
+#    - Linux (uses a pty pair and loopback sockets, no DYNAMIXEL needed)
+#  How to use the example :
+#    - Run the script. A thread on the pty master answers every ping with
+#      a Protocol 2.0 status packet for ID 1. The same pings are sent over
+#      the local serial port, then through a NetworkBridge over TCP and UDP,
+#      and the bridge echo round trip shows the latency the network adds.
+# *******************************************************************************
+
+import time
+
+from dynamixel_sdk import *                 # Uses Dynamixel SDK library
+from pty_device import PtyDevice, servePing
+
+PROTOCOL_VERSION            = 2.0
+BAUDRATE                    = 1000000
+DXL_ID                      = 1
+MODEL_NUMBER                = 1060          # XL430-W250
+ITERATIONS                  = 1000
+BRIDGE_PORT                 = 9000
+
+packetHandler = PacketHandler(PROTOCOL_VERSION)
+
+
+def benchmark(name, port_handler):
+    if not port_handler.openPort():
+        print("%-18s failed to open port" % name)
+        return
+
+    port_handler.setBaudRate(BAUDRATE)
+    samples = []
+    failures = 0
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        _, dxl_comm_result, _ = packetHandler.ping(port_handler, DXL_ID)
+        samples.append((time.perf_counter() - start) * 1000000.0)
+        if dxl_comm_result != COMM_SUCCESS:
+            failures += 1
+    port_handler.closePort()
+
+    samples.sort()
+    print("%-18s avg %8.1f us  p50 %8.1f us  p99 %8.1f us  failures %d" % (
+        name, sum(samples) / len(samples), samples[len(samples) // 2],
+        samples[int(len(samples) * 0.99)], failures))
+
+
+def benchmarkNetwork(name, slave_name, protocol, port_handler_class):
+    bridge = NetworkBridge(PortHandler(slave_name), '127.0.0.1', BRIDGE_PORT, protocol)
+    bridge.start()
+
+    port_handler = port_handler_class('127.0.0.1:%d' % BRIDGE_PORT)
+    benchmark(name, port_handler)
+
+    port_handler.openPort()
+    port_handler.setBaudRate(BAUDRATE)
+    echo = port_handler.measureRoundTrip(ITERATIONS)
+    port_handler.closePort()
+    print("%-18s avg %8.1f us  p99 %8.1f us  lost %d" % (
+        name + " echo", echo['avg_ms'] * 1000.0, echo['p99_ms'] * 1000.0, echo['lost']))
+
+    bridge.stop()
+    bridge.port_handler.closePort()
+
+
+def main():
+    device = PtyDevice(servePing, DXL_ID, MODEL_NUMBER)
+    slave_name = device.port_name
+
+    print("Simulated device on %s, %d pings per transport" % (slave_name, ITERATIONS))
+    benchmark("Serial", PortHandler(slave_name))
+    benchmarkNetwork("TCP", slave_name, 'tcp', PortHandlerTCP)
+    benchmarkNetwork("UDP", slave_name, 'udp', PortHandlerUDP)
+
+    device.close()
+
+
+if __name__ == '__main__':
+    main()
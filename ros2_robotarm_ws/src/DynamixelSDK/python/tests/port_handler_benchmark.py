@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+#*******************************************************************************
+#***********************     Port Handler Benchmark      ***********************
+#  Required Environment to run this example :
+#    - Linux (uses a pty pair, no DYNAMIXEL needed)
+#  How to use the example :
+#    - Run the script. A thread on the pty master answers every ping with
+#      a Protocol 2.0 status packet for ID 1, and the round trip of
+#      PortHandler (pyserial) and PortHandlerLinux (raw fd) is compared.
+# *******************************************************************************
+
+import time
+
+from dynamixel_sdk import *                 # Uses Dynamixel SDK library
+from pty_device import PtyDevice, servePing
+
+PROTOCOL_VERSION            = 2.0
+BAUDRATE                    = 1000000
+DXL_ID                      = 1
+MODEL_NUMBER                = 1060          # XL430-W250
+ITERATIONS                  = 2000
+
+packetHandler = PacketHandler(PROTOCOL_VERSION)
+
+
+def benchmark(name, port_handler):
+    if not port_handler.openPort():
+        print("%-22s failed to open port" % name)
+        return
+
+    port_handler.setBaudRate(BAUDRATE)
+    samples = []
+    failures = 0
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        _, dxl_comm_result, _ = packetHandler.ping(port_handler, DXL_ID)
+        samples.append((time.perf_counter() - start) * 1000000.0)
+        if dxl_comm_result != COMM_SUCCESS:
+            failures += 1
+    port_handler.closePort()
+
+    samples.sort()
+    print("%-22s avg %8.1f us  p50 %8.1f us  p99 %8.1f us  failures %d" % (
+        name, sum(samples) / len(samples), samples[len(samples) // 2],
+        samples[int(len(samples) * 0.99)], failures))
+
+
+def main():
+    device = PtyDevice(servePing, DXL_ID, MODEL_NUMBER)
+    slave_name = device.port_name
+
+    print("Simulated device on %s, %d pings per transport" % (slave_name, ITERATIONS))
+    benchmark("PortHandler", PortHandler(slave_name))
+    benchmark("PortHandlerLinux", PortHandlerLinux(slave_name))
+
+    device.close()
+
+
+if __name__ == '__main__':
+    main()
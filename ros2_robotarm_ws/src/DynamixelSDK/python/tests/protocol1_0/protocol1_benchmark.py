@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+#*******************************************************************************
+#*********************     Protocol 1.0 Benchmark      *************************
+#  Required Environment to run this example :
+#    - Linux (uses a pty pair, no DYNAMIXEL needed)
+#  How to use the example :
+#    - Run the script. A thread on the pty master simulates MX-28 devices on
+#      Protocol 1.0 and answers read and bulk read instructions, and the
+#      round trip of a single read, a bulk read and a sync write is measured.
+# *******************************************************************************
+
+import os
+import sys
+import time
+
+from dynamixel_sdk import *                 # Uses Dynamixel SDK library
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pty_device import PtyDevice, serveProtocol1
+
+PROTOCOL_VERSION            = 1.0
+BAUDRATE                    = 1000000
+DXL_IDS                     = [1, 2, 3, 4]
+ITERATIONS                  = 2000
+
+ADDR_MX_GOAL_POSITION       = 30
+ADDR_MX_PRESENT_POSITION    = 36
+LEN_MX_POSITION             = 2
+LEN_MX_PRESENT_STATE        = 8             # Present Position .. Present Temperature
+
+packetHandler = PacketHandler(PROTOCOL_VERSION)
+
+
+def benchmark(name, transaction):
+    samples = []
+    failures = 0
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        dxl_comm_result = transaction()
+        samples.append((time.perf_counter() - start) * 1000000.0)
+        if dxl_comm_result != COMM_SUCCESS:
+            failures += 1
+
+    samples.sort()
+    print("%-26s avg %8.1f us  p50 %8.1f us  p99 %8.1f us  failures %d" % (
+        name, sum(samples) / len(samples), samples[len(samples) // 2],
+        samples[int(len(samples) * 0.99)], failures))
+
+
+def main():
+    device = PtyDevice(serveProtocol1, DXL_IDS)
+    slave_name = device.port_name
+
+    portHandler = PortHandler(slave_name)
+    if not portHandler.openPort() or not portHandler.setBaudRate(BAUDRATE):
+        print("Failed to open the port")
+        return
+
+    groupBulkRead = GroupBulkRead(portHandler, packetHandler)
+    for dxl_id in DXL_IDS:
+        groupBulkRead.addParam(dxl_id, ADDR_MX_PRESENT_POSITION, LEN_MX_PRESENT_STATE)
+
+    groupSyncWrite = GroupSyncWrite(portHandler, packetHandler, ADDR_MX_GOAL_POSITION, LEN_MX_POSITION)
+    for dxl_id in DXL_IDS:
+        groupSyncWrite.addParam(dxl_id, [DXL_LOBYTE(512), DXL_HIBYTE(512)])
+
+    print("Simulated %d devices on %s, %d transactions each" % (len(DXL_IDS), slave_name, ITERATIONS))
+    benchmark("read2ByteTxRx", lambda: packetHandler.read2ByteTxRx(portHandler, DXL_IDS[0], ADDR_MX_PRESENT_POSITION)[1])
+    benchmark("GroupBulkRead (%d IDs)" % len(DXL_IDS), groupBulkRead.txRxPacket)
+    benchmark("GroupSyncWrite (%d IDs)" % len(DXL_IDS), groupSyncWrite.txPacket)
+
+    portHandler.closePort()
+    device.close()
+
+
+if __name__ == '__main__':
+    main()
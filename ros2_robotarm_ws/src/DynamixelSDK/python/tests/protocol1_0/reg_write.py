@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+#
+# *********     Reg Write / Action Example      *********
+#
+#
+# Available Dynamixel model on this example : All models using Protocol 1.0
+# This example is tested with two Dynamixel MX-28, and an USB2DYNAMIXEL
+# Be sure that Dynamixel MX properties are already set as %% ID : 1, 2 / Baudnum : 34 (Baudrate : 57600)
+#
+# Sends the same goal positions once as sequential writes and once staged with
+# REG_WRITE and applied by a broadcast ACTION, and prints the start skew of each.
+#
+
+from dynamixel_sdk import *                    # Uses Dynamixel SDK library
+import time
+
+# Control table address
+ADDR_MX_TORQUE_ENABLE      = 24
+ADDR_MX_GOAL_POSITION      = 30
+
+# Data Byte Length
+LEN_MX_GOAL_POSITION       = 2
+
+# Protocol version
+PROTOCOL_VERSION            = 1.0
+
+# Default setting
+DXL_IDS                     = [1, 2]
+BAUDRATE                    = 57600
+DEVICENAME                  = '/dev/ttyUSB0'
+
+TORQUE_ENABLE               = 1
+TORQUE_DISABLE              = 0
+DXL_GOAL_POSITIONS          = [100, 1000]
+ITERATIONS                  = 20
+
+portHandler = PortHandler(DEVICENAME)
+packetHandler = PacketHandler(PROTOCOL_VERSION)
+groupRegWrite = GroupRegWrite(portHandler, packetHandler)
+
+if not portHandler.openPort() or not portHandler.setBaudRate(BAUDRATE):
+    print("Failed to open the port")
+    quit()
+
+for dxl_id in DXL_IDS:
+    dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(portHandler, dxl_id, ADDR_MX_TORQUE_ENABLE, TORQUE_ENABLE)
+    if dxl_comm_result != COMM_SUCCESS:
+        print("%s" % packetHandler.getTxRxResult(dxl_comm_result))
+    elif dxl_error != 0:
+        print("%s" % packetHandler.getRxPacketError(dxl_error))
+
+sequential_skew = []
+action_time = []
+for iteration in range(ITERATIONS):
+    goal = DXL_GOAL_POSITIONS[iteration % 2]
+
+    # Sequential writes: each device starts moving as soon as its own packet arrives
+    for dxl_id in DXL_IDS:
+        packetHandler.write2ByteTxRx(portHandler, dxl_id, ADDR_MX_GOAL_POSITION, goal)
+        if dxl_id == DXL_IDS[0]:
+            first = time.perf_counter()
+    sequential_skew.append((time.perf_counter() - first) * 1000.0)
+    time.sleep(1.0)
+
+    # Staged writes: every device starts on the same ACTION packet
+    goal = DXL_GOAL_POSITIONS[(iteration + 1) % 2]
+    param_goal_position = [DXL_LOBYTE(goal), DXL_HIBYTE(goal)]
+    groupRegWrite.clearParam()
+    for dxl_id in DXL_IDS:
+        groupRegWrite.addParam(dxl_id, ADDR_MX_GOAL_POSITION, LEN_MX_GOAL_POSITION, param_goal_position)
+    dxl_comm_result = groupRegWrite.txPacket()
+    if dxl_comm_result != COMM_SUCCESS:
+        print("%s" % packetHandler.getTxRxResult(dxl_comm_result))
+    action_time.append(groupRegWrite.getTiming()['action_ms'])
+    time.sleep(1.0)
+
+print("Sequential write start skew : avg %.3f ms  max %.3f ms" % (sum(sequential_skew) / ITERATIONS, max(sequential_skew)))
+print("REG_WRITE + ACTION         : all devices start on one ACTION packet, sent in avg %.3f ms" % (sum(action_time) / ITERATIONS))
+
+for dxl_id in DXL_IDS:
+    packetHandler.write1ByteTxRx(portHandler, dxl_id, ADDR_MX_TORQUE_ENABLE, TORQUE_DISABLE)
+
+# Close port
+portHandler.closePort()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+# Simulated DYNAMIXEL devices on a pty pair, shared by the benchmark scripts.
+# PtyDevice opens the pair and runs a serve function on the master end in a
+# thread; the slave name is opened with any PortHandler like a real port.
+
+import os
+import threading
+import tty
+
+from dynamixel_sdk import *                 # Uses Dynamixel SDK library
+
+packetHandler2 = PacketHandler(2.0)
+
+
+class PtyDevice:
+    def __init__(self, serve, *args):
+        self.master_fd, self.slave_fd = os.openpty()
+        self.port_name = os.ttyname(self.slave_fd)
+        tty.setraw(self.slave_fd)
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=serve, args=(self.master_fd, self.stop_event) + args, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.stop_event.set()
+        os.close(self.slave_fd)
+        os.close(self.master_fd)
+
+
+def makePingStatus(dxl_id, model_number):
+    status = [0xFF, 0xFF, 0xFD, 0x00, dxl_id, 7, 0, 0x55, 0,
+              DXL_LOBYTE(model_number), DXL_HIBYTE(model_number), 46, 0, 0]
+    crc = packetHandler2.updateCRC(0, status, len(status) - 2)
+    status[-2] = DXL_LOBYTE(crc)
+    status[-1] = DXL_HIBYTE(crc)
+    return bytes(status)
+
+
+def servePing(master_fd, stop_event, dxl_id, model_number):
+    # answers every Protocol 2.0 ping with the status packet of one device
+    status = makePingStatus(dxl_id, model_number)
+    buffer = b''
+    while not stop_event.is_set():
+        try:
+            buffer += os.read(master_fd, 64)
+        except OSError:
+            break
+        # a ping instruction is 10 bytes long
+        while len(buffer) >= 10:
+            buffer = buffer[10:]
+            os.write(master_fd, status)
+
+
+def makeProtocol1Status(dxl_id, data):
+    status = [0xFF, 0xFF, dxl_id, len(data) + 2, 0] + list(data)
+    status.append(~sum(status[2:]) & 0xFF)
+    return bytes(status)
+
+
+def serveProtocol1(master_fd, stop_event, dxl_ids):
+    # answers Protocol 1.0 read and bulk read and applies sync write for each ID in dxl_ids
+    memory = {dxl_id: bytearray(range(dxl_id, dxl_id + 74)) for dxl_id in dxl_ids}
+    buffer = b''
+    while not stop_event.is_set():
+        try:
+            buffer += os.read(master_fd, 256)
+        except OSError:
+            break
+        while len(buffer) >= 4 and len(buffer) >= buffer[3] + 4:
+            packet = buffer[:buffer[3] + 4]
+            buffer = buffer[buffer[3] + 4:]
+            dxl_id, instruction, param = packet[2], packet[4], packet[5:-1]
+            if instruction == INST_READ:
+                os.write(master_fd, makeProtocol1Status(dxl_id, memory[dxl_id][param[0]:param[0] + param[1]]))
+            elif instruction == INST_BULK_READ:
+                response = b''
+                for i in range(1, len(param), 3):
+                    length, dxl_id, address = param[i:i + 3]
+                    response += makeProtocol1Status(dxl_id, memory[dxl_id][address:address + length])
+                os.write(master_fd, response)
+            elif instruction == INST_SYNC_WRITE:
+                for i in range(2, len(param), param[1] + 1):
+                    memory[param[i]][param[0]:param[0] + param[1]] = param[i + 1:i + 1 + param[1]]
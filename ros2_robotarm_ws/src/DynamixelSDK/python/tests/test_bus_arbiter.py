@@ -0,0 +1,114 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import time
+
+import pytest
+
+from dynamixel_sdk import BusArbiter
+from dynamixel_sdk import COMM_PORT_BUSY
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import PRIORITY_BACKGROUND
+from dynamixel_sdk import PRIORITY_CONTROL
+from dynamixel_sdk import PRIORITY_NORMAL
+
+
+def waitQueued(arbiter, count, timeout=2.0):
+    end = time.monotonic() + timeout
+    while arbiter.getStats()['queued'] < count:
+        assert time.monotonic() < end, 'waiters did not queue'
+        time.sleep(0.001)
+
+
+def test_release_without_acquire_raises():
+    arbiter = BusArbiter(None)
+    with pytest.raises(RuntimeError):
+        arbiter.release()
+
+    assert arbiter.acquire()
+    arbiter.release()
+    with pytest.raises(RuntimeError):
+        arbiter.release()
+
+
+def test_waiters_are_granted_by_priority_then_deadline():
+    arbiter = BusArbiter(None)
+    order = []
+
+    def worker(label, priority, deadline_ms):
+        assert arbiter.acquire(priority, deadline_ms)
+        order.append(label)
+        arbiter.release()
+
+    assert arbiter.acquire(PRIORITY_CONTROL)
+    threads = []
+    for label, priority, deadline_ms in [('background', PRIORITY_BACKGROUND, None),
+                                         ('normal', PRIORITY_NORMAL, None),
+                                         ('control late', PRIORITY_CONTROL, 5000.0),
+                                         ('control early', PRIORITY_CONTROL, 2000.0)]:
+        threads.append(threading.Thread(target=worker, args=(label, priority, deadline_ms)))
+        threads[-1].start()
+        waitQueued(arbiter, len(threads))
+    arbiter.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == ['control early', 'control late', 'normal', 'background']
+    stats = arbiter.getStats()
+    assert stats['control']['granted'] == 3
+    assert stats['normal']['bypassed'] == 2
+    assert stats['background']['bypassed'] == 3
+    assert stats['queued'] == 0
+
+
+def test_acquire_gives_up_at_its_deadline():
+    arbiter = BusArbiter(None)
+    assert arbiter.acquire(PRIORITY_CONTROL)
+
+    start = time.perf_counter()
+    assert not arbiter.acquire(PRIORITY_NORMAL, deadline_ms=20.0)
+    assert time.perf_counter() - start >= 0.015
+    arbiter.release()
+
+    stats = arbiter.getStats()
+    assert stats['normal']['deadline_missed'] == 1
+    assert stats['queued'] == 0
+
+
+def test_execute_runs_the_transaction_on_the_bus():
+    arbiter = BusArbiter(None)
+    assert arbiter.execute(lambda a, b: (a + b, COMM_SUCCESS, 0), 1, 2) == (COMM_SUCCESS, (3, COMM_SUCCESS, 0))
+
+    def fail():
+        raise ValueError('port closed')
+    with pytest.raises(ValueError):
+        arbiter.execute(fail)
+    # the bus is released after a failing transaction
+    assert arbiter.acquire(deadline_ms=0.0)
+    # and reports busy while someone else holds it
+    assert arbiter.execute(lambda: None, deadline_ms=10.0) == (COMM_PORT_BUSY, None)
+    arbiter.release()
+
+
+def test_hold_releases_only_what_it_was_granted():
+    arbiter = BusArbiter(None)
+    with arbiter.hold(PRIORITY_CONTROL) as granted:
+        assert granted and arbiter.is_busy
+        with arbiter.hold(PRIORITY_NORMAL, deadline_ms=10.0) as nested:
+            assert not nested
+        assert arbiter.is_busy
+    assert not arbiter.is_busy
+    assert arbiter.getStats()['control']['granted'] == 1
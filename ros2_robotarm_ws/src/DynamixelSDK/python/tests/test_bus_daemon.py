@@ -0,0 +1,110 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import stat
+import struct
+import subprocess
+import sys
+import time
+import uuid
+
+import pytest
+
+from dynamixel_sdk import BusClient
+from dynamixel_sdk import BusDaemon
+from dynamixel_sdk import COMM_RX_TIMEOUT
+from dynamixel_sdk import getSocketDirectory
+from dynamixel_sdk import getStateSize
+from dynamixel_sdk import PacketHandler
+from dynamixel_sdk import STATE_HEADER
+from dynamixel_sdk.bus_daemon import shared_memory
+
+
+def makeDaemon(name, socket_dir):
+    # opening a daemon does not touch the bus, so no port is needed
+    return BusDaemon(None, PacketHandler(2.0), [1, 2], 132, 4, name=name, socket_dir=str(socket_dir))
+
+
+@pytest.fixture
+def bus_name():
+    return 'dxl_test_%s' % uuid.uuid4().hex[:8]
+
+
+def test_second_daemon_refuses_a_running_bus(tmp_path, bus_name):
+    owner = makeDaemon(bus_name, tmp_path)
+    owner.open()
+    try:
+        with pytest.raises(RuntimeError):
+            makeDaemon(bus_name, tmp_path).open()
+        # with another socket directory, the owner pid in the state block still answers
+        other_dir = tmp_path / 'other'
+        other_dir.mkdir()
+        with pytest.raises(RuntimeError):
+            makeDaemon(bus_name, other_dir).open()
+
+        assert os.path.exists(owner.socket_path)
+        client = BusClient(bus_name, socket_dir=str(tmp_path))
+        assert client.device_count == 2
+        client.close()
+    finally:
+        owner.close()
+
+
+def test_leftovers_of_a_dead_daemon_are_replaced(tmp_path, bus_name):
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait()
+    stale = shared_memory.SharedMemory(bus_name, create=True, size=getStateSize(2, 4))
+    STATE_HEADER.pack_into(stale.buf, 0, 0, 0, 0.0, 0, 2, 4, dead.pid)
+    stale.close()
+    (tmp_path / ('%s.sock' % bus_name)).write_text('')
+
+    daemon = makeDaemon(bus_name, tmp_path)
+    try:
+        daemon.open()
+        assert STATE_HEADER.unpack_from(daemon.shm.buf, 0)[6] == os.getpid()
+    finally:
+        daemon.close()
+
+
+def test_read_state_gives_up_on_an_unfinished_publish(tmp_path, bus_name):
+    daemon = makeDaemon(bus_name, tmp_path)
+    daemon.open()
+    try:
+        client = BusClient(bus_name, timeout=0.05, socket_dir=str(tmp_path))
+        # the daemon died in the middle of a publish
+        struct.pack_into('<Q', daemon.shm.buf, 0, 1)
+
+        start = time.perf_counter()
+        _, _, result, state = client.readState()
+        assert result == COMM_RX_TIMEOUT
+        assert state == {1: None, 2: None}
+        assert time.perf_counter() - start < 1.0
+        client.close()
+    finally:
+        daemon.close()
+
+
+def test_socket_directory_is_private_without_runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    monkeypatch.setattr('tempfile.tempdir', str(tmp_path))
+
+    socket_dir = getSocketDirectory()
+    assert os.path.dirname(socket_dir) == str(tmp_path)
+    assert stat.S_IMODE(os.stat(socket_dir).st_mode) == 0o700
+
+    os.chmod(socket_dir, 0o755)
+    with pytest.raises(RuntimeError):
+        getSocketDirectory()
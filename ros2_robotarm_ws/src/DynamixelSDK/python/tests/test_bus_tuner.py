@@ -0,0 +1,107 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from dynamixel_easy_sdk import BusTuner
+from dynamixel_easy_sdk import ControlTable
+from dynamixel_easy_sdk import DxlRuntimeError
+
+MODEL_XL430 = 1060
+MODEL_XL320 = 350
+MODEL_H42 = 51201  # PRO, its baud rate encoding is not known to the tuner
+
+
+class FakePortHandler:
+
+    def getCFlagBaud(self, baud_rate):
+        return baud_rate
+
+
+class FakeConnector:
+    # Bus with devices that switch speed on a baud rate write, a lost status is a DxlRuntimeError
+
+    def __init__(self, models, baud_rate=57600, lost_status=()):
+        self._port_handler = FakePortHandler()
+        self._packet_handler = None
+        self.models = dict(models)
+        self.baud_rate = baud_rate
+        self.device_baud_rates = {motor_id: baud_rate for motor_id in models}
+        self.lost_status = set(lost_status)
+        self.writes = []
+
+    def getBaudRate(self):
+        return self.baud_rate
+
+    def setBaudRate(self, baud_rate):
+        self.baud_rate = baud_rate
+
+    def reachable(self, motor_id):
+        return self.device_baud_rates.get(motor_id) == self.baud_rate
+
+    def ping(self, motor_id):
+        return self.models[motor_id]
+
+    def broadcastPing(self):
+        return [motor_id for motor_id in self.models if self.reachable(motor_id)]
+
+    def read1ByteData(self, motor_id, address):
+        return 0
+
+    def write1ByteData(self, motor_id, address, value):
+        if not self.reachable(motor_id):
+            raise DxlRuntimeError('timeout')
+        self.writes.append((motor_id, address, value))
+        if address == ControlTable.getControlTable(self.models[motor_id])['Baud Rate'].address:
+            codes = {0: 9600, 1: 57600, 2: 115200, 3: 1000000, 4: 2000000}
+            self.device_baud_rates[motor_id] = codes[value]
+            if motor_id in self.lost_status:
+                raise DxlRuntimeError('status lost')
+
+
+def test_change_baud_rate_switches_every_device():
+    connector = FakeConnector({1: MODEL_XL430, 2: MODEL_XL320})
+    BusTuner(connector).changeBaudRate([1, 2], 1000000)
+
+    assert connector.getBaudRate() == 1000000
+    assert connector.device_baud_rates == {1: 1000000, 2: 1000000}
+
+
+def test_candidates_are_limited_by_model():
+    tuner = BusTuner(FakeConnector({1: MODEL_XL430, 2: MODEL_XL320}))
+
+    assert tuner.getCandidateBaudRates([1]) == [9600, 57600, 115200, 1000000, 2000000,
+                                                3000000, 4000000, 4500000]
+    assert tuner.getCandidateBaudRates([1, 2]) == [9600, 57600, 115200, 1000000]
+    with pytest.raises(DxlRuntimeError):
+        BusTuner(FakeConnector({1: MODEL_XL320})).changeBaudRate([1], 2000000)
+
+
+def test_unknown_encoding_is_never_written():
+    connector = FakeConnector({1: MODEL_XL430, 2: MODEL_H42})
+    with pytest.raises(DxlRuntimeError):
+        BusTuner(connector).changeBaudRate([1, 2], 1000000)
+
+    assert connector.writes == []
+
+
+def test_rollback_includes_device_whose_write_failed():
+    # ID 2 switched, but its status packet was lost
+    connector = FakeConnector({1: MODEL_XL430, 2: MODEL_XL430, 3: MODEL_XL430}, lost_status=[2])
+    with pytest.raises(DxlRuntimeError):
+        BusTuner(connector).changeBaudRate([1, 2, 3], 1000000)
+
+    assert connector.getBaudRate() == 57600
+    assert connector.device_baud_rates == {1: 57600, 2: 57600, 3: 57600}
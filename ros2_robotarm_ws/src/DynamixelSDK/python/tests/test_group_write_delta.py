@@ -0,0 +1,93 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import DXL_HIBYTE
+from dynamixel_sdk import DXL_HIWORD
+from dynamixel_sdk import DXL_LOBYTE
+from dynamixel_sdk import DXL_LOWORD
+from dynamixel_sdk import GroupBulkWrite
+from dynamixel_sdk import GroupSyncWrite
+
+ADDR_GOAL_POSITION = 116
+LEN_GOAL_POSITION = 4
+
+
+class RecordingPacketHandler:
+    def __init__(self, protocol_version=2.0):
+        self.protocol_version = protocol_version
+        self.sync_writes = []
+        self.bulk_writes = []
+
+    def getProtocolVersion(self):
+        return self.protocol_version
+
+    def syncWriteTxOnly(self, port, start_address, data_length, param, param_length):
+        assert len(param) == param_length
+        self.sync_writes.append((start_address, data_length, list(param)))
+        return COMM_SUCCESS
+
+    def bulkWriteTxOnly(self, port, param, param_length):
+        assert len(param) == param_length
+        self.bulk_writes.append(list(param))
+        return COMM_SUCCESS
+
+
+def goal(position):
+    return [DXL_LOBYTE(DXL_LOWORD(position)), DXL_HIBYTE(DXL_LOWORD(position)),
+            DXL_LOBYTE(DXL_HIWORD(position)), DXL_HIBYTE(DXL_HIWORD(position))]
+
+
+def test_sync_write_sends_whole_goal_after_one_lsb_change():
+    ph = RecordingPacketHandler()
+    group = GroupSyncWrite(None, ph, ADDR_GOAL_POSITION, LEN_GOAL_POSITION)
+    group.setDeltaMode(True)
+    group.addParam(1, goal(2048))
+    group.addParam(2, goal(1024))
+    assert group.txPacket() == COMM_SUCCESS
+
+    group.changeParam(1, goal(2049))
+    assert group.txPacket() == COMM_SUCCESS
+
+    assert ph.sync_writes[-1] == (ADDR_GOAL_POSITION, LEN_GOAL_POSITION, [1] + goal(2049))
+    assert not ph.bulk_writes
+
+
+def test_sync_write_skips_unchanged_and_refreshes():
+    ph = RecordingPacketHandler()
+    group = GroupSyncWrite(None, ph, ADDR_GOAL_POSITION, LEN_GOAL_POSITION)
+    group.setDeltaMode(True, full_refresh_interval=3)
+    group.addParam(1, goal(2048))
+
+    for _ in range(3):
+        group.txPacket()
+    # the first call and the refresh on the fourth call are sent
+    group.txPacket()
+    assert len(ph.sync_writes) == 2
+    assert all(write[2] == [1] + goal(2048) for write in ph.sync_writes)
+
+
+def test_bulk_write_sends_whole_entry_after_one_lsb_change():
+    ph = RecordingPacketHandler()
+    group = GroupBulkWrite(None, ph)
+    group.setDeltaMode(True)
+    group.addParam(1, ADDR_GOAL_POSITION, LEN_GOAL_POSITION, goal(2048))
+    group.addParam(2, 104, 4, goal(100))
+    group.txPacket()
+
+    group.changeParam(1, ADDR_GOAL_POSITION, LEN_GOAL_POSITION, goal(2049))
+    group.txPacket()
+
+    assert ph.bulk_writes[-1] == [1, DXL_LOBYTE(ADDR_GOAL_POSITION), DXL_HIBYTE(ADDR_GOAL_POSITION),
+                                  LEN_GOAL_POSITION, 0] + goal(2049)
@@ -0,0 +1,105 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import socket
+import struct
+import time
+
+from dynamixel_sdk import FRAME_CLEAR
+from dynamixel_sdk import FRAME_DATA
+from dynamixel_sdk import FRAME_ECHO
+from dynamixel_sdk import NetworkBridge
+from dynamixel_sdk import packFrame
+from dynamixel_sdk import unpackFrames
+
+
+class LoopbackPortHandler:
+    # Serial port whose device answers every write with the same bytes
+
+    def __init__(self):
+        self.is_open = True
+        self.baudrate = 57600
+        self.rx_buffer = bytearray()
+
+    def getBaudRate(self):
+        return self.baudrate
+
+    def setBaudRate(self, baudrate):
+        self.baudrate = baudrate
+        return True
+
+    def getBytesAvailable(self):
+        return len(self.rx_buffer)
+
+    def readPort(self, length):
+        data = bytes(self.rx_buffer[:length])
+        del self.rx_buffer[:length]
+        return data
+
+    def writePort(self, packet):
+        self.rx_buffer.extend(packet)
+        return len(packet)
+
+
+def receiveFrame(client, timeout=2.0):
+    client.settimeout(timeout)
+    buffer = b''
+    while True:
+        data = client.recv(65536)
+        assert data, 'bridge closed the connection'
+        frames, buffer = unpackFrames(buffer + data)
+        if frames:
+            return frames[0]
+
+
+def test_client_dropped_while_answering_a_batch():
+    bridge = NetworkBridge(LoopbackPortHandler(), port=0)
+    client, peer = socket.socketpair()
+    peer.setblocking(False)
+    bridge.client = peer
+    bridge.rx_pending.extend(b'status')
+
+    # the client sends two requests and leaves before the first answer
+    client.sendall(packFrame(FRAME_ECHO, b'1') + packFrame(FRAME_ECHO, b'2'))
+    client.close()
+    bridge.receiveFrames()
+    bridge.sendFrame(FRAME_DATA, b'late')
+
+    assert bridge.client is None
+    assert not bridge.rx_pending
+
+
+def test_bridge_survives_client_reset_mid_stream():
+    bridge = NetworkBridge(LoopbackPortHandler(), port=0)
+    address = bridge.start()
+    try:
+        for _ in range(3):
+            client = socket.create_connection(address)
+            client.sendall(packFrame(FRAME_DATA, b'\xff\xff\xfd\x00') + packFrame(FRAME_ECHO, b'x'))
+            # close with RST while the bridge still has bus bytes and an answer for it
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            client.close()
+            time.sleep(0.05)
+
+        assert bridge.thread.is_alive()
+        # a new client clears what the old ones left on the bus, as PortHandlerNetwork does
+        client = socket.create_connection(address)
+        client.sendall(packFrame(FRAME_CLEAR, b'\x01\x00'))
+        assert receiveFrame(client) == (FRAME_CLEAR, b'\x01\x00')
+        client.sendall(packFrame(FRAME_DATA, b'ping'))
+        assert receiveFrame(client) == (FRAME_DATA, b'ping')
+        client.close()
+    finally:
+        bridge.stop()
@@ -0,0 +1,89 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dynamixel_sdk import CAPTURE_DIR_RX
+from dynamixel_sdk import CAPTURE_DIR_TX
+from dynamixel_sdk import CaptureAnalyzer
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import DXL_HIBYTE
+from dynamixel_sdk import DXL_LOBYTE
+from dynamixel_sdk import PacketCapture
+from dynamixel_sdk import PacketHandler
+from dynamixel_sdk import readCapture
+from dynamixel_sdk import ReplayPortHandler
+
+DXL_ID = 1
+MODEL_NUMBER = 1060  # XL430-W250
+
+
+def makePacket(ph, body):
+    packet = [0xFF, 0xFF, 0xFD, 0x00] + body + [0, 0]
+    crc = ph.updateCRC(0, packet, len(packet) - 2)
+    packet[-2] = DXL_LOBYTE(crc)
+    packet[-1] = DXL_HIBYTE(crc)
+    return bytes(packet)
+
+
+def makePingRecords(ph, count):
+    ping = makePacket(ph, [DXL_ID, 3, 0, 0x01])
+    status = makePacket(ph, [DXL_ID, 7, 0, 0x55, 0, DXL_LOBYTE(MODEL_NUMBER), DXL_HIBYTE(MODEL_NUMBER), 46])
+    records = []
+    for i in range(count):
+        records.append((CAPTURE_DIR_TX, i * 2000000, ping))
+        # the status arrives in two chunks, as it can from a serial port
+        records.append((CAPTURE_DIR_RX, i * 2000000 + 500000, status[:5]))
+        records.append((CAPTURE_DIR_RX, i * 2000000 + 600000, status[5:]))
+    return records
+
+
+def test_capture_file_round_trip(tmp_path):
+    file_name = str(tmp_path / 'bus.dxlcap')
+    capture = PacketCapture(file_name, 57600)
+    capture.recordTx(b'\x01\x02')
+    capture.recordRx(b'\x03')
+    capture.close()
+
+    baudrate, records = readCapture(file_name)
+    assert baudrate == 57600
+    assert [(direction, data) for direction, _, data in records] == [
+        (CAPTURE_DIR_TX, b'\x01\x02'), (CAPTURE_DIR_RX, b'\x03')]
+    assert records[0][1] <= records[1][1]
+
+
+def test_analyzer_counts_instructions_and_turnaround():
+    ph = PacketHandler(2.0)
+    report = CaptureAnalyzer(makePingRecords(ph, 3), 2.0, 57600).analyze()
+
+    assert report['instructions'] == {'PING': 3}
+    assert report['status_packets'] == 3
+    assert report['rx_crc_errors'] == 0
+    assert report['turnaround_us'][DXL_ID]['count'] == 3
+
+
+def test_replay_answers_recorded_pings():
+    ph = PacketHandler(2.0)
+    port = ReplayPortHandler(makePingRecords(ph, 2), loop=True)
+    port.openPort()
+
+    for _ in range(3):
+        model_number, result, error = ph.ping(port, DXL_ID)
+        assert (model_number, result, error) == (MODEL_NUMBER, COMM_SUCCESS, 0)
+
+
+def test_replay_loop_without_instructions_returns():
+    port = ReplayPortHandler([(CAPTURE_DIR_RX, 0, b'\x00')], loop=True)
+    port.openPort()
+    port.writePort(b'\x01')
+    assert port.getBytesAvailable() == 0
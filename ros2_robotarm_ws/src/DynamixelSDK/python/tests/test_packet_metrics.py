@@ -0,0 +1,54 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dynamixel_sdk import BROADCAST_ID
+from dynamixel_sdk import COMM_RX_TIMEOUT
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import INST_READ
+from dynamixel_sdk import INST_SYNC_READ
+from dynamixel_sdk import PacketMetrics
+
+
+def test_latency_is_measured_once_per_instruction():
+    metrics = PacketMetrics()
+    metrics.onTx(INST_SYNC_READ, BROADCAST_ID, 18)
+    for dxl_id in (1, 2, 3):
+        metrics.onRx(dxl_id, 15, COMM_SUCCESS, 0)
+
+    latency = metrics.snapshot()['latency_ms']['SYNC_READ']
+    assert latency['count'] == 1
+    assert metrics.pending_instruction is None
+
+    # a status without a preceding instruction has no latency
+    metrics.onRx(1, 15, COMM_SUCCESS, 0)
+    assert metrics.snapshot()['latency_ms']['SYNC_READ']['count'] == 1
+
+
+def test_errors_are_kept_per_id_and_instruction():
+    metrics = PacketMetrics()
+    metrics.onTx(INST_READ, 3, 14)
+    metrics.onRx(None, 0, COMM_RX_TIMEOUT, 0)
+    metrics.onTx(INST_READ, 1, 14)
+    metrics.onRx(1, 15, COMM_SUCCESS, 0x80)
+    metrics.onTx(INST_SYNC_READ, BROADCAST_ID, 18)
+    metrics.onRx(None, 0, COMM_RX_TIMEOUT, 0)
+
+    errors = metrics.snapshot()['errors']
+    assert errors['READ'] == {3: {'rx_timeout': 1}, 1: {'status_error_0x80': 1}}
+    assert errors['SYNC_READ'] == {BROADCAST_ID: {'rx_timeout': 1}}
+    assert metrics.snapshot()['statuses'][1]['errors'] == 1
+
+    text = metrics.toPrometheusText()
+    assert 'dynamixel_errors_total{instruction="READ",id="3",class="rx_timeout"} 1' in text
@@ -0,0 +1,150 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import sys
+import termios
+import time
+import tty
+
+import pytest
+
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import DEFAULT_BAUDRATE
+from dynamixel_sdk import LATENCY_TIMER
+from dynamixel_sdk import PacketHandler
+from dynamixel_sdk import PortHandlerLinux
+from pty_device import PtyDevice, servePing
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'), reason='needs a Linux pty')
+
+
+@pytest.fixture
+def pty():
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(master_fd)
+    port = PortHandlerLinux(os.ttyname(slave_fd))
+    yield port, master_fd
+    port.closePort()
+    os.close(slave_fd)
+    os.close(master_fd)
+
+
+def waitAvailable(port, length, timeout=2.0):
+    end = time.monotonic() + timeout
+    while port.getBytesAvailable() < length:
+        assert time.monotonic() < end, 'bytes did not arrive'
+        time.sleep(0.001)
+
+
+def readMaster(master_fd, length, timeout=2.0):
+    data = b''
+    end = time.monotonic() + timeout
+    while len(data) < length:
+        assert time.monotonic() < end, 'bytes did not arrive'
+        data += os.read(master_fd, length - len(data))
+    return data
+
+
+def test_open_port_configures_a_raw_port(pty):
+    port, _ = pty
+    assert port.openPort()
+    assert port.is_open and port.fd >= 0
+    assert port.getBaudRate() == DEFAULT_BAUDRATE
+
+    attr = termios.tcgetattr(port.fd)
+    assert attr[3] & (termios.ICANON | termios.ECHO) == 0
+    assert attr[6][termios.VMIN] == 0 and attr[6][termios.VTIME] == 0
+    # a pty has no serial_struct, so the default latency timer stays
+    assert not port.is_low_latency
+    assert port.latency_timer == LATENCY_TIMER
+
+    port.closePort()
+    assert not port.is_open and port.fd == -1
+
+
+def test_set_baud_rate(pty):
+    port, _ = pty
+    assert port.openPort()
+
+    assert port.setBaudRate(57600)
+    assert port.is_open
+    assert port.getBaudRate() == 57600
+    assert port.tx_time_per_byte == pytest.approx(10000.0 / 57600)
+    assert termios.tcgetattr(port.fd)[4] == termios.B57600
+
+    assert not port.setBaudRate(12345)
+    assert port.getBaudRate() == 57600
+
+
+def test_write_and_read_round_trip(pty):
+    port, master_fd = pty
+    assert port.openPort()
+
+    assert port.writePort([0xFF, 0xFF, 0xFD, 0x00]) == 4
+    assert readMaster(master_fd, 4) == b'\xff\xff\xfd\x00'
+
+    assert port.getBytesAvailable() == 0
+    assert port.readPort(4) == b''
+
+    os.write(master_fd, bytes(range(10)))
+    waitAvailable(port, 10)
+    assert port.getBytesAvailable() == 10
+    assert port.readPort(4) == bytes(range(4))
+    assert port.readPort(16) == bytes(range(4, 10))
+    assert port.getBytesAvailable() == 0
+
+
+def test_read_larger_than_the_buffer(pty):
+    port, master_fd = pty
+    assert port.openPort()
+    payload = bytes(i & 0xFF for i in range(3000))
+
+    port.writePort(payload)
+    assert readMaster(master_fd, len(payload)) == payload
+
+    os.write(master_fd, payload)
+    data = b''
+    end = time.monotonic() + 2.0
+    while len(data) < len(payload) and time.monotonic() < end:
+        data += port.readPort(8192)
+    assert data == payload
+    assert len(port.read_buffer) == 8192
+
+
+def test_clear_port_drops_pending_input(pty):
+    port, master_fd = pty
+    assert port.openPort()
+
+    os.write(master_fd, b'stale')
+    waitAvailable(port, 5)
+    port.clearPort()
+
+    assert port.getBytesAvailable() == 0
+    assert port.readPort(5) == b''
+
+
+def test_ping_through_a_simulated_device():
+    device = PtyDevice(servePing, 1, 1060)
+    port = PortHandlerLinux(device.port_name)
+    try:
+        assert port.openPort()
+        assert port.setBaudRate(1000000)
+        model_number, result, error = PacketHandler(2.0).ping(port, 1)
+    finally:
+        port.closePort()
+        device.close()
+
+    assert (model_number, result, error) == (1060, COMM_SUCCESS, 0)
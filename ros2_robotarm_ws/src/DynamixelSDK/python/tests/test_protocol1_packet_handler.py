@@ -0,0 +1,46 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import PacketHandler
+from dynamixel_sdk import PortHandler
+
+
+class RecordingPortHandler(PortHandler):
+    # Keeps the buffer each packet was written from, as a serial port would send it later
+
+    def __init__(self, port_name):
+        super(RecordingPortHandler, self).__init__(port_name)
+        self.written = []
+
+    def clearPort(self):
+        pass
+
+    def writePort(self, packet):
+        self.written.append(packet)
+        return len(packet)
+
+
+def test_ports_sharing_a_handler_keep_their_own_packets():
+    ph = PacketHandler(1.0)
+    port_a = RecordingPortHandler('a')
+    port_b = RecordingPortHandler('b')
+
+    # write 0x12 to address 30 of ID 1 on one port and 0x34 to ID 2 on the other
+    assert ph.writeTxOnly(port_a, 1, 30, 1, [0x12]) == COMM_SUCCESS
+    assert ph.writeTxOnly(port_b, 2, 30, 1, [0x34]) == COMM_SUCCESS
+
+    assert bytes(port_a.written[0]) == bytes([0xFF, 0xFF, 1, 4, 0x03, 30, 0x12, 0xC7])
+    assert bytes(port_b.written[0]) == bytes([0xFF, 0xFF, 2, 4, 0x03, 30, 0x34, 0xA4])
@@ -0,0 +1,153 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from dynamixel_sdk import COMM_RX_CORRUPT
+from dynamixel_sdk import COMM_RX_TIMEOUT
+from dynamixel_sdk import COMM_SUCCESS
+from dynamixel_sdk import COMM_TX_ERROR
+from dynamixel_sdk import getResult
+from dynamixel_sdk import RetryPolicy
+from dynamixel_sdk import retry_policy
+
+
+class FakeClock:
+    # perf_counter only moves when a transaction or a jitter sleep takes time
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakePort:
+
+    def __init__(self):
+        self.cap = 'previous'
+        self.caps = []
+
+    def getPacketTimeoutCap(self):
+        return self.cap
+
+    def setPacketTimeoutCap(self, cap):
+        self.cap = cap
+        self.caps.append(cap)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry_policy, 'time', clock)
+    return clock
+
+
+def makeTransaction(clock, results, duration_ms=1.0):
+    # returns the given values in order, each attempt taking duration_ms
+    calls = []
+
+    def transaction(*args):
+        calls.append(args)
+        clock.now += duration_ms / 1000.0
+        return results[len(calls) - 1]
+    transaction.calls = calls
+    return transaction
+
+
+@pytest.mark.parametrize('value, result', [
+    (COMM_SUCCESS, COMM_SUCCESS),
+    ((COMM_RX_TIMEOUT, 0), COMM_RX_TIMEOUT),                # write: (result, error)
+    (([1, 2], COMM_RX_CORRUPT), COMM_RX_CORRUPT),           # broadcast ping: (data list, result)
+    (({1: [0, 1]}, COMM_SUCCESS), COMM_SUCCESS),            # (data dict, result)
+    ((bytearray(b'\xff'), COMM_RX_TIMEOUT), COMM_RX_TIMEOUT),  # rxPacket: (packet, result)
+    (([0x12, 0x34], COMM_SUCCESS, 0), COMM_SUCCESS),        # readTxRx: (data list, result, error)
+    ((1060, COMM_RX_TIMEOUT, 0), COMM_RX_TIMEOUT),          # ping, read4ByteTxRx: (value, result, error)
+])
+def test_result_of_every_return_shape(value, result):
+    assert getResult(value) == result
+
+
+def test_success_after_retries(clock):
+    port = FakePort()
+    transaction = makeTransaction(clock, [(COMM_RX_TIMEOUT, 0), ([], COMM_RX_CORRUPT, 0), ([7], COMM_SUCCESS, 0)])
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.run(port, transaction, 1, 2) == ([7], COMM_SUCCESS, 0)
+    assert transaction.calls == [(1, 2)] * 3
+    stats = policy.getStats()
+    assert (stats['attempts'], stats['retries'], stats['failures']) == (3, 2, 0)
+    assert stats['results'] == {COMM_RX_TIMEOUT: 1, COMM_RX_CORRUPT: 1, COMM_SUCCESS: 1}
+    assert port.cap == 'previous'
+
+
+def test_retries_are_exhausted(clock):
+    transaction = makeTransaction(clock, [(COMM_RX_TIMEOUT, 0)] * 5)
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.run(FakePort(), transaction) == (COMM_RX_TIMEOUT, 0)
+    assert len(transaction.calls) == 3
+    stats = policy.getStats()
+    assert (stats['transactions'], stats['retries'], stats['failures']) == (1, 2, 1)
+    assert stats['deadline_exhausted'] == 0
+
+
+def test_non_retriable_result_is_returned_at_once(clock):
+    transaction = makeTransaction(clock, [(COMM_TX_ERROR, 0), (COMM_SUCCESS, 0)])
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.run(FakePort(), transaction) == (COMM_TX_ERROR, 0)
+    assert len(transaction.calls) == 1
+    assert policy.getStats()['failures'] == 1
+
+
+def test_deadline_stops_retries_that_cannot_finish(clock):
+    port = FakePort()
+    transaction = makeTransaction(clock, [(COMM_RX_TIMEOUT, 0)] * 10, duration_ms=30.0)
+    policy = RetryPolicy(max_attempts=10, attempt_timeout_ms=50.0, deadline_ms=100.0)
+
+    # attempts end at 30, 60 and 90 ms, a fourth one would end after 100 ms
+    assert policy.run(port, transaction) == (COMM_RX_TIMEOUT, 0)
+    assert len(transaction.calls) == 3
+    stats = policy.getStats()
+    assert (stats['failures'], stats['deadline_exhausted']) == (1, 1)
+    # every attempt is capped by the attempt timeout and what is left of the deadline
+    assert port.caps[:3] == pytest.approx([50.0, 50.0, 40.0])
+    assert port.cap == 'previous'
+
+
+def test_deadline_argument_overrides_the_policy(clock):
+    transaction = makeTransaction(clock, [(COMM_RX_TIMEOUT, 0)] * 10, duration_ms=30.0)
+    policy = RetryPolicy(max_attempts=10, deadline_ms=1000.0)
+
+    policy.run(FakePort(), transaction, deadline_ms=50.0)
+    assert len(transaction.calls) == 1
+
+
+def test_jitter_delays_retries_and_counts_against_the_deadline(clock, monkeypatch):
+    monkeypatch.setattr(retry_policy.random, 'uniform', lambda low, high: high)
+    transaction = makeTransaction(clock, [(COMM_RX_TIMEOUT, 0)] * 10, duration_ms=10.0)
+    policy = RetryPolicy(max_attempts=10, deadline_ms=55.0, jitter_ms=15.0)
+
+    # attempts end at 10 and 35 ms, a third after another 15 ms delay would end at 60 ms
+    policy.run(FakePort(), transaction)
+    assert len(transaction.calls) == 2
+    assert clock.sleeps == pytest.approx([0.015])
+    assert policy.getStats()['deadline_exhausted'] == 1
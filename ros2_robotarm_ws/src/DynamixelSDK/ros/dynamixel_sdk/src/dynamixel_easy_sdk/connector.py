@@ -19,24 +19,32 @@
 
 # Author: Hyungyu Kim
 
+import time
+from typing import Dict
 from typing import List
+from typing import Optional
 import serial
 
+from dynamixel_easy_sdk.bus_tuner import BusTuner
 from dynamixel_easy_sdk.dynamixel_error import DxlError
 from dynamixel_easy_sdk.dynamixel_error import DxlRuntimeError
 from dynamixel_easy_sdk.group_executor import GroupExecutor
 from dynamixel_easy_sdk.motor import Motor
 from dynamixel_sdk import PacketHandler
 from dynamixel_sdk import PortHandler
+from dynamixel_sdk import RetryPolicy
 
 
 class Connector:
 
     PROTOCOL_VERSION = 2.0
+    FLEET_TIMEOUT_MS = 3000
+    FLEET_PING_TIMEOUT_MS = 10
     _packet_handler = None
 
     def __init__(self, port_name: str, baud_rate: int):
         self._port_handler = PortHandler(port_name)
+        self._retry_policy = None
         if Connector._packet_handler is None:
             Connector._packet_handler = PacketHandler(Connector.PROTOCOL_VERSION)
 
@@ -54,6 +62,19 @@ class Connector:
         except Exception as e:
             raise DxlRuntimeError('Failed to open port') from e
 
+    def setBaudRate(self, baud_rate: int):
+        if not self._port_handler.setBaudRate(baud_rate):
+            raise DxlRuntimeError('Invalid baudrate specified')
+
+    def getBaudRate(self) -> int:
+        return self._port_handler.getBaudRate()
+
+    def setRetryPolicy(self, retry_policy: Optional[RetryPolicy]):
+        self._retry_policy = retry_policy
+
+    def getRetryPolicy(self) -> Optional[RetryPolicy]:
+        return self._retry_policy
+
     def createMotor(self, motor_id: int) -> Motor:
         model_number = self.ping(motor_id)
         return Motor(motor_id, model_number, self)
@@ -72,6 +93,14 @@ class Connector:
     def createGroupExecutor(self):
         return GroupExecutor(self)
 
+    def createBusTuner(self):
+        return BusTuner(self)
+
+    def _transact(self, transaction, *args):
+        if self._retry_policy is None:
+            return transaction(self._port_handler, *args)
+        return self._retry_policy.run(self._port_handler, transaction, self._port_handler, *args)
+
     def _checkError(self, dxl_comm_result, dxl_error):
         if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
             raise DxlRuntimeError(DxlError(dxl_comm_result))
@@ -79,75 +108,124 @@ class Connector:
             raise DxlRuntimeError(DxlError(dxl_error))
 
     def read1ByteData(self, motor_id: int, address: int) -> int:
-        value, dxl_comm_result, dxl_error = Connector._packet_handler.read1ByteTxRx(
-            self._port_handler,
+        value, dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.read1ByteTxRx,
             motor_id,
             address)
         self._checkError(dxl_comm_result, dxl_error)
         return value
 
     def read2ByteData(self, motor_id: int, address: int) -> int:
-        value, dxl_comm_result, dxl_error = Connector._packet_handler.read2ByteTxRx(
-            self._port_handler,
+        value, dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.read2ByteTxRx,
             motor_id,
             address)
         self._checkError(dxl_comm_result, dxl_error)
         return value
 
     def read4ByteData(self, motor_id: int, address: int) -> int:
-        value, dxl_comm_result, dxl_error = Connector._packet_handler.read4ByteTxRx(
-            self._port_handler,
+        value, dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.read4ByteTxRx,
             motor_id,
             address)
         self._checkError(dxl_comm_result, dxl_error)
         return value
 
     def write1ByteData(self, motor_id: int, address: int, value: int):
-        dxl_comm_result, dxl_error = Connector._packet_handler.write1ByteTxRx(
-            self._port_handler,
+        dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.write1ByteTxRx,
             motor_id,
             address,
             value)
         self._checkError(dxl_comm_result, dxl_error)
 
     def write2ByteData(self, motor_id: int, address: int, value: int):
-        dxl_comm_result, dxl_error = Connector._packet_handler.write2ByteTxRx(
-            self._port_handler,
+        dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.write2ByteTxRx,
             motor_id,
             address,
             value)
         self._checkError(dxl_comm_result, dxl_error)
 
     def write4ByteData(self, motor_id: int, address: int, value: int):
-        dxl_comm_result, dxl_error = Connector._packet_handler.write4ByteTxRx(
-            self._port_handler,
+        dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.write4ByteTxRx,
             motor_id,
             address,
             value)
         self._checkError(dxl_comm_result, dxl_error)
 
     def reboot(self, motor_id: int):
-        dxl_comm_result, dxl_error = Connector._packet_handler.reboot(self._port_handler, motor_id)
+        dxl_comm_result, dxl_error = self._transact(Connector._packet_handler.reboot, motor_id)
         self._checkError(dxl_comm_result, dxl_error)
 
     def ping(self, motor_id: int) -> int:
-        model_number, dxl_comm_result, dxl_error = Connector._packet_handler.ping(
-            self._port_handler,
+        model_number, dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.ping,
             motor_id)
         self._checkError(dxl_comm_result, dxl_error)
         return model_number
 
     def broadcastPing(self) -> List[int]:
-        ids, dxl_comm_result = Connector._packet_handler.broadcastPing(self._port_handler)
+        ids, dxl_comm_result = self._transact(Connector._packet_handler.broadcastPing)
         self._checkError(dxl_comm_result, DxlError.SDK_COMM_SUCCESS)
         return ids
 
     def factoryReset(self, motor_id: int, option: int):
-        dxl_comm_result, dxl_error = Connector._packet_handler.factoryReset(
-            self._port_handler,
+        dxl_comm_result, dxl_error = self._transact(
+            Connector._packet_handler.factoryReset,
             motor_id,
             option)
         self._checkError(dxl_comm_result, dxl_error)
 
+    def clearMultiTurn(self, motor_id: int):
+        dxl_comm_result, dxl_error = self._transact(Connector._packet_handler.clearMultiTurn, motor_id)
+        self._checkError(dxl_comm_result, dxl_error)
+
+    def rebootMotors(self, motor_ids: List[int], timeout_ms: int = FLEET_TIMEOUT_MS) -> Dict[int, DxlError]:
+        outcomes = self._issueFleetCommand(Connector._packet_handler.reboot, motor_ids)
+        self._waitForMotors(outcomes, timeout_ms)
+        return outcomes
+
+    def clearMultiTurnMotors(self, motor_ids: List[int]) -> Dict[int, DxlError]:
+        return self._issueFleetCommand(Connector._packet_handler.clearMultiTurn, motor_ids)
+
+    def factoryResetMotors(self, motor_ids: List[int], option: int,
+                           timeout_ms: int = FLEET_TIMEOUT_MS) -> Dict[int, DxlError]:
+        outcomes = self._issueFleetCommand(Connector._packet_handler.factoryReset, motor_ids, option)
+        # devices come back on the current ID and baud rate only when both are kept
+        if option == 0x02 or (option == 0x01 and self.getBaudRate() == 57600):
+            self._waitForMotors(outcomes, timeout_ms)
+        return outcomes
+
+    def _issueFleetCommand(self, command, motor_ids: List[int], *args) -> Dict[int, DxlError]:
+        outcomes = {}
+        for motor_id in motor_ids:
+            dxl_comm_result, dxl_error = self._transact(command, motor_id, *args)
+            if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
+                outcomes[motor_id] = DxlError(dxl_comm_result)
+            else:
+                outcomes[motor_id] = DxlError(dxl_error)
+        return outcomes
+
+    def _waitForMotors(self, outcomes: Dict[int, DxlError], timeout_ms: int):
+        # poll every restarting device in turn with short pings until all answer or the shared deadline passes
+        pending = [motor_id for motor_id, outcome in outcomes.items() if outcome == DxlError.SDK_COMM_SUCCESS]
+        for motor_id in pending:
+            outcomes[motor_id] = DxlError.SDK_COMM_RX_TIMEOUT
+
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        previous_cap = self._port_handler.getPacketTimeoutCap()
+        self._port_handler.setPacketTimeoutCap(Connector.FLEET_PING_TIMEOUT_MS)
+        try:
+            while pending and time.monotonic() < deadline:
+                for motor_id in list(pending):
+                    _, dxl_comm_result, _ = Connector._packet_handler.ping(self._port_handler, motor_id)
+                    if dxl_comm_result == DxlError.SDK_COMM_SUCCESS:
+                        outcomes[motor_id] = DxlError.SDK_COMM_SUCCESS
+                        pending.remove(motor_id)
+        finally:
+            self._port_handler.setPacketTimeoutCap(previous_cap)
+
     def closePort(self):
         self._port_handler.closePort()
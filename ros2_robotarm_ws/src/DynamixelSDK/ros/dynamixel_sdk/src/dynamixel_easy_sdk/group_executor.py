@@ -19,6 +19,7 @@
 
 # Author: Hyungyu Kim
 
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -31,6 +32,7 @@ from dynamixel_easy_sdk.dynamixel_error import DxlError
 from dynamixel_easy_sdk.dynamixel_error import DxlRuntimeError
 from dynamixel_sdk import GroupBulkRead
 from dynamixel_sdk import GroupBulkWrite
+from dynamixel_sdk import GroupRegWrite
 from dynamixel_sdk import GroupSyncRead
 from dynamixel_sdk import GroupSyncWrite
 
@@ -78,6 +80,27 @@ class GroupExecutor:
         else:
             self._executeBulkWrite()
 
+    def executeRegWrite(self, wait_status: bool = True) -> Dict[str, float]:
+        if not self._staged_write_commands:
+            raise DxlRuntimeError(DxlError.EASY_SDK_COMMAND_IS_EMPTY)
+
+        ids = [cmd.id for cmd in self._staged_write_commands]
+        if len(ids) != len(set(ids)):
+            raise DxlRuntimeError(DxlError.EASY_SDK_DUPLICATE_ID)
+
+        group = GroupRegWrite(self.port_handler, self.packet_handler, wait_status)
+        for cmd in self._staged_write_commands:
+            self._processStatusRequests(cmd)
+            if not group.addParam(cmd.id, cmd.address, cmd.length, bytes(cmd.data)):
+                raise DxlRuntimeError(DxlError.EASY_SDK_ADD_PARAM_FAIL)
+
+        dxl_comm_result = group.txPacket()
+        if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
+            raise DxlRuntimeError(DxlError(dxl_comm_result))
+        if group.getLastError() != 0:
+            raise DxlRuntimeError(DxlError(group.getLastError()))
+        return group.getTiming()
+
     def _executeSyncWrite(self, address: int, length: int) -> None:
         group = GroupSyncWrite(self.port_handler, self.packet_handler, address, length)
         for cmd in self._staged_write_commands:
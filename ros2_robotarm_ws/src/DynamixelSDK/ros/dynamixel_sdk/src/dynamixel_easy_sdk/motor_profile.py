@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from dynamixel_easy_sdk.control_table import ControlTable
+from dynamixel_easy_sdk.data_types import ControlTableItem
+from dynamixel_easy_sdk.data_types import ProfileReport
+from dynamixel_easy_sdk.data_types import toSignedInt
+from dynamixel_easy_sdk.dynamixel_error import DxlError
+from dynamixel_easy_sdk.dynamixel_error import DxlRuntimeError
+from dynamixel_sdk import GroupBulkRead
+from dynamixel_sdk import GroupBulkWrite
+
+MODEL_NUMBER_ADDRESS = 0
+MODEL_NUMBER_LENGTH = 2
+TORQUE_ENABLE = 'Torque Enable'
+
+
+class MotorProfile:
+
+    def __init__(self, fields: Dict[int, Dict[str, int]]):
+        self.fields = {int(motor_id): dict(values) for motor_id, values in fields.items()}
+
+    @classmethod
+    def fromDict(cls, data: Dict) -> 'MotorProfile':
+        return cls(data)
+
+    @classmethod
+    def fromYaml(cls, file_name: str) -> 'MotorProfile':
+        try:
+            import yaml
+        except ImportError as e:
+            raise DxlRuntimeError('PyYAML is required to load a profile from YAML') from e
+        with open(file_name, encoding='utf-8') as infile:
+            return cls(yaml.safe_load(infile))
+
+    def apply(self, connector, verify: bool = True) -> ProfileReport:
+        transaction = ProfileTransaction(connector, list(self.fields))
+        return transaction.apply(self.fields, verify)
+
+
+class ProfileTransaction:
+
+    def __init__(self, connector, motor_ids: List[int]):
+        self.port_handler = connector._port_handler
+        self.packet_handler = connector._packet_handler
+        self.motor_ids = list(motor_ids)
+        self.model_numbers = self.readModelNumbers()
+        self.control_tables = self.readControlTables()
+
+    def readModelNumbers(self) -> Dict[int, int]:
+        spans = {motor_id: (MODEL_NUMBER_ADDRESS, MODEL_NUMBER_LENGTH) for motor_id in self.motor_ids}
+        return {motor_id: int.from_bytes(data, 'little') for motor_id, data in self.readSpans(spans).items()}
+
+    def readControlTables(self) -> Dict[int, Dict[str, ControlTableItem]]:
+        return {
+            motor_id: ControlTable.getControlTable(model_number)
+            for motor_id, model_number in self.model_numbers.items()
+        }
+
+    def getItem(self, motor_id: int, name: str) -> ControlTableItem:
+        control_table = self.control_tables[motor_id]
+        if name not in control_table:
+            raise DxlRuntimeError(f'ID {motor_id} has no control table item "{name}"')
+        return control_table[name]
+
+    def isEeprom(self, motor_id: int, name: str) -> bool:
+        return self.getItem(motor_id, name).address < self.getItem(motor_id, TORQUE_ENABLE).address
+
+    def readFields(self, names: Dict[int, List[str]]) -> Dict[int, Dict[str, int]]:
+        # one bulk read per call: each ID reads the span covering all of its fields
+        spans = {}
+        for motor_id, field_names in names.items():
+            items = [self.getItem(motor_id, name) for name in field_names]
+            start = min(item.address for item in items)
+            end = max(item.address + item.size for item in items)
+            spans[motor_id] = (start, end - start)
+
+        data = self.readSpans(spans)
+        values = {}
+        for motor_id, field_names in names.items():
+            start = spans[motor_id][0]
+            values[motor_id] = {}
+            for name in field_names:
+                item = self.getItem(motor_id, name)
+                offset = item.address - start
+                values[motor_id][name] = int.from_bytes(data[motor_id][offset:offset + item.size], 'little')
+        return values
+
+    def writeFields(self, values: Dict[int, Dict[str, int]]) -> None:
+        # a bulk write carries one entry per ID, so contiguous fields are merged into runs
+        # and each round sends the next run of every ID
+        runs = {motor_id: self.makeRuns(motor_id, fields) for motor_id, fields in values.items() if fields}
+        group = GroupBulkWrite(self.port_handler, self.packet_handler)
+        round_index = 0
+        while True:
+            group.clearParam()
+            for motor_id, motor_runs in runs.items():
+                if round_index < len(motor_runs):
+                    address, data = motor_runs[round_index]
+                    if not group.addParam(motor_id, address, len(data), data):
+                        raise DxlRuntimeError(DxlError.EASY_SDK_ADD_PARAM_FAIL)
+            if not group.data_list:
+                return
+            dxl_comm_result = group.txPacket()
+            if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
+                raise DxlRuntimeError(DxlError(dxl_comm_result))
+            round_index += 1
+
+    def makeRuns(self, motor_id: int, fields: Dict[str, int]) -> List[Tuple[int, bytes]]:
+        items = sorted(
+            ((self.getItem(motor_id, name), value) for name, value in fields.items()),
+            key=lambda entry: entry[0].address)
+        runs = []
+        for item, value in items:
+            data = (value & ((1 << (item.size * 8)) - 1)).to_bytes(item.size, 'little')
+            if runs and runs[-1][0] + len(runs[-1][1]) == item.address:
+                runs[-1] = (runs[-1][0], runs[-1][1] + data)
+            else:
+                runs.append((item.address, data))
+        return runs
+
+    def readSpans(self, spans: Dict[int, Tuple[int, int]]) -> Dict[int, bytes]:
+        group = GroupBulkRead(self.port_handler, self.packet_handler)
+        for motor_id, (address, length) in spans.items():
+            if not group.addParam(motor_id, address, length):
+                raise DxlRuntimeError(DxlError.EASY_SDK_ADD_PARAM_FAIL)
+
+        dxl_comm_result = group.txRxPacket()
+        if dxl_comm_result != DxlError.SDK_COMM_SUCCESS:
+            raise DxlRuntimeError(DxlError(dxl_comm_result))
+        return {motor_id: bytes(group.data_dict[motor_id][0]) for motor_id in spans}
+
+    def apply(self, targets: Dict[int, Dict[str, int]], verify: bool = True) -> ProfileReport:
+        names = {motor_id: list(fields) + [TORQUE_ENABLE] for motor_id, fields in targets.items()}
+        current = self.readFields(names)
+
+        report = ProfileReport()
+        changed = {}
+        for motor_id, fields in targets.items():
+            for name, value in fields.items():
+                item = self.getItem(motor_id, name)
+                mask = (1 << (item.size * 8)) - 1
+                if current[motor_id][name] != value & mask:
+                    changed.setdefault(motor_id, {})[name] = value
+                    report.changes.setdefault(motor_id, {})[name] = (
+                        toSignedInt(current[motor_id][name], item.size), value)
+
+        if not changed:
+            report.verified = True
+            return report
+
+        report.torque_cycled = [
+            motor_id for motor_id, fields in changed.items()
+            if current[motor_id][TORQUE_ENABLE] != 0 and TORQUE_ENABLE not in fields
+            and any(self.isEeprom(motor_id, name) for name in fields)
+        ]
+
+        try:
+            if report.torque_cycled:
+                self.writeFields({motor_id: {TORQUE_ENABLE: 0} for motor_id in report.torque_cycled})
+            self.writeFields(changed)
+
+            if verify:
+                written = self.readFields({motor_id: list(fields) for motor_id, fields in changed.items()})
+                mismatched = [
+                    (motor_id, name) for motor_id, fields in changed.items() for name, value in fields.items()
+                    if written[motor_id][name] != value & ((1 << (self.getItem(motor_id, name).size * 8)) - 1)
+                ]
+                if mismatched:
+                    raise DxlRuntimeError(f'Profile verification failed for {mismatched}')
+                report.verified = True
+        except DxlRuntimeError:
+            self.rollback(changed, current)
+            raise
+        finally:
+            if report.torque_cycled:
+                self.writeFields({motor_id: {TORQUE_ENABLE: 1} for motor_id in report.torque_cycled})
+
+        return report
+
+    def rollback(self, changed: Dict[int, Dict[str, int]], current: Dict[int, Dict[str, int]]) -> None:
+        original = {motor_id: {name: current[motor_id][name] for name in fields} for motor_id, fields in changed.items()}
+        try:
+            self.writeFields(original)
+        except DxlRuntimeError:
+            pass
@@ -19,9 +19,27 @@
 
 # Author: Ryu Woon Jung (Leon)
 
+import socket
+import sys
+
 from .port_handler import *
 from .packet_handler import *
 from .group_sync_read import *
 from .group_sync_write import *
 from .group_bulk_read import *
 from .group_bulk_write import *
+from .group_reg_write import *
+from .packet_capture import *
+from .packet_metrics import *
+from .port_handler_network import *
+from .network_bridge import *
+from .bus_arbiter import *
+from .retry_policy import *
+
+# The bus daemon shares state through multiprocessing.shared_memory (Python 3.8+)
+# and takes commands on a Unix domain socket
+if sys.version_info >= (3, 8) and hasattr(socket, 'AF_UNIX'):
+    from .bus_daemon import *
+
+if sys.platform.startswith('linux'):
+    from .port_handler_linux import *
@@ -0,0 +1,422 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import os
+import select
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+from multiprocessing import shared_memory
+
+from .robotis_def import *
+from .group_sync_read import GroupSyncRead
+from .group_sync_write import GroupSyncWrite
+
+DEFAULT_BUS_NAME = 'dynamixel_bus'
+DEFAULT_CYCLE_HZ = 100.0
+
+# Shared memory layout:
+#   header: sequence(u64, odd while the daemon is writing), cycle(u64), stamp(f64),
+#           result(i32), device count(u16), data length(u16), owner pid(u32)
+#   entries: id(u8), valid(u8), data(data length) per device
+STATE_HEADER = struct.Struct('<QQdiHHI')
+STATE_ENTRY_HEADER = struct.Struct('<BB')
+
+# Commands are datagrams on a Unix socket: opcode(u8), id(u8), address(u16), length(u16), data
+COMMAND_HEADER = struct.Struct('<BBHH')
+CMD_SET_GOAL = 1    # stored and sent with the next cycle's sync write, no reply
+CMD_WRITE = 2       # executed between cycles, replies result
+CMD_READ = 3        # executed between cycles, replies result and data
+
+# Reply: result(i16), error(u8), data
+REPLY_HEADER = struct.Struct('<hB')
+MAX_DATAGRAM = 4096
+
+_created_blocks = set()
+
+
+def getSocketDirectory():
+    # the per-user runtime directory is private to the user, without it a private
+    # directory is made in the temporary directory
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return runtime_dir
+
+    socket_dir = os.path.join(tempfile.gettempdir(), 'dynamixel-%d' % os.getuid())
+    try:
+        os.mkdir(socket_dir, 0o700)
+    except FileExistsError:
+        pass
+    # someone else may have made it first to listen in on the bus
+    info = os.lstat(socket_dir)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) != 0o700:
+        raise RuntimeError('%s is not a private directory of this user' % socket_dir)
+    return socket_dir
+
+
+def getSocketPath(name, socket_dir=None):
+    return os.path.join(socket_dir or getSocketDirectory(), '%s.sock' % name)
+
+
+def getStateSize(device_count, data_length):
+    return STATE_HEADER.size + device_count * (STATE_ENTRY_HEADER.size + data_length)
+
+
+def isSocketServed(socket_path):
+    # connecting a datagram socket only succeeds while a process has it bound
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        probe.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def isProcessAlive(pid):
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # exists, owned by another user
+    return True
+
+
+class BusDaemon:
+    def __init__(self, port, ph, dxl_ids, read_address, read_length, write_address=0, write_length=0,
+                 name=DEFAULT_BUS_NAME, cycle_hz=DEFAULT_CYCLE_HZ, socket_dir=None):
+        self.port = port
+        self.ph = ph
+        self.dxl_ids = list(dxl_ids)
+        self.read_address = read_address
+        self.read_length = read_length
+        self.write_address = write_address
+        self.write_length = write_length
+        self.name = name
+        self.socket_path = getSocketPath(name, socket_dir)
+        self.cycle_period = 1.0 / cycle_hz
+
+        self.group_read = GroupSyncRead(port, ph, read_address, read_length)
+        for dxl_id in self.dxl_ids:
+            self.group_read.addParam(dxl_id)
+
+        self.group_write = None
+        if write_length > 0:
+            self.group_write = GroupSyncWrite(port, ph, write_address, write_length)
+            self.group_write.setDeltaMode(True)
+        self.goals = {}
+
+        self.shm = None
+        self.sock = None
+        self.sequence = 0
+        self.cycle = 0
+        self.overruns = 0
+
+        self.is_running = False
+        self.thread = None
+
+    def open(self):
+        # a bus has a single owner, leftovers are only removed once their owner is gone
+        if isSocketServed(self.socket_path):
+            raise RuntimeError('%s is served by a running bus daemon' % self.socket_path)
+
+        size = getStateSize(len(self.dxl_ids), self.read_length)
+        try:
+            self.shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+        except FileExistsError:
+            existing = attachSharedMemory(self.name)
+            owner_pid = 0
+            if existing.size >= STATE_HEADER.size:
+                owner_pid = STATE_HEADER.unpack_from(existing.buf, 0)[6]
+            existing.close()
+            if isProcessAlive(owner_pid):
+                raise RuntimeError('shared memory "%s" is owned by running process %d' % (self.name, owner_pid))
+
+            # left behind by a daemon that did not shut down cleanly
+            stale = shared_memory.SharedMemory(self.name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+        _created_blocks.add(self.name)
+
+        offset = STATE_HEADER.size
+        for dxl_id in self.dxl_ids:
+            STATE_ENTRY_HEADER.pack_into(self.shm.buf, offset, dxl_id, 0)
+            offset += STATE_ENTRY_HEADER.size + self.read_length
+        STATE_HEADER.pack_into(self.shm.buf, 0, 0, 0, 0.0, COMM_NOT_AVAILABLE, len(self.dxl_ids), self.read_length,
+                               os.getpid())
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.socket_path)
+        self.sock.setblocking(False)
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+            _created_blocks.discard(self.name)
+
+    def start(self):
+        self.open()
+        self.is_running = True
+        self.thread = threading.Thread(target=self.serveForever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.is_running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.close()
+
+    def serveForever(self):
+        if self.shm is None:
+            self.open()
+        self.is_running = True
+
+        next_cycle = time.perf_counter()
+        while self.is_running:
+            self.runCycle()
+
+            next_cycle += self.cycle_period
+            now = time.perf_counter()
+            if now > next_cycle:
+                self.overruns += 1
+                next_cycle = now
+
+            # serve client commands while waiting for the next cycle
+            while self.is_running:
+                timeout = next_cycle - time.perf_counter()
+                if timeout <= 0:
+                    break
+                readable, _, _ = select.select([self.sock], [], [], timeout)
+                if readable:
+                    self.processCommands()
+
+    def runCycle(self):
+        self.processCommands()
+
+        if self.group_write is not None and self.goals:
+            for dxl_id, data in self.goals.items():
+                if not self.group_write.changeParam(dxl_id, data):
+                    self.group_write.addParam(dxl_id, data)
+            self.group_write.txPacket()
+
+        result = self.group_read.txRxPacket()
+        self.publishState(result)
+        self.cycle += 1
+
+    def publishState(self, result):
+        buf = self.shm.buf
+        self.sequence += 1
+        struct.pack_into('<Q', buf, 0, self.sequence)
+
+        offset = STATE_HEADER.size
+        valid = 1 if result == COMM_SUCCESS else 0
+        for dxl_id in self.dxl_ids:
+            data = self.group_read.data_dict[dxl_id]
+            buf[offset + 1] = valid
+            if valid:
+                start = offset + STATE_ENTRY_HEADER.size
+                buf[start:start + self.read_length] = bytes(data)
+            offset += STATE_ENTRY_HEADER.size + self.read_length
+
+        self.sequence += 1
+        STATE_HEADER.pack_into(buf, 0, self.sequence, self.cycle, time.time(), result,
+                               len(self.dxl_ids), self.read_length, os.getpid())
+
+    def processCommands(self):
+        while True:
+            try:
+                message, client_address = self.sock.recvfrom(MAX_DATAGRAM)
+            except BlockingIOError:
+                return
+            if len(message) < COMMAND_HEADER.size:
+                continue
+
+            opcode, dxl_id, register_address, length = COMMAND_HEADER.unpack_from(message)
+            data = message[COMMAND_HEADER.size:COMMAND_HEADER.size + length]
+
+            if opcode == CMD_SET_GOAL:
+                if self.group_write is not None and dxl_id in self.dxl_ids and len(data) == self.write_length:
+                    self.goals[dxl_id] = data
+                continue
+
+            if opcode == CMD_WRITE:
+                result, error = self.ph.writeTxRx(self.port, dxl_id, register_address, length, list(data))
+                reply = REPLY_HEADER.pack(result, error)
+            elif opcode == CMD_READ:
+                data, result, error = self.ph.readTxRx(self.port, dxl_id, register_address, length)
+                reply = REPLY_HEADER.pack(result, error) + bytes(data)
+            else:
+                reply = REPLY_HEADER.pack(COMM_NOT_AVAILABLE, 0)
+
+            if client_address:
+                try:
+                    self.sock.sendto(reply, client_address)
+                except OSError:
+                    pass
+
+
+class BusClient:
+    def __init__(self, name=DEFAULT_BUS_NAME, timeout=1.0, socket_dir=None):
+        self.name = name
+        self.timeout = timeout
+        self.shm = attachSharedMemory(name)
+
+        _, _, _, _, self.device_count, self.data_length, _ = STATE_HEADER.unpack_from(self.shm.buf, 0)
+        self.entry_size = STATE_ENTRY_HEADER.size + self.data_length
+        self.index = {}
+        for index in range(self.device_count):
+            dxl_id = self.shm.buf[STATE_HEADER.size + index * self.entry_size]
+            self.index[dxl_id] = index
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind('')  # autobind, gives the daemon an address to reply to
+        self.sock.connect(getSocketPath(name, socket_dir))
+
+    def close(self):
+        self.sock.close()
+        self.shm.close()
+
+    def readState(self):
+        # seqlock read: retry while the daemon is in the middle of a publish. A daemon that
+        # died there leaves the sequence odd, so retries end at the timeout.
+        buf = self.shm.buf
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            sequence = struct.unpack_from('<Q', buf, 0)[0]
+            if not sequence & 1:
+                raw = bytes(buf[:STATE_HEADER.size + self.device_count * self.entry_size])
+                if struct.unpack_from('<Q', buf, 0)[0] == sequence:
+                    break
+            if time.perf_counter() > deadline:
+                return 0, 0.0, COMM_RX_TIMEOUT, {dxl_id: None for dxl_id in self.index}
+
+        _, cycle, stamp, result, _, _, _ = STATE_HEADER.unpack_from(raw, 0)
+        state = {}
+        offset = STATE_HEADER.size
+        for _ in range(self.device_count):
+            dxl_id, valid = STATE_ENTRY_HEADER.unpack_from(raw, offset)
+            start = offset + STATE_ENTRY_HEADER.size
+            state[dxl_id] = raw[start:start + self.data_length] if valid else None
+            offset += self.entry_size
+        return cycle, stamp, result, state
+
+    def getSequence(self):
+        return struct.unpack_from('<Q', self.shm.buf, 0)[0]
+
+    def setGoal(self, dxl_id, data):
+        self.sock.send(COMMAND_HEADER.pack(CMD_SET_GOAL, dxl_id, 0, len(data)) + bytes(data))
+
+    def write(self, dxl_id, address, data):
+        reply = self.request(COMMAND_HEADER.pack(CMD_WRITE, dxl_id, address, len(data)) + bytes(data))
+        if reply is None:
+            return COMM_RX_TIMEOUT, 0
+        result, error = REPLY_HEADER.unpack_from(reply)
+        return result, error
+
+    def read(self, dxl_id, address, length):
+        reply = self.request(COMMAND_HEADER.pack(CMD_READ, dxl_id, address, length))
+        if reply is None:
+            return [], COMM_RX_TIMEOUT, 0
+        result, error = REPLY_HEADER.unpack_from(reply)
+        return list(reply[REPLY_HEADER.size:]), result, error
+
+    def request(self, message):
+        self.sock.send(message)
+        readable, _, _ = select.select([self.sock], [], [], self.timeout)
+        if not readable:
+            return None
+        return self.sock.recv(MAX_DATAGRAM)
+
+
+def attachSharedMemory(name):
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached blocks with the resource tracker,
+        # which would unlink the daemon's block when the client exits
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name)
+        if name not in _created_blocks:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _main(argv=None):
+    import argparse
+
+    from .packet_handler import PacketHandler
+    from .port_handler import DEFAULT_BAUDRATE
+    from .port_handler import PortHandler
+
+    parser = argparse.ArgumentParser(description='Own a DYNAMIXEL bus and share it with local clients.')
+    parser.add_argument('device')
+    parser.add_argument('--baudrate', type=int, default=DEFAULT_BAUDRATE)
+    parser.add_argument('--ids', type=int, nargs='+', required=True)
+    parser.add_argument('--read-address', type=int, default=132)
+    parser.add_argument('--read-length', type=int, default=4)
+    parser.add_argument('--write-address', type=int, default=116)
+    parser.add_argument('--write-length', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=DEFAULT_CYCLE_HZ)
+    parser.add_argument('--name', default=DEFAULT_BUS_NAME)
+    parser.add_argument('--socket-dir', default=None,
+                        help='directory of the command socket '
+                             '(default: $XDG_RUNTIME_DIR or a private directory in the temporary directory)')
+    args = parser.parse_args(argv)
+
+    port_handler = PortHandler(args.device)
+    if not port_handler.setBaudRate(args.baudrate):
+        raise SystemExit('Failed to open %s at %d bps' % (args.device, args.baudrate))
+
+    daemon = BusDaemon(port_handler, PacketHandler(2.0), args.ids, args.read_address, args.read_length,
+                       args.write_address, args.write_length, args.name, args.rate, args.socket_dir)
+    try:
+        daemon.open()
+    except RuntimeError as e:
+        port_handler.closePort()
+        raise SystemExit(str(e))
+    print('Serving %s as "%s" at %.1f Hz on %s' % (args.device, args.name, args.rate, daemon.socket_path))
+    try:
+        daemon.serveForever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        port_handler.closePort()
+
+
+if __name__ == '__main__':
+    _main()
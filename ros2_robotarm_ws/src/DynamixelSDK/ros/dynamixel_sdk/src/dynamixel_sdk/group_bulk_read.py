@@ -85,7 +85,7 @@ class GroupBulkRead:
             self.makeParam()
 
         if self.ph.getProtocolVersion() == 1.0:
-            return self.ph.bulkReadTx(self.port, self.param, len(self.data_dict.keys()) * 3, False)
+            return self.ph.bulkReadTx(self.port, self.param, len(self.data_dict.keys()) * 3)
         else:
             return self.ph.bulkReadTx(self.port, self.param, len(self.data_dict.keys()) * 5, False)
 
@@ -106,6 +106,18 @@ class GroupBulkRead:
         if len(self.data_dict.keys()) == 0:
             return COMM_NOT_AVAILABLE
 
+        if self.ph.getProtocolVersion() == 1.0:
+            # all status packets are parsed in one pass
+            raw_data, result = self.ph.bulkReadRx(self.port, self.param, len(self.data_dict.keys()) * 3)
+            if result != COMM_SUCCESS:
+                return result
+
+            for dxl_id, (data, _) in raw_data.items():
+                self.data_dict[dxl_id][PARAM_NUM_DATA] = data
+
+            self.last_result = True
+            return result
+
         for dxl_id in self.data_dict:
             self.data_dict[dxl_id][PARAM_NUM_DATA], result, _ = self.ph.readRx(self.port, dxl_id,
                                                                                self.data_dict[dxl_id][PARAM_NUM_LENGTH])
@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import struct
+import sys
+import time
+
+from .robotis_def import *
+from .port_handler import DEFAULT_BAUDRATE
+from .port_handler import PortHandler
+from .protocol2_packet_handler import Protocol2PacketHandler
+
+CAPTURE_MAGIC = b'DXLCAP'
+CAPTURE_VERSION = 1
+
+CAPTURE_DIR_TX = 0
+CAPTURE_DIR_RX = 1
+
+# File header : MAGIC(6) VERSION(2) BAUDRATE(4)
+# Record      : DIRECTION(1) MONOTONIC_NS(8) LENGTH(2) DATA(LENGTH)
+CAPTURE_HEADER = struct.Struct('<6sHI')
+CAPTURE_RECORD = struct.Struct('<BQH')
+
+INSTRUCTION_NAMES = {
+    INST_PING: 'PING',
+    INST_READ: 'READ',
+    INST_WRITE: 'WRITE',
+    INST_REG_WRITE: 'REG_WRITE',
+    INST_ACTION: 'ACTION',
+    INST_FACTORY_RESET: 'FACTORY_RESET',
+    INST_CLEAR: 'CLEAR',
+    INST_SYNC_WRITE: 'SYNC_WRITE',
+    INST_BULK_READ: 'BULK_READ',
+    INST_REBOOT: 'REBOOT',
+    INST_STATUS: 'STATUS',
+    INST_SYNC_READ: 'SYNC_READ',
+    INST_FAST_SYNC_READ: 'FAST_SYNC_READ',
+    INST_BULK_WRITE: 'BULK_WRITE',
+    INST_FAST_BULK_READ: 'FAST_BULK_READ',
+}
+
+DEFAULT_GAP_THRESHOLD_MS = 10.0
+
+
+class PacketCapture:
+    def __init__(self, file_name, baudrate=0):
+        self.file_name = file_name
+        self.record_count = 0
+        self.byte_count = 0
+
+        self.file = open(file_name, 'wb')
+        self.file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, baudrate))
+
+    def recordTx(self, data):
+        self.record(CAPTURE_DIR_TX, data)
+
+    def recordRx(self, data):
+        self.record(CAPTURE_DIR_RX, data)
+
+    def record(self, direction, data):
+        if self.file is None:
+            return
+
+        data = bytes(data)
+        # time.monotonic_ns() needs Python 3.7
+        self.file.write(CAPTURE_RECORD.pack(direction, int(time.monotonic() * 1000000000), len(data)))
+        self.file.write(data)
+
+        self.record_count += 1
+        self.byte_count += len(data)
+
+    def flush(self):
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def readCapture(file_name):
+    records = []
+
+    with open(file_name, 'rb') as infile:
+        header = infile.read(CAPTURE_HEADER.size)
+        if len(header) != CAPTURE_HEADER.size:
+            raise ValueError('Capture file is too short: %s' % file_name)
+
+        magic, version, baudrate = CAPTURE_HEADER.unpack(header)
+        if magic != CAPTURE_MAGIC:
+            raise ValueError('Not a DYNAMIXEL capture file: %s' % file_name)
+        if version != CAPTURE_VERSION:
+            raise ValueError('Unsupported capture version %d: %s' % (version, file_name))
+
+        while True:
+            record_header = infile.read(CAPTURE_RECORD.size)
+            if len(record_header) < CAPTURE_RECORD.size:
+                break
+
+            direction, timestamp_ns, length = CAPTURE_RECORD.unpack(record_header)
+            data = infile.read(length)
+            if len(data) < length:  # truncated by an unclean shutdown
+                break
+
+            records.append((direction, timestamp_ns, data))
+
+    return baudrate, records
+
+
+class CaptureAnalyzer:
+    def __init__(self, records, protocol_version=2.0, baudrate=0, gap_threshold_ms=DEFAULT_GAP_THRESHOLD_MS):
+        self.records = records
+        self.protocol_version = protocol_version
+        self.baudrate = baudrate
+        self.gap_threshold_ms = gap_threshold_ms
+
+        self.crc_handler = Protocol2PacketHandler()
+
+    @classmethod
+    def fromFile(cls, file_name, protocol_version=2.0, baudrate=None, gap_threshold_ms=DEFAULT_GAP_THRESHOLD_MS):
+        file_baudrate, records = readCapture(file_name)
+        if baudrate is None:
+            baudrate = file_baudrate
+        return cls(records, protocol_version, baudrate, gap_threshold_ms)
+
+    def decodePackets(self):
+        # returns [(direction, timestamp_ns, dxl_id, instruction, error, params, crc_ok), ...]
+        packets = []
+        buffers = {CAPTURE_DIR_TX: bytearray(), CAPTURE_DIR_RX: bytearray()}
+        self.resync_bytes = {CAPTURE_DIR_TX: 0, CAPTURE_DIR_RX: 0}
+
+        for direction, timestamp_ns, data in self.records:
+            buf = buffers[direction]
+            buf.extend(data)
+
+            while True:
+                packet, consumed, skipped = self.parsePacket(buf, direction)
+                self.resync_bytes[direction] += skipped
+                if consumed == 0:
+                    break
+
+                del buf[0:consumed]
+                if packet is not None:
+                    packets.append((direction, timestamp_ns) + packet)
+
+        return packets
+
+    def parsePacket(self, buf, direction):
+        # returns (packet or None, consumed bytes, skipped bytes)
+        if self.protocol_version == 1.0:
+            header = b'\xff\xff'
+            min_length = 6
+        else:
+            header = b'\xff\xff\xfd\x00'
+            min_length = 10
+
+        idx = buf.find(header)
+        if idx < 0:
+            # keep a possible partial header at the tail
+            skipped = max(0, len(buf) - (len(header) - 1))
+            return None, skipped, skipped
+        if idx > 0:
+            return None, idx, idx
+        if len(buf) < min_length:
+            return None, 0, 0
+
+        if self.protocol_version == 1.0:
+            length = buf[3]
+            total_length = length + 4
+            if len(buf) < total_length:
+                return None, 0, 0
+            crc_ok = (~sum(buf[2:total_length - 1]) & 0xFF) == buf[total_length - 1]
+            dxl_id = buf[2]
+            if direction == CAPTURE_DIR_RX:
+                instruction, error, params = INST_STATUS, buf[4], bytes(buf[5:total_length - 1])
+            else:
+                instruction, error, params = buf[4], 0, bytes(buf[5:total_length - 1])
+        else:
+            length = DXL_MAKEWORD(buf[5], buf[6])
+            total_length = length + 7
+            if length < 3 or total_length > 64 * 1024:
+                return None, 1, 1
+            if len(buf) < total_length:
+                return None, 0, 0
+            crc = DXL_MAKEWORD(buf[total_length - 2], buf[total_length - 1])
+            crc_ok = self.crc_handler.updateCRC(0, buf, total_length - 2) == crc
+            dxl_id = buf[4]
+            instruction = buf[7]
+            if instruction == INST_STATUS:
+                error, params = buf[8], bytes(buf[9:total_length - 2])
+            else:
+                error, params = 0, bytes(buf[8:total_length - 2])
+
+        return (dxl_id, instruction, error, params, crc_ok), total_length, 0
+
+    def analyze(self):
+        report = {
+            'records': len(self.records),
+            'duration_ms': 0.0,
+            'tx_bytes': 0,
+            'rx_bytes': 0,
+            'bus_utilization': None,
+            'instructions': {},
+            'status_packets': 0,
+            'status_errors': 0,
+            'tx_crc_errors': 0,
+            'rx_crc_errors': 0,
+            'crc_error_rate': 0.0,
+            'resync_bytes': {},
+            'turnaround_us': {},
+            'gaps': {'threshold_ms': self.gap_threshold_ms, 'count': 0, 'max_ms': 0.0},
+        }
+
+        if not self.records:
+            return report
+
+        first_ns = self.records[0][1]
+        last_ns = self.records[-1][1]
+        report['duration_ms'] = (last_ns - first_ns) / 1000000.0
+
+        prev_ns = first_ns
+        for direction, timestamp_ns, data in self.records:
+            if direction == CAPTURE_DIR_TX:
+                report['tx_bytes'] += len(data)
+            else:
+                report['rx_bytes'] += len(data)
+
+            gap_ms = (timestamp_ns - prev_ns) / 1000000.0
+            if gap_ms > self.gap_threshold_ms:
+                report['gaps']['count'] += 1
+            report['gaps']['max_ms'] = max(report['gaps']['max_ms'], gap_ms)
+            prev_ns = timestamp_ns
+
+        if self.baudrate and report['duration_ms'] > 0:
+            # 10 bits per byte on the wire (start + 8 data + stop)
+            bits = (report['tx_bytes'] + report['rx_bytes']) * 10.0
+            report['bus_utilization'] = bits / (self.baudrate * report['duration_ms'] / 1000.0)
+
+        turnaround = {}
+        last_tx_ns = None
+        packet_count = 0
+        for direction, timestamp_ns, dxl_id, instruction, error, _, crc_ok in self.decodePackets():
+            packet_count += 1
+            if direction == CAPTURE_DIR_TX:
+                name = INSTRUCTION_NAMES.get(instruction, 'UNKNOWN(%d)' % instruction)
+                report['instructions'][name] = report['instructions'].get(name, 0) + 1
+                if not crc_ok:
+                    report['tx_crc_errors'] += 1
+                last_tx_ns = timestamp_ns
+                continue
+
+            report['status_packets'] += 1
+            if not crc_ok:
+                report['rx_crc_errors'] += 1
+                continue
+            if error != 0:
+                report['status_errors'] += 1
+            if last_tx_ns is not None:
+                turnaround.setdefault(dxl_id, []).append((timestamp_ns - last_tx_ns) / 1000.0)
+
+        if packet_count:
+            report['crc_error_rate'] = (report['tx_crc_errors'] + report['rx_crc_errors']) / float(packet_count)
+
+        report['resync_bytes'] = {
+            'tx': self.resync_bytes[CAPTURE_DIR_TX],
+            'rx': self.resync_bytes[CAPTURE_DIR_RX],
+        }
+
+        for dxl_id, samples in sorted(turnaround.items()):
+            samples.sort()
+            report['turnaround_us'][dxl_id] = {
+                'count': len(samples),
+                'min': samples[0],
+                'avg': sum(samples) / len(samples),
+                'p99': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+                'max': samples[-1],
+            }
+
+        return report
+
+
+class ReplayPortHandler(PortHandler):
+    def __init__(self, records, baudrate=DEFAULT_BAUDRATE, loop=False):
+        super(ReplayPortHandler, self).__init__('replay')
+        self.baudrate = baudrate
+        self.loop = loop
+
+        self.records = records
+        self.record_index = 0
+        self.rx_buffer = bytearray()
+        self.tx_count = 0
+
+    @classmethod
+    def fromFile(cls, file_name, loop=False):
+        baudrate, records = readCapture(file_name)
+        return cls(records, baudrate or DEFAULT_BAUDRATE, loop)
+
+    def setupPort(self, cflag_baud):
+        self.is_open = True
+        self.rx_buffer = bytearray()
+        self.tx_time_per_byte = (1000.0 / self.baudrate) * 10.0
+        return True
+
+    def closePort(self):
+        self.is_open = False
+
+    def clearPort(self):
+        pass
+
+    def getBytesAvailable(self):
+        return len(self.rx_buffer)
+
+    def readPort(self, length):
+        data = bytes(self.rx_buffer[0:length])
+        del self.rx_buffer[0:length]
+        if self.capture is not None and data:
+            self.capture.recordRx(data)
+        if (sys.version_info > (3, 0)):
+            return data
+        else:
+            return [ord(ch) for ch in data]
+
+    def writePort(self, packet):
+        if self.capture is not None:
+            self.capture.recordTx(packet)
+        self.tx_count += 1
+
+        # release every status chunk recorded between this instruction and the next one
+        self.skipToNextTx()
+        while self.record_index < len(self.records) and self.records[self.record_index][0] == CAPTURE_DIR_RX:
+            self.rx_buffer.extend(self.records[self.record_index][2])
+            self.record_index += 1
+
+        return len(packet)
+
+    def skipToNextTx(self):
+        wrapped = False
+        while True:
+            while self.record_index < len(self.records):
+                if self.records[self.record_index][0] == CAPTURE_DIR_TX:
+                    self.record_index += 1
+                    return
+                self.record_index += 1
+
+            # a capture without instruction packets has nothing to loop over
+            if not self.loop or wrapped:
+                return
+            wrapped = True
+            self.record_index = 0
+
+
+def printCaptureReport(report):
+    print('Records        : %d over %.3f ms' % (report['records'], report['duration_ms']))
+    print('Bytes          : tx %d / rx %d' % (report['tx_bytes'], report['rx_bytes']))
+    if report['bus_utilization'] is not None:
+        print('Bus utilization: %.1f %%' % (report['bus_utilization'] * 100.0))
+    for name, count in sorted(report['instructions'].items()):
+        print('  %-16s %d' % (name, count))
+    print('Status packets : %d (%d with error)' % (report['status_packets'], report['status_errors']))
+    print('CRC errors     : tx %d / rx %d (rate %.4f)' % (
+        report['tx_crc_errors'], report['rx_crc_errors'], report['crc_error_rate']))
+    print('Resync bytes   : tx %d / rx %d' % (report['resync_bytes']['tx'], report['resync_bytes']['rx']))
+    print('Gaps > %.1f ms  : %d (max %.3f ms)' % (
+        report['gaps']['threshold_ms'], report['gaps']['count'], report['gaps']['max_ms']))
+    for dxl_id, stat in report['turnaround_us'].items():
+        print('  [ID:%03d] turnaround min %.1f / avg %.1f / p99 %.1f / max %.1f us (%d)' % (
+            dxl_id, stat['min'], stat['avg'], stat['p99'], stat['max'], stat['count']))
+
+
+def _main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Analyze a DYNAMIXEL bus capture file.')
+    parser.add_argument('file_name')
+    parser.add_argument('--protocol', type=float, default=2.0)
+    parser.add_argument('--baudrate', type=int, default=None)
+    parser.add_argument('--gap-ms', type=float, default=DEFAULT_GAP_THRESHOLD_MS)
+    args = parser.parse_args(argv)
+
+    analyzer = CaptureAnalyzer.fromFile(args.file_name, args.protocol, args.baudrate, args.gap_ms)
+    printCaptureReport(analyzer.analyze())
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import array
+import fcntl
+import os
+import struct
+import termios
+
+from .port_handler import LATENCY_TIMER
+from .port_handler import PortHandler
+
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 1 << 13
+SERIAL_STRUCT_SIZE = 72  # sizeof(struct serial_struct) on 64-bit kernels
+SERIAL_STRUCT_FLAGS_OFFSET = 16
+
+LOW_LATENCY_TIMER = 1
+READ_BUFFER_SIZE = 4096
+
+
+class PortHandlerLinux(PortHandler):
+    def __init__(self, port_name, low_latency=True):
+        super(PortHandlerLinux, self).__init__(port_name)
+        self.fd = -1
+        self.low_latency = low_latency
+        self.is_low_latency = False
+        self.latency_timer = LATENCY_TIMER
+
+        self.read_buffer = bytearray(READ_BUFFER_SIZE)
+        self.read_view = memoryview(self.read_buffer)
+        self.available_buffer = array.array('i', [0])
+
+    def closePort(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.is_open = False
+
+    def clearPort(self):
+        termios.tcflush(self.fd, termios.TCIFLUSH)
+
+    def getBytesAvailable(self):
+        fcntl.ioctl(self.fd, termios.FIONREAD, self.available_buffer, True)
+        return self.available_buffer[0]
+
+    def readPort(self, length):
+        if length > len(self.read_buffer):
+            self.read_buffer = bytearray(length)
+            self.read_view = memoryview(self.read_buffer)
+
+        try:
+            read_length = os.readv(self.fd, [self.read_view[:length]])
+        except BlockingIOError:
+            return b''
+
+        data = bytes(self.read_view[:read_length])
+        if self.capture is not None and data:
+            self.capture.recordRx(data)
+        return data
+
+    def writePort(self, packet):
+        if self.capture is not None:
+            self.capture.recordTx(packet)
+
+        data = memoryview(bytes(packet))
+        written = 0
+        while written < len(data):
+            written += os.write(self.fd, data[written:])
+        return written
+
+    def setPacketTimeout(self, packet_length):
+        self.packet_start_time = self.getCurrentTime()
+        self.packet_timeout = (self.tx_time_per_byte * packet_length) + (self.latency_timer * 2.0) + 2.0
+
+    def setupPort(self, cflag_baud):
+        if self.is_open:
+            self.closePort()
+
+        speed = getattr(termios, 'B%d' % cflag_baud, None)
+        if speed is None:
+            return False
+
+        self.fd = os.open(self.port_name, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        flags = fcntl.fcntl(self.fd, fcntl.F_GETFL)
+        fcntl.fcntl(self.fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
+
+        # raw 8N1, reads return immediately with whatever is buffered
+        attr = termios.tcgetattr(self.fd)
+        attr[0] = termios.IGNPAR
+        attr[1] = 0
+        attr[2] = speed | termios.CS8 | termios.CLOCAL | termios.CREAD
+        attr[3] = 0
+        attr[4] = speed
+        attr[5] = speed
+        attr[6][termios.VTIME] = 0
+        attr[6][termios.VMIN] = 0
+        termios.tcsetattr(self.fd, termios.TCSANOW, attr)
+        termios.tcflush(self.fd, termios.TCIFLUSH)
+
+        self.is_open = True
+        self.is_low_latency = self.low_latency and self.setLowLatency()
+        self.latency_timer = LOW_LATENCY_TIMER if self.is_low_latency else LATENCY_TIMER
+        self.tx_time_per_byte = (1000.0 / self.baudrate) * 10.0
+
+        return True
+
+    def setLowLatency(self):
+        serial_struct = bytearray(SERIAL_STRUCT_SIZE)
+        try:
+            fcntl.ioctl(self.fd, TIOCGSERIAL, serial_struct, True)
+            flags = struct.unpack_from('i', serial_struct, SERIAL_STRUCT_FLAGS_OFFSET)[0]
+            struct.pack_into('i', serial_struct, SERIAL_STRUCT_FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+            fcntl.ioctl(self.fd, TIOCSSERIAL, serial_struct)
+        except OSError:
+            # pty and some USB adapters do not implement serial_struct
+            return False
+        return True
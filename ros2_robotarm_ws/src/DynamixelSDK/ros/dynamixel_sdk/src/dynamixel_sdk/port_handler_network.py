@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+################################################################################
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import abc
+import select
+import socket
+import struct
+import time
+
+from .port_handler import PortHandler
+
+# Every message between client and bridge is a frame: type(1) + payload length(2) + payload
+FRAME_HEADER = struct.Struct('<BH')
+FRAME_DATA = 0      # bus bytes, client -> bridge: write to serial, bridge -> client: read from serial
+FRAME_CONFIG = 1    # payload '<I' baud rate
+FRAME_CLEAR = 2     # payload '<H' sequence, drop bytes waiting in the bridge serial input, echoed when done
+FRAME_ECHO = 3      # answered by the bridge without touching the serial port
+
+MAX_FRAME_PAYLOAD = 0xFFFF
+DEFAULT_NETWORK_PORT = 9000
+NETWORK_TIMEOUT_MARGIN = 10.0  # ms added to every packet timeout for the network round trip
+
+
+def packFrame(frame_type, payload=b''):
+    return FRAME_HEADER.pack(frame_type, len(payload)) + bytes(payload)
+
+
+def unpackFrames(buffer):
+    # returns ([(type, payload), ...], remaining bytes)
+    frames = []
+    offset = 0
+    while len(buffer) - offset >= FRAME_HEADER.size:
+        frame_type, length = FRAME_HEADER.unpack_from(buffer, offset)
+        end = offset + FRAME_HEADER.size + length
+        if end > len(buffer):
+            break
+        frames.append((frame_type, bytes(buffer[offset + FRAME_HEADER.size:end])))
+        offset = end
+    return frames, buffer[offset:]
+
+
+def parseAddress(port_name, default_port=DEFAULT_NETWORK_PORT):
+    host, _, port = port_name.rpartition(':')
+    if not host:
+        return port_name, default_port
+    return host, int(port)
+
+
+class PortHandlerNetwork(PortHandler, metaclass=abc.ABCMeta):
+    def __init__(self, port_name):
+        super(PortHandlerNetwork, self).__init__(port_name)
+        self.sock = None
+        self.rx_buffer = bytearray()
+        self.tx_batch = None
+        self.echo_received = None
+        self.clear_sequence = 0
+        self.clear_pending = False
+        self.timeout_margin = NETWORK_TIMEOUT_MARGIN
+
+    def closePort(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self.is_open = False
+
+    def clearPort(self):
+        # status bytes the bridge coalesced before it handles the clear may still be on the way,
+        # data frames are dropped until the bridge answers this clear
+        self.clear_sequence = (self.clear_sequence + 1) & 0xFFFF
+        self.clear_pending = True
+        self.sendFrame(FRAME_CLEAR, struct.pack('<H', self.clear_sequence))
+        self.receiveFrames()
+        del self.rx_buffer[:]
+
+    def getBytesAvailable(self):
+        self.flushBatch()
+        self.receiveFrames()
+        return len(self.rx_buffer)
+
+    def readPort(self, length):
+        self.flushBatch()
+        if len(self.rx_buffer) < length:
+            self.receiveFrames()
+
+        data = bytes(self.rx_buffer[:length])
+        del self.rx_buffer[:length]
+        if self.capture is not None and data:
+            self.capture.recordRx(data)
+        return data
+
+    def writePort(self, packet):
+        if self.capture is not None:
+            self.capture.recordTx(packet)
+
+        if self.tx_batch is not None:
+            self.tx_batch.extend(packet)
+            return len(packet)
+
+        self.sendFrame(FRAME_DATA, packet)
+        return len(packet)
+
+    def beginBatch(self):
+        # instruction packets are held and sent as one frame at endBatch() or before the next read
+        if self.tx_batch is None:
+            self.tx_batch = bytearray()
+
+    def endBatch(self):
+        self.flushBatch()
+        self.tx_batch = None
+
+    def flushBatch(self):
+        if not self.tx_batch:
+            return
+        for offset in range(0, len(self.tx_batch), MAX_FRAME_PAYLOAD):
+            self.sendFrame(FRAME_DATA, self.tx_batch[offset:offset + MAX_FRAME_PAYLOAD])
+        del self.tx_batch[:]
+
+    def setPacketTimeout(self, packet_length):
+        super(PortHandlerNetwork, self).setPacketTimeout(packet_length)
+        self.packet_timeout += self.timeout_margin
+
+    def setPacketTimeoutMillis(self, msec):
+        super(PortHandlerNetwork, self).setPacketTimeoutMillis(msec + self.timeout_margin)
+
+    def setTimeoutMargin(self, msec):
+        self.timeout_margin = msec
+
+    def setupPort(self, cflag_baud):
+        if self.is_open:
+            self.closePort()
+
+        self.sock = self.connect(parseAddress(self.port_name))
+        self.sock.setblocking(False)
+        self.rx_buffer = bytearray()
+
+        self.sendFrame(FRAME_CONFIG, struct.pack('<I', self.baudrate))
+        self.clearPort()
+
+        self.is_open = True
+        self.tx_time_per_byte = (1000.0 / self.baudrate) * 10.0
+
+        return True
+
+    def measureRoundTrip(self, count=100, timeout=1.0):
+        # network round trip to the bridge, i.e. the latency added on top of local serial
+        samples = []
+        for sequence in range(count):
+            payload = struct.pack('<I', sequence)
+            start = time.perf_counter()
+            self.sendFrame(FRAME_ECHO, payload)
+            if not self.waitEcho(payload, start + timeout):
+                continue
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+        if not samples:
+            return {'count': 0, 'lost': count}
+
+        samples.sort()
+        return {
+            'count': len(samples),
+            'lost': count - len(samples),
+            'min_ms': samples[0],
+            'avg_ms': sum(samples) / len(samples),
+            'p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+            'max_ms': samples[-1],
+        }
+
+    def waitEcho(self, payload, deadline):
+        self.echo_received = None
+        while time.perf_counter() < deadline:
+            select.select([self.sock], [], [], max(0.0, deadline - time.perf_counter()))
+            self.receiveFrames()
+            if self.echo_received == payload:
+                return True
+        return False
+
+    def handleFrame(self, frame_type, payload):
+        if frame_type == FRAME_DATA:
+            if not self.clear_pending:
+                self.rx_buffer.extend(payload)
+        elif frame_type == FRAME_CLEAR:
+            if payload == struct.pack('<H', self.clear_sequence):
+                self.clear_pending = False
+        elif frame_type == FRAME_ECHO:
+            self.echo_received = payload
+
+    @abc.abstractmethod
+    def connect(self, address):
+        pass
+
+    @abc.abstractmethod
+    def sendFrame(self, frame_type, payload=b''):
+        pass
+
+    @abc.abstractmethod
+    def receiveFrames(self):
+        pass
+
+
+class PortHandlerTCP(PortHandlerNetwork):
+    def __init__(self, port_name):
+        super(PortHandlerTCP, self).__init__(port_name)
+        self.stream_buffer = b''
+
+    def connect(self, address):
+        sock = socket.create_connection(address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream_buffer = b''
+        return sock
+
+    def sendFrame(self, frame_type, payload=b''):
+        self.sock.setblocking(True)
+        try:
+            self.sock.sendall(packFrame(frame_type, payload))
+        finally:
+            self.sock.setblocking(False)
+
+    def receiveFrames(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            if not data:
+                self.is_open = False
+                break
+            self.stream_buffer += data
+
+        frames, self.stream_buffer = unpackFrames(self.stream_buffer)
+        for frame_type, payload in frames:
+            self.handleFrame(frame_type, payload)
+
+
+class PortHandlerUDP(PortHandlerNetwork):
+    def connect(self, address):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.connect(address)
+        return sock
+
+    def sendFrame(self, frame_type, payload=b''):
+        self.sock.send(packFrame(frame_type, payload))
+
+    def receiveFrames(self):
+        while True:
+            try:
+                datagram = self.sock.recv(65536)
+            except (BlockingIOError, ConnectionRefusedError):
+                break
+            frames, _ = unpackFrames(datagram)
+            for frame_type, payload in frames:
+                self.handleFrame(frame_type, payload)
@@ -21,15 +21,15 @@ from launch.actions import DeclareLaunchArgument
 from launch.actions import ExecuteProcess
 from launch.actions import GroupAction
 from launch.actions import RegisterEventHandler
+from launch.conditions import IfCondition
 from launch.conditions import UnlessCondition
 from launch.event_handlers import OnProcessExit
-from launch.substitutions import Command
-from launch.substitutions import FindExecutable
 from launch.substitutions import LaunchConfiguration
 from launch.substitutions import PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.actions import PushRosNamespace
 from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.robot_description import RobotDescription
 
 
 def generate_launch_description():
@@ -65,9 +65,21 @@ def generate_launch_description():
             default_value='omx_l',
             description='Type of ros2_control',
         ),
+        DeclareLaunchArgument(
+            'start_hardware',
+            default_value='true',
+            description='Whether to start the hardware and robot_state_publisher',
+        ),
+        DeclareLaunchArgument(
+            'start_controllers',
+            default_value='true',
+            description='Whether to spawn the controllers',
+        ),
     ]
 
     # Launch configurations
+    start_hardware = LaunchConfiguration('start_hardware')
+    start_controllers = LaunchConfiguration('start_controllers')
     prefix = LaunchConfiguration('prefix')
     use_sim = LaunchConfiguration('use_sim')
     use_mock_hardware = LaunchConfiguration('use_mock_hardware')
@@ -75,35 +87,23 @@ def generate_launch_description():
     port_name = LaunchConfiguration('port_name')
     ros2_control_type = LaunchConfiguration('ros2_control_type')
 
-    # Generate URDF file using xacro
-    urdf_file = Command([
-        PathJoinSubstitution([FindExecutable(name='xacro')]),
-        ' ',
+    # Generate URDF file using xacro, cached between launches
+    urdf_file = RobotDescription(
         PathJoinSubstitution([
             FindPackageShare('open_manipulator_description'),
             'urdf',
             'omx_l',
             'omx_l.urdf.xacro',
         ]),
-        ' ',
-        'prefix:=',
-        prefix,
-        ' ',
-        'use_sim:=',
-        use_sim,
-        ' ',
-        'use_mock_hardware:=',
-        use_mock_hardware,
-        ' ',
-        'mock_sensor_commands:=',
-        mock_sensor_commands,
-        ' ',
-        'port_name:=',
-        port_name,
-        ' ',
-        'ros2_control_type:=',
-        ros2_control_type,
-    ])
+        {
+            'prefix': prefix,
+            'use_sim': use_sim,
+            'use_mock_hardware': use_mock_hardware,
+            'mock_sensor_commands': mock_sensor_commands,
+            'port_name': port_name,
+            'ros2_control_type': ros2_control_type,
+        },
+    )
 
     # Paths for configuration files
     controller_manager_config = PathJoinSubstitution([
@@ -166,10 +166,20 @@ def generate_launch_description():
     leader_with_namespace = GroupAction(
         actions=[
             PushRosNamespace('leader'),
-            control_node,
-            robot_controller_spawner,
-            robot_state_publisher_node,
-            delay_position_command_after_controllers,
+            GroupAction(
+                condition=IfCondition(start_hardware),
+                actions=[
+                    control_node,
+                    robot_state_publisher_node,
+                ],
+            ),
+            GroupAction(
+                condition=IfCondition(start_controllers),
+                actions=[
+                    robot_controller_spawner,
+                    delay_position_command_after_controllers,
+                ],
+            ),
         ]
     )
 
@@ -18,88 +18,9 @@
 
 """Launch file for AI teleoperation of OMY L100 for leader, OMY F3M for follower."""
 
-from launch import LaunchDescription
-from launch.actions import ExecuteProcess
-from launch.actions import LogInfo
-from launch.actions import RegisterEventHandler
-from launch.event_handlers import OnProcessExit
-from launch.event_handlers import OnProcessStart
-from launch.substitutions import PathJoinSubstitution
-from launch_ros.actions import Node
-from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.ai_launch import generate_ai_launch_description
 
 
 def generate_launch_description():
     """Generate launch description for AI teleoperation."""
-    # Step 1: Start follower launch file
-    start_follower = ExecuteProcess(
-        cmd=[
-            'ros2',
-            'launch',
-            'open_manipulator_bringup',
-            'omy_f3m_follower_ai.launch.py',
-        ],
-        output='screen',
-    )
-
-    # Step 2: Run the joint trajectory executor for the follower
-    trajectory_params_file = PathJoinSubstitution([
-        FindPackageShare('open_manipulator_bringup'),
-        'config',
-        'omy_f3m_follower_ai',
-        'initial_positions.yaml',
-    ])
-
-    joint_trajectory_executor = Node(
-        package='open_manipulator_bringup',
-        executable='joint_trajectory_executor',
-        parameters=[trajectory_params_file],
-        output='screen',
-    )
-
-    # Step 3: Start leader launch file
-    start_leader = ExecuteProcess(
-        cmd=[
-            'ros2',
-            'launch',
-            'open_manipulator_bringup',
-            'omy_l100_leader_ai.launch.py',
-        ],
-        output='screen',
-        shell=True,
-    )
-
-    return LaunchDescription([
-        LogInfo(msg='Starting omy_f3m_follower_ai.launch.py...'),
-        start_follower,
-        # Step 2: Ensure joint_trajectory_executor starts after start_follower
-        RegisterEventHandler(
-            OnProcessStart(
-                target_action=start_follower,
-                on_start=[
-                    LogInfo(
-                        msg=(
-                            '✅ omy_f3m_follower_ai.launch.py has fully started. '
-                            'Running joint_trajectory_executor...'
-                        )
-                    ),
-                    joint_trajectory_executor,
-                ],
-            )
-        ),
-        # Step 3: Ensure start_leader starts after joint_trajectory_executor
-        RegisterEventHandler(
-            OnProcessExit(
-                target_action=joint_trajectory_executor,
-                on_exit=[
-                    LogInfo(
-                        msg=(
-                            '✅ joint_trajectory_executor has completed. '
-                            'Starting omy_l100_leader_ai.launch.py...'
-                        )
-                    ),
-                    start_leader,
-                ],
-            )
-        ),
-    ])
+    return generate_ai_launch_description('omy_f3m_follower_ai', 'omy_l100_leader_ai')
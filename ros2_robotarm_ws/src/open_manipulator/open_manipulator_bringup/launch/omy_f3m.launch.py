@@ -22,12 +22,11 @@ from launch.actions import RegisterEventHandler
 from launch.conditions import IfCondition
 from launch.conditions import UnlessCondition
 from launch.event_handlers import OnProcessExit
-from launch.substitutions import Command
-from launch.substitutions import FindExecutable
 from launch.substitutions import LaunchConfiguration
 from launch.substitutions import PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.robot_description import RobotDescription
 
 
 def generate_launch_description():
@@ -83,32 +82,22 @@ def generate_launch_description():
     ros2_control_type = LaunchConfiguration('ros2_control_type')
     init_position_file = LaunchConfiguration('init_position_file')
 
-    # Generate URDF file using xacro
-    urdf_file = Command([
-        PathJoinSubstitution([FindExecutable(name='xacro')]),
-        ' ',
+    # Generate URDF file using xacro, cached between launches
+    urdf_file = RobotDescription(
         PathJoinSubstitution([
             FindPackageShare('open_manipulator_description'),
             'urdf',
             'omy_f3m',
             'omy_f3m.urdf.xacro',
         ]),
-        ' ',
-        'prefix:=',
-        prefix,
-        ' ',
-        'use_sim:=',
-        use_sim,
-        ' ',
-        'use_mock_hardware:=',
-        use_mock_hardware,
-        ' ',
-        'mock_sensor_commands:=',
-        mock_sensor_commands,
-        ' ',
-        'ros2_control_type:=',
-        ros2_control_type,
-    ])
+        {
+            'prefix': prefix,
+            'use_sim': use_sim,
+            'use_mock_hardware': use_mock_hardware,
+            'mock_sensor_commands': mock_sensor_commands,
+            'ros2_control_type': ros2_control_type,
+        },
+    )
 
     # Paths for configuration files
     controller_manager_config = PathJoinSubstitution([
@@ -162,7 +151,10 @@ def generate_launch_description():
     joint_trajectory_executor = Node(
         package='open_manipulator_bringup',
         executable='joint_trajectory_executor',
-        parameters=[trajectory_params_file],
+        parameters=[
+            trajectory_params_file,
+            {'controller_config_file': controller_manager_config},
+        ],
         output='both',
         condition=IfCondition(init_position),
     )
@@ -25,9 +25,10 @@ from launch.actions import DeclareLaunchArgument, IncludeLaunchDescription
 from launch.actions import RegisterEventHandler, SetEnvironmentVariable
 from launch.event_handlers import OnProcessExit
 from launch.launch_description_sources import PythonLaunchDescriptionSource
-from launch.substitutions import Command, FindExecutable, LaunchConfiguration, PathJoinSubstitution
+from launch.substitutions import LaunchConfiguration, PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.robot_description import RobotDescription
 
 
 def generate_launch_description():
@@ -69,20 +70,17 @@ def generate_launch_description():
                 ]
              )
 
-    robot_description_content = Command([
-        PathJoinSubstitution([FindExecutable(name='xacro')]),
-        ' ',
+    robot_description_content = RobotDescription(
         PathJoinSubstitution([FindPackageShare('open_manipulator_description'),
                               'urdf',
                               model,
                               'omy_f3m.urdf.xacro']),
-        ' ',
-        'model:=', model,
-        ' ',
-        'use_sim:=true',
-        ' ',
-        'config_type:=omy_f3m_follower_ai'
-    ])
+        {
+            'model': model,
+            'use_sim': 'true',
+            'config_type': 'omy_f3m_follower_ai',
+        },
+    )
 
     robot_description = {'robot_description': robot_description_content}
 
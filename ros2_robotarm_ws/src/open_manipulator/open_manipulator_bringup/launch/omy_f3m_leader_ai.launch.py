@@ -19,14 +19,14 @@
 from launch import LaunchDescription
 from launch.actions import DeclareLaunchArgument
 from launch.actions import GroupAction
+from launch.conditions import IfCondition
 from launch.conditions import UnlessCondition
-from launch.substitutions import Command
-from launch.substitutions import FindExecutable
 from launch.substitutions import LaunchConfiguration
 from launch.substitutions import PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.actions import PushRosNamespace
 from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.robot_description import RobotDescription
 
 
 def generate_launch_description():
@@ -57,41 +57,43 @@ def generate_launch_description():
             default_value='omy_f3m_current',
             description='Type of ros2_control',
         ),
+        DeclareLaunchArgument(
+            'start_hardware',
+            default_value='true',
+            description='Whether to start the hardware and robot_state_publisher',
+        ),
+        DeclareLaunchArgument(
+            'start_controllers',
+            default_value='true',
+            description='Whether to spawn the controllers',
+        ),
     ]
 
     # Launch configurations
+    start_hardware = LaunchConfiguration('start_hardware')
+    start_controllers = LaunchConfiguration('start_controllers')
     prefix = LaunchConfiguration('prefix')
     use_sim = LaunchConfiguration('use_sim')
     use_mock_hardware = LaunchConfiguration('use_mock_hardware')
     mock_sensor_commands = LaunchConfiguration('mock_sensor_commands')
     ros2_control_type = LaunchConfiguration('ros2_control_type')
 
-    # Generate URDF file using xacro
-    urdf_file = Command([
-        PathJoinSubstitution([FindExecutable(name='xacro')]),
-        ' ',
+    # Generate URDF file using xacro, cached between launches
+    urdf_file = RobotDescription(
         PathJoinSubstitution([
             FindPackageShare('open_manipulator_description'),
             'urdf',
             'omy_f3m',
             'omy_f3m.urdf.xacro',
         ]),
-        ' ',
-        'prefix:=',
-        prefix,
-        ' ',
-        'use_sim:=',
-        use_sim,
-        ' ',
-        'use_mock_hardware:=',
-        use_mock_hardware,
-        ' ',
-        'mock_sensor_commands:=',
-        mock_sensor_commands,
-        ' ',
-        'ros2_control_type:=',
-        ros2_control_type,
-    ])
+        {
+            'prefix': prefix,
+            'use_sim': use_sim,
+            'use_mock_hardware': use_mock_hardware,
+            'mock_sensor_commands': mock_sensor_commands,
+            'ros2_control_type': ros2_control_type,
+        },
+    )
 
     # Paths for configuration files
     controller_manager_config = PathJoinSubstitution([
@@ -132,9 +134,19 @@ def generate_launch_description():
     leader_with_namespace = GroupAction(
         actions=[
             PushRosNamespace('leader'),
-            control_node,
-            robot_controller_spawner,
-            robot_state_publisher_node,
+            GroupAction(
+                condition=IfCondition(start_hardware),
+                actions=[
+                    control_node,
+                    robot_state_publisher_node,
+                ],
+            ),
+            GroupAction(
+                condition=IfCondition(start_controllers),
+                actions=[
+                    robot_controller_spawner,
+                ],
+            ),
         ]
     )
 
@@ -22,13 +22,12 @@ from launch.actions import GroupAction
 from launch.actions import IncludeLaunchDescription
 from launch.conditions import IfCondition, UnlessCondition
 from launch.launch_description_sources import PythonLaunchDescriptionSource
-from launch.substitutions import Command
-from launch.substitutions import FindExecutable
 from launch.substitutions import LaunchConfiguration
 from launch.substitutions import PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.actions import PushRosNamespace
 from launch_ros.substitutions import FindPackageShare
+from open_manipulator_bringup.robot_description import RobotDescription
 
 
 def generate_launch_description():
@@ -69,9 +68,21 @@ def generate_launch_description():
             default_value='omy_l100_current',
             description='Type of ros2_control',
         ),
+        DeclareLaunchArgument(
+            'start_hardware',
+            default_value='true',
+            description='Whether to start the hardware and robot_state_publisher',
+        ),
+        DeclareLaunchArgument(
+            'start_controllers',
+            default_value='true',
+            description='Whether to spawn the controllers',
+        ),
     ]
 
     # Launch configurations
+    start_hardware = LaunchConfiguration('start_hardware')
+    start_controllers = LaunchConfiguration('start_controllers')
     prefix = LaunchConfiguration('prefix')
     use_self_collision_avoidance = LaunchConfiguration('use_self_collision_avoidance')
     use_sim = LaunchConfiguration('use_sim')
@@ -80,35 +91,23 @@ def generate_launch_description():
     port_name = LaunchConfiguration('port_name')
     ros2_control_type = LaunchConfiguration('ros2_control_type')
 
-    # Generate URDF file using xacro
-    urdf_file = Command([
-        PathJoinSubstitution([FindExecutable(name='xacro')]),
-        ' ',
+    # Generate URDF file using xacro, cached between launches
+    urdf_file = RobotDescription(
         PathJoinSubstitution([
             FindPackageShare('open_manipulator_description'),
             'urdf',
             'omy_l100',
             'omy_l100.urdf.xacro',
         ]),
-        ' ',
-        'prefix:=',
-        prefix,
-        ' ',
-        'use_sim:=',
-        use_sim,
-        ' ',
-        'use_mock_hardware:=',
-        use_mock_hardware,
-        ' ',
-        'mock_sensor_commands:=',
-        mock_sensor_commands,
-        ' ',
-        'port_name:=',
-        port_name,
-        ' ',
-        'ros2_control_type:=',
-        ros2_control_type,
-    ])
+        {
+            'prefix': prefix,
+            'use_sim': use_sim,
+            'use_mock_hardware': use_mock_hardware,
+            'mock_sensor_commands': mock_sensor_commands,
+            'port_name': port_name,
+            'ros2_control_type': ros2_control_type,
+        },
+    )
 
     # Paths for configuration files
     controller_manager_config = PathJoinSubstitution([
@@ -159,10 +158,20 @@ def generate_launch_description():
     leader_with_namespace = GroupAction(
         actions=[
             PushRosNamespace('leader'),
-            control_node,
-            robot_controller_spawner,
-            robot_state_publisher_node,
-            self_collision_launch,
+            GroupAction(
+                condition=IfCondition(start_hardware),
+                actions=[
+                    control_node,
+                    robot_state_publisher_node,
+                    self_collision_launch,
+                ],
+            ),
+            GroupAction(
+                condition=IfCondition(start_controllers),
+                actions=[
+                    robot_controller_spawner,
+                ],
+            ),
         ]
     )
 
@@ -29,7 +29,7 @@ from launch.event_handlers import OnProcessExit
 from launch.launch_description_sources import PythonLaunchDescriptionSource
 from launch.substitutions import LaunchConfiguration
 from launch_ros.actions import Node
-import xacro
+from open_manipulator_bringup.robot_description import get_robot_description
 
 
 def generate_launch_description():
@@ -74,9 +74,7 @@ def generate_launch_description():
         'open_manipulator_x.urdf.xacro',
     )
 
-    doc = xacro.process_file(xacro_file, mappings={'use_sim': 'true'})
-
-    robot_desc = doc.toprettyxml(indent='  ')
+    robot_desc = get_robot_description(xacro_file, {'use_sim': 'true'})
 
     params = {'robot_description': robot_desc}
 
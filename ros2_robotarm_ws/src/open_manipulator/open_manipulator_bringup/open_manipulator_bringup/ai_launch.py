@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Launch description shared by the leader/follower AI teleoperation launch files."""
+
+import time
+
+from launch import LaunchDescription
+from launch.actions import GroupAction
+from launch.actions import IncludeLaunchDescription
+from launch.actions import LogInfo
+from launch.actions import OpaqueFunction
+from launch.actions import RegisterEventHandler
+from launch.actions import Shutdown
+from launch.event_handlers import OnProcessExit
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.substitutions import PathJoinSubstitution
+from launch_ros.actions import Node
+from launch_ros.substitutions import FindPackageShare
+
+FOLLOWER_CONTROLLERS = ['arm_controller', 'joint_state_broadcaster']
+LEADER_CONTROLLERS = ['joint_state_broadcaster', 'joint_trajectory_command_broadcaster']
+
+
+def include_launch(name, launch_arguments):
+    """Include a launch file of this package with its own launch configurations."""
+    # Leader and follower declare the same arguments with different defaults,
+    # so every include gets its own scope
+    return GroupAction(
+        actions=[
+            IncludeLaunchDescription(
+                PythonLaunchDescriptionSource(PathJoinSubstitution([
+                    FindPackageShare('open_manipulator_bringup'),
+                    'launch',
+                    f'{name}.launch.py',
+                ])),
+                launch_arguments=launch_arguments.items(),
+            )
+        ]
+    )
+
+
+def generate_ai_launch_description(follower, leader):
+    """
+    Generate launch description for AI teleoperation in a single launch process.
+
+    Both robots connect to their hardware in parallel. The follower moves to its
+    initial positions once its controllers are active and it publishes joint
+    states, then the leader controllers are started. The leader has to wait:
+    its joint_trajectory_command_broadcaster drives the follower.
+    """
+    start_time = time.time()
+    stage_times = []
+
+    def log_stage(stage):
+        def log(context):
+            elapsed = time.time() - start_time
+            stage_times.append((stage, elapsed))
+            return [LogInfo(msg=f'[startup +{elapsed:.2f} s] {stage}')]
+        return OpaqueFunction(function=log)
+
+    def log_timeline(context):
+        lines = [f'  +{elapsed:6.2f} s  {stage}' for stage, elapsed in stage_times]
+        return [LogInfo(msg='Startup timeline:\n' + '\n'.join(lines))]
+
+    def readiness_monitor(stage, namespace, controllers):
+        return Node(
+            package='open_manipulator_bringup',
+            executable='readiness_monitor',
+            name=f'{stage}_readiness_monitor',
+            parameters=[{
+                'stage': stage,
+                'controller_manager': f'{namespace}/controller_manager',
+                'controllers': controllers,
+                'joint_states_topic': f'{namespace}/joint_states',
+                'start_time': start_time,
+            }],
+            output='screen',
+        )
+
+    def when_ready(stage, actions):
+        def on_exit(event, context):
+            if event.returncode != 0:
+                return [
+                    LogInfo(msg=f'❌ {stage} did not become ready, shutting down'),
+                    Shutdown(reason=f'{stage} not ready'),
+                ]
+            return [log_stage(f'{stage} ready')] + actions
+        return on_exit
+
+    follower_monitor = readiness_monitor('follower', '', FOLLOWER_CONTROLLERS)
+    leader_monitor = readiness_monitor('leader', '/leader', LEADER_CONTROLLERS)
+
+    trajectory_params_file = PathJoinSubstitution([
+        FindPackageShare('open_manipulator_bringup'),
+        'config',
+        follower,
+        'initial_positions.yaml',
+    ])
+    controller_manager_config = PathJoinSubstitution([
+        FindPackageShare('open_manipulator_bringup'),
+        'config',
+        follower,
+        'hardware_controller_manager.yaml',
+    ])
+
+    joint_trajectory_executor = Node(
+        package='open_manipulator_bringup',
+        executable='joint_trajectory_executor',
+        parameters=[
+            trajectory_params_file,
+            {'controller_config_file': controller_manager_config},
+        ],
+        output='screen',
+    )
+
+    return LaunchDescription([
+        log_stage('launch started'),
+        LogInfo(msg=f'Starting {follower}.launch.py and {leader}.launch.py hardware...'),
+        # Step 1: Start both robots, the leader without its controllers
+        include_launch(follower, {}),
+        include_launch(leader, {'start_controllers': 'false'}),
+        follower_monitor,
+        # Step 2: Move the follower to its initial positions once it is ready
+        RegisterEventHandler(
+            OnProcessExit(
+                target_action=follower_monitor,
+                on_exit=when_ready('follower', [joint_trajectory_executor]),
+            )
+        ),
+        # Step 3: Start the leader controllers after the follower has arrived
+        RegisterEventHandler(
+            OnProcessExit(
+                target_action=joint_trajectory_executor,
+                on_exit=when_ready('follower initial positions', [
+                    include_launch(leader, {'start_hardware': 'false'}),
+                    leader_monitor,
+                ]),
+            )
+        ),
+        RegisterEventHandler(
+            OnProcessExit(
+                target_action=leader_monitor,
+                on_exit=when_ready('leader', [OpaqueFunction(function=log_timeline)]),
+            )
+        ),
+    ])
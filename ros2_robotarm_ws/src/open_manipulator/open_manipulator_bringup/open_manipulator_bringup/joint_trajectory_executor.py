@@ -18,9 +18,19 @@
 
 import math
 import sys
+import time
 
 from control_msgs.action import FollowJointTrajectory
 import numpy as np
+from open_manipulator_bringup.trajectory_cache import DEFAULT_MAX_ENTRIES
+from open_manipulator_bringup.trajectory_cache import DEFAULT_START_RESOLUTION
+from open_manipulator_bringup.trajectory_cache import get_timing
+from open_manipulator_bringup.trajectory_cache import shift_start
+from open_manipulator_bringup.trajectory_cache import TrajectoryCache
+from open_manipulator_bringup.trajectory_generator import create_trajectory
+from open_manipulator_bringup.trajectory_generator import get_durations
+from open_manipulator_bringup.trajectory_generator import get_joint_limits
+from open_manipulator_bringup.trajectory_generator import get_sampling_rate
 import rclpy
 from rclpy.action import ActionClient
 from rclpy.node import Node
@@ -40,10 +50,36 @@ class JointTrajectoryExecutor(Node):
         self.declare_parameter('step_names', [''])  # List of step names
         self.declare_parameter('duration', 10.0)
         self.declare_parameter('epsilon', 0.01)
+        # Trajectory points per second of motion, 0.0 sends one point per controller
+        # cycle, from the controller_manager update_rate in controller_config_file
+        self.declare_parameter('sampling_rate', 0.0)
+        self.declare_parameter('controller_config_file', '')
+        # Send all steps as one goal passing through them without stopping
+        self.declare_parameter('blend_waypoints', False)
+        # Joint limits, e.g. the MoveIt joint_limits.yaml, and/or per-joint arrays
+        # overriding it. Without limits every move takes `duration`.
+        self.declare_parameter('joint_limits_file', '')
+        self.declare_parameter('max_velocities', [0.0])
+        self.declare_parameter('max_accelerations', [0.0])
+        self.declare_parameter('velocity_scaling', 1.0)
+        self.declare_parameter('acceleration_scaling', 1.0)
+        # With limits: true uses the shortest feasible duration (at least min_duration)
+        # per move, false keeps `duration` and only stretches moves that need it
+        self.declare_parameter('time_optimal', False)
+        self.declare_parameter('min_duration', 0.5)
+        # Reuse generated trajectories from disk, see trajectory_cache. Entries are
+        # looked up by the start state rounded to start_resolution rad, and the
+        # trajectory is shifted to begin at the measured state.
+        self.declare_parameter('use_trajectory_cache', False)
+        self.declare_parameter('trajectory_cache_dir', '')
+        self.declare_parameter('start_resolution', DEFAULT_START_RESOLUTION)
+        self.declare_parameter('trajectory_cache_max_entries', DEFAULT_MAX_ENTRIES)
         self.declare_parameter(
             'action_topic', '/arm_controller/follow_joint_trajectory'
         )
         self.declare_parameter('joint_states_topic', '/joint_states')
+        # Max rate in Hz at which joint states are processed, 0.0 processes every message
+        self.declare_parameter('joint_states_rate_limit', 0.0)
 
         # Load basic parameters
         self.joint_names = (
@@ -54,8 +90,17 @@ class JointTrajectoryExecutor(Node):
         )
         self.duration = self.get_parameter('duration').value
         self.epsilon = self.get_parameter('epsilon').value
+        self.sampling_rate = get_sampling_rate(
+            self.get_parameter('sampling_rate').value,
+            self.get_parameter('controller_config_file').value,
+        )
+        self.blend_waypoints = self.get_parameter('blend_waypoints').value
+        self.time_optimal = self.get_parameter('time_optimal').value
+        self.min_duration = self.get_parameter('min_duration').value
         self.action_topic = self.get_parameter('action_topic').value
         self.joint_states_topic = self.get_parameter('joint_states_topic').value
+        rate_limit = self.get_parameter('joint_states_rate_limit').value
+        self.joint_states_period = 1.0 / rate_limit if rate_limit > 0.0 else 0.0
 
         # Validate basic parameters
         if not self.joint_names:
@@ -87,6 +132,19 @@ class JointTrajectoryExecutor(Node):
                     f'Expected {len(self.joint_names)}, got {len(pos)}'
                 )
                 sys.exit(1)
+        self.target_positions = np.array(self.positions_list)
+        self.max_velocities, self.max_accelerations = self.load_limits()
+        self.timing = get_timing(
+            self.duration, self.sampling_rate, self.max_velocities,
+            self.max_accelerations, self.min_duration, self.time_optimal
+        )
+        self.trajectory_cache = None
+        if self.get_parameter('use_trajectory_cache').value:
+            self.trajectory_cache = TrajectoryCache(
+                self.get_parameter('trajectory_cache_dir').value,
+                self.get_parameter('start_resolution').value,
+                self.get_parameter('trajectory_cache_max_entries').value,
+            )
 
         # Create action client for FollowJointTrajectory
         self.action_client = ActionClient(
@@ -98,8 +156,11 @@ class JointTrajectoryExecutor(Node):
 
         self.current_positions = None
         self.current_velocities = None
+        self.state_names = None  # msg.name the index below was built for
+        self.state_index = None  # position of each joint in msg.name
+        self.last_state_time = 0.0
+        self.goal_pending = False
         self.reached_target = False
-        self.num_points = 100  # Number of points for smooth trajectory
         self.goal_handle = None
         self.last_status_time = 0.0
         self.status_interval = 1.0  # Log status every second
@@ -110,16 +171,73 @@ class JointTrajectoryExecutor(Node):
         self.get_logger().info('Action server available')
         self.get_logger().info(f'Using action topic: {self.action_topic}')
         self.get_logger().info(f'Using joint states topic: {self.joint_states_topic}')
+        self.get_logger().info(f'Sampling rate: {self.sampling_rate:g} points/s')
+
+    def load_limits(self):
+        max_velocities, max_accelerations = get_joint_limits(
+            self.joint_names,
+            self.get_parameter('joint_limits_file').value,
+            self.get_parameter('max_velocities').value,
+            self.get_parameter('max_accelerations').value,
+            self.get_parameter('velocity_scaling').value,
+            self.get_parameter('acceleration_scaling').value,
+        )
+        if max_velocities is None:
+            if self.time_optimal:
+                self.get_logger().warn('time_optimal needs joint limits, using duration')
+            return None, None
+
+        self.get_logger().info(
+            f'Joint limits: velocity {max_velocities.tolist()}, '
+            f'acceleration {max_accelerations.tolist()}'
+        )
+        return max_velocities, max_accelerations
+
+    def get_durations(self, waypoints):
+        durations = get_durations(
+            waypoints, self.duration, self.max_velocities, self.max_accelerations,
+            self.min_duration, self.time_optimal
+        )
+        if self.max_velocities is not None:
+            self.get_logger().info(f'Segment durations: {[round(d, 3) for d in durations]}')
+        return durations
+
+    def get_cache_start_positions(self, start_positions):
+        # A finished step is within epsilon of its target, so the next move starts
+        # from the target itself and always maps to the same cache entry
+        if self.current_step > 0:
+            previous_positions = self.target_positions[self.current_step - 1]
+            if np.all(np.abs(start_positions - previous_positions) < self.epsilon):
+                start_positions = previous_positions
+        return self.trajectory_cache.quantize(start_positions)
+
+    def generate_trajectory(self, waypoints):
+        if self.trajectory_cache is None:
+            return create_trajectory(waypoints, self.get_durations(waypoints), self.sampling_rate)
+
+        # Entries are generated from the rounded start, so they are the same for every
+        # start state that maps to them
+        cache_waypoints = [self.get_cache_start_positions(waypoints[0])] + list(waypoints[1:])
+        key = self.trajectory_cache.get_key(self.joint_names, cache_waypoints, self.timing)
+        trajectory = self.trajectory_cache.load(key)
+        if trajectory is not None:
+            self.get_logger().info(f'Using cached trajectory {key[:12]}')
+        else:
+            trajectory = create_trajectory(
+                cache_waypoints, self.get_durations(cache_waypoints), self.sampling_rate
+            )
+            try:
+                self.trajectory_cache.save(key, *trajectory)
+            except OSError as e:
+                self.get_logger().warn(f'Failed to cache trajectory: {e}')
+        return shift_start(trajectory, waypoints[0])
 
     def get_step_target_positions(self):
         return self.positions_list[self.current_step]
 
     def check_step_completion(self):
-        target_positions = self.get_step_target_positions()
-        return all(
-            abs(curr - target) < self.epsilon
-            for curr, target in zip(self.current_positions, target_positions)
-        )
+        target_positions = self.target_positions[self.current_step]
+        return bool(np.all(np.abs(self.current_positions - target_positions) < self.epsilon))
 
     def feedback_callback(self, feedback_msg):
         feedback = feedback_msg.feedback
@@ -127,6 +245,7 @@ class JointTrajectoryExecutor(Node):
 
     def goal_response_callback(self, future):
         goal_handle = future.result()
+        self.goal_pending = False
         if not goal_handle.accepted:
             self.get_logger().info('Goal rejected :(')
             return
@@ -134,27 +253,53 @@ class JointTrajectoryExecutor(Node):
         self.get_logger().info('Goal accepted :)')
         self.goal_handle = goal_handle
 
+    def update_state_index(self, names):
+        self.state_names = list(names)
+        index = {name: i for i, name in enumerate(self.state_names)}
+        if all(j in index for j in self.joint_names):
+            self.state_index = np.array([index[j] for j in self.joint_names])
+        else:
+            self.state_index = None
+
     def joint_state_callback(self, msg):
-        if set(self.joint_names).issubset(set(msg.name)):
-            self.current_positions = [
-                msg.position[msg.name.index(j)] for j in self.joint_names
-            ]
-            self.current_velocities = [
-                msg.velocity[msg.name.index(j)] for j in self.joint_names
-            ]
+        if self.joint_states_period > 0.0:
+            now = time.monotonic()
+            if now - self.last_state_time < self.joint_states_period:
+                return
+            self.last_state_time = now
+
+        # The name order rarely changes, so the index is only rebuilt when it does
+        if msg.name != self.state_names:
+            self.update_state_index(msg.name)
+
+        if self.state_index is not None:
+            self.current_positions = np.asarray(msg.position)[self.state_index]
+            if len(msg.velocity) == len(msg.name):
+                self.current_velocities = np.asarray(msg.velocity)[self.state_index]
 
             # Check if current step has reached its target
-            if self.goal_handle is None:
+            if self.goal_handle is None and not self.goal_pending:
                 if self.current_step < len(self.positions_list):
-                    target_positions = self.get_step_target_positions()
-                    self.get_logger().info(
-                        f'Moving to step {self.current_step} target positions'
-                    )
-
                     goal_msg = FollowJointTrajectory.Goal()
-                    goal_msg.trajectory = self.create_smooth_trajectory(
-                        self.current_positions, target_positions
-                    )
+                    if self.blend_waypoints:
+                        self.get_logger().info(
+                            f'Moving through steps {self.current_step} to '
+                            f'{len(self.positions_list) - 1} in one trajectory'
+                        )
+                        goal_msg.trajectory = self.create_blended_trajectory(
+                            self.current_positions,
+                            self.positions_list[self.current_step:],
+                        )
+                        # Only the last step has to be reached before the sequence is done
+                        self.current_step = len(self.positions_list) - 1
+                    else:
+                        target_positions = self.get_step_target_positions()
+                        self.get_logger().info(
+                            f'Moving to step {self.current_step} target positions'
+                        )
+                        goal_msg.trajectory = self.create_smooth_trajectory(
+                            self.current_positions, target_positions
+                        )
 
                     goal_msg.path_tolerance = []
                     goal_msg.goal_tolerance = []
@@ -162,6 +307,7 @@ class JointTrajectoryExecutor(Node):
                     goal_msg.goal_time_tolerance.nanosec = 0
 
                     self.get_logger().info('Sending goal...')
+                    self.goal_pending = True
                     self._send_goal_future = self.action_client.send_goal_async(
                         goal_msg, feedback_callback=self.feedback_callback
                     )
@@ -174,7 +320,7 @@ class JointTrajectoryExecutor(Node):
                     return
 
             # Check if current step has reached its target
-            if self.check_step_completion():
+            if not self.goal_pending and self.check_step_completion():
                 if not self.reached_target:
                     self.reached_target = True
                     self.get_logger().info(f'🎯 Step {self.current_step} completed!')
@@ -196,53 +342,33 @@ class JointTrajectoryExecutor(Node):
         traj = JointTrajectory()
         traj.joint_names = self.joint_names
 
-        times = np.linspace(0, self.duration, self.num_points)
-
-        for i in range(self.num_points):
-            point = JointTrajectoryPoint()
-            t = times[i]
-
-            # Quintic polynomial coefficients
-            t_norm = t / self.duration
-            t_norm2 = t_norm * t_norm
-            t_norm3 = t_norm2 * t_norm
-            t_norm4 = t_norm3 * t_norm
-            t_norm5 = t_norm4 * t_norm
-
-            # Quintic polynomial coefficients for position
-            pos_coeff = 10 * t_norm3 - 15 * t_norm4 + 6 * t_norm5
-
-            # Velocity coefficients (derivative of position)
-            vel_coeff = (30 * t_norm2 - 60 * t_norm3 + 30 * t_norm4) / self.duration
-
-            # Acceleration coefficients (derivative of velocity)
-            acc_coeff = (60 * t_norm - 180 * t_norm2 + 120 * t_norm3) / (
-                self.duration * self.duration
-            )
-
-            positions = []
-            velocities = []
-            accelerations = []
-
-            for j in range(len(self.joint_names)):
-                pos = start_pos[j] + (end_pos[j] - start_pos[j]) * pos_coeff
-                vel = (end_pos[j] - start_pos[j]) * vel_coeff
-                acc = (end_pos[j] - start_pos[j]) * acc_coeff
-
-                positions.append(pos)
-                velocities.append(vel)
-                accelerations.append(acc)
-
-            point.positions = positions
-            point.velocities = velocities
-            point.accelerations = accelerations
-            point.time_from_start.sec = int(times[i])
-            point.time_from_start.nanosec = int((times[i] % 1) * 1e9)
+        times, positions, velocities, accelerations = self.generate_trajectory(
+            [start_pos, end_pos]
+        )
+        traj.points = self.make_points(times, positions, velocities, accelerations)
+        return traj
 
-            traj.points.append(point)
+    def create_blended_trajectory(self, start_pos, step_positions):
+        traj = JointTrajectory()
+        traj.joint_names = self.joint_names
 
+        times, positions, velocities, accelerations = self.generate_trajectory(
+            [start_pos] + list(step_positions)
+        )
+        traj.points = self.make_points(times, positions, velocities, accelerations)
         return traj
 
+    def make_points(self, times, positions, velocities, accelerations):
+        points = []
+        for t, pos, vel, acc in zip(
+            times.tolist(), positions.tolist(), velocities.tolist(), accelerations.tolist()
+        ):
+            point = JointTrajectoryPoint(positions=pos, velocities=vel, accelerations=acc)
+            point.time_from_start.sec = int(t)
+            point.time_from_start.nanosec = int((t % 1) * 1e9)
+            points.append(point)
+        return points
+
 
 def main(args=None):
     rclpy.init(args=args)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import time
+
+from controller_manager_msgs.srv import ListControllers
+import rclpy
+from rclpy.node import Node
+from sensor_msgs.msg import JointState
+
+
+class ReadinessMonitor(Node):
+    """Node that exits once the controllers are active and joint states arrive."""
+
+    def __init__(self):
+        super().__init__('readiness_monitor')
+
+        # Declare parameters
+        self.declare_parameter('stage', 'robot')  # Name used in the log
+        self.declare_parameter('controller_manager', '/controller_manager')
+        self.declare_parameter('controllers', [''])  # Controllers that have to be active
+        self.declare_parameter('joint_states_topic', '/joint_states')
+        # Wall time the launch started at, 0.0 measures from the start of this node
+        self.declare_parameter('start_time', 0.0)
+        self.declare_parameter('timeout', 60.0)
+        self.declare_parameter('poll_period', 0.2)
+
+        self.stage = self.get_parameter('stage').value
+        controller_manager = self.get_parameter('controller_manager').value
+        self.controllers = [
+            name for name in self.get_parameter('controllers').value if name
+        ]
+        joint_states_topic = self.get_parameter('joint_states_topic').value
+        self.start_time = self.get_parameter('start_time').value or time.time()
+        self.timeout = self.get_parameter('timeout').value
+
+        self.list_client = self.create_client(
+            ListControllers, f'{controller_manager}/list_controllers'
+        )
+        self.subscription = self.create_subscription(
+            JointState, joint_states_topic, self.joint_state_callback, 10
+        )
+        self.timer = self.create_timer(self.get_parameter('poll_period').value, self.poll)
+
+        self.list_future = None
+        self.event_times = {}
+        self.exit_code = None
+        self.deadline = time.time() + self.timeout
+
+        self.get_logger().info(
+            f'Waiting for {self.stage}: controllers {self.controllers} active on '
+            f'{controller_manager}, first message on {joint_states_topic}'
+        )
+
+    def mark(self, event):
+        if event not in self.event_times:
+            self.event_times[event] = time.time() - self.start_time
+            self.get_logger().info(f'{self.stage}: {event} (+{self.event_times[event]:.2f} s)')
+
+    def joint_state_callback(self, msg):
+        self.mark('first joint_states')
+
+    def list_callback(self, future):
+        self.list_future = None
+        result = future.result()
+        if result is None:
+            return
+
+        states = {controller.name: controller.state for controller in result.controller}
+        if all(states.get(name) == 'active' for name in self.controllers):
+            self.mark('controllers active')
+
+    def poll(self):
+        if self.exit_code is not None:
+            return
+
+        if 'controllers active' not in self.event_times:
+            if self.list_client.service_is_ready():
+                self.mark('controller_manager up')
+                if self.list_future is None:
+                    self.list_future = self.list_client.call_async(ListControllers.Request())
+                    self.list_future.add_done_callback(self.list_callback)
+        elif 'first joint_states' in self.event_times:
+            self.get_logger().info(
+                f'✅ {self.stage} ready after {max(self.event_times.values()):.2f} s'
+            )
+            self.exit_code = 0
+            return
+
+        if time.time() > self.deadline:
+            missing = [
+                event for event in ('controllers active', 'first joint_states')
+                if event not in self.event_times
+            ]
+            self.get_logger().error(
+                f'{self.stage} not ready after {self.timeout:.1f} s, waiting for {missing}'
+            )
+            self.exit_code = 1
+
+
+def main(args=None):
+    rclpy.init(args=args)
+    node = ReadinessMonitor()
+    while rclpy.ok() and node.exit_code is None:
+        rclpy.spin_once(node, timeout_sec=0.1)
+    exit_code = 1 if node.exit_code is None else node.exit_code
+    node.destroy_node()
+    rclpy.shutdown()
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Robot descriptions expanded from xacro once and cached on disk."""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shlex
+
+from launch import Substitution
+from launch.utilities import normalize_to_list_of_substitutions
+from launch.utilities import perform_substitutions
+
+# Bump when the cached output changes for the same inputs
+CACHE_VERSION = 1
+
+# Created substitutions and expanded files, used by the warm-up command
+_created_descriptions = []
+_expanded_files = []
+
+
+def get_cache_directory():
+    """Return the robot description cache directory under ROS_HOME."""
+    ros_home = os.environ.get('ROS_HOME', os.path.join(os.path.expanduser('~'), '.ros'))
+    return os.path.join(ros_home, 'robot_description_cache')
+
+
+def hash_file(file_name):
+    with open(file_name, 'rb') as infile:
+        return hashlib.sha256(infile.read()).hexdigest()
+
+
+def expand_xacro(xacro_file, mappings):
+    """Return the URDF expanded from xacro_file and every file it read."""
+    import xacro
+
+    # all_includes collects the included files, as used by `xacro --deps`
+    del xacro.all_includes[:]
+    doc = xacro.process_file(xacro_file, mappings=mappings)
+    dependencies = [xacro_file] + sorted(set(xacro.all_includes) - {xacro_file})
+    return doc.toprettyxml(indent='  '), dependencies
+
+
+def get_robot_description(xacro_file, mappings=None, cache_directory=None):
+    """
+    Return the URDF of xacro_file expanded with mappings, from the cache if valid.
+
+    Entries are named by a hash of the file name and mappings and store a hash
+    of every file the expansion read, so editing any of them regenerates it.
+    """
+    xacro_file = os.path.abspath(xacro_file)
+    mappings = {name: str(value) for name, value in (mappings or {}).items()}
+    cache_directory = cache_directory or get_cache_directory()
+    _expanded_files.append(xacro_file)
+
+    key = hashlib.sha256(json.dumps({
+        'version': CACHE_VERSION,
+        'xacro_file': xacro_file,
+        'mappings': mappings,
+    }, sort_keys=True).encode('utf-8')).hexdigest()
+    urdf_path = os.path.join(cache_directory, key + '.urdf')
+    dependencies_path = os.path.join(cache_directory, key + '.json')
+
+    try:
+        with open(dependencies_path, encoding='utf-8') as infile:
+            dependencies = json.load(infile)
+        if all(hash_file(name) == digest for name, digest in dependencies.items()):
+            with open(urdf_path, encoding='utf-8') as infile:
+                return infile.read()
+    except (OSError, ValueError):
+        pass
+
+    urdf, dependency_files = expand_xacro(xacro_file, mappings)
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        # The URDF is written first, so a complete dependency file means a complete entry
+        for path, content in (
+            (urdf_path, urdf),
+            (dependencies_path, json.dumps({name: hash_file(name) for name in dependency_files})),
+        ):
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as outfile:
+                outfile.write(content)
+            os.replace(temp_path, path)
+    except OSError:
+        pass  # A read-only cache only costs the expansion
+    return urdf
+
+
+class RobotDescription(Substitution):
+    """Substitution for the URDF of a xacro file, a cached replacement of `xacro` Command."""
+
+    def __init__(self, xacro_file, mappings=None):
+        super().__init__()
+        self.xacro_file = normalize_to_list_of_substitutions(xacro_file)
+        self.mappings = {
+            name: normalize_to_list_of_substitutions(value)
+            for name, value in (mappings or {}).items()
+        }
+        _created_descriptions.append(self)
+
+    def describe(self):
+        return 'RobotDescription({})'.format(
+            ' '.join(sub.describe() for sub in self.xacro_file)
+        )
+
+    def perform(self, context):
+        xacro_file = perform_substitutions(context, self.xacro_file)
+        mappings = {}
+        for name, value in self.mappings.items():
+            # Same quoting as on the xacro command line, so prefix '""' is empty
+            mappings[name] = ''.join(shlex.split(perform_substitutions(context, value)))
+        return get_robot_description(xacro_file, mappings)
+
+
+def warm_up(launch_file, launch_arguments):
+    """Expand every robot description of a launch file, return how many there are."""
+    from launch import LaunchContext
+    from launch.actions import DeclareLaunchArgument
+    from launch.launch_description_sources import get_launch_description_from_python_launch_file
+
+    del _created_descriptions[:]
+    del _expanded_files[:]
+    # Descriptions built with get_robot_description are already expanded here
+    description = get_launch_description_from_python_launch_file(launch_file)
+
+    context = LaunchContext()
+    for entity in description.entities:
+        if isinstance(entity, DeclareLaunchArgument) and entity.default_value is not None:
+            context.launch_configurations[entity.name] = perform_substitutions(
+                context, entity.default_value
+            )
+    context.launch_configurations.update(launch_arguments)
+
+    for robot_description in _created_descriptions:
+        robot_description.perform(context)
+    return len(_expanded_files)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Fill the robot description cache for bringup launch files.')
+    parser.add_argument('launch_files', nargs='*',
+                        help='launch files (default: every launch file of the package)')
+    parser.add_argument('--arg', action='append', default=[], metavar='NAME:=VALUE',
+                        help='launch argument to use instead of its default, can be repeated')
+    args = parser.parse_args(args)
+
+    launch_arguments = dict(argument.split(':=', 1) for argument in args.arg)
+    launch_files = args.launch_files
+    if not launch_files:
+        from ament_index_python.packages import get_package_share_directory
+        launch_directory = os.path.join(
+            get_package_share_directory('open_manipulator_bringup'), 'launch'
+        )
+        launch_files = sorted(glob.glob(os.path.join(launch_directory, '*.launch.py')))
+
+    for launch_file in launch_files:
+        try:
+            count = warm_up(launch_file, launch_arguments)
+        except Exception as e:
+            print(f'{os.path.basename(launch_file)}: failed ({e})')
+            continue
+        print(f'{os.path.basename(launch_file)}: {count} robot description(s)')
+    print(f'Cache directory: {get_cache_directory()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import time
+
+import numpy as np
+from open_manipulator_bringup.trajectory_cache import get_config_directory
+from open_manipulator_bringup.trajectory_cache import load_executor_params
+from open_manipulator_bringup.trajectory_generator import create_quintic_trajectory
+from open_manipulator_bringup.trajectory_generator import create_via_point_trajectory
+from open_manipulator_bringup.trajectory_generator import DEFAULT_SAMPLING_RATE
+from open_manipulator_bringup.trajectory_generator import fit_via_point_durations
+from open_manipulator_bringup.trajectory_generator import get_num_points
+from open_manipulator_bringup.trajectory_generator import get_segment_durations
+from open_manipulator_bringup.trajectory_generator import load_joint_limits
+
+DEFAULT_CONFIGS = [
+    os.path.join('omy_3m', 'initial_positions.yaml'),
+    os.path.join('omy_3m', 'pack_positions.yaml'),
+]
+
+# max_velocity / max_acceleration of the omy_3m MoveIt joint_limits.yaml
+DEFAULT_MAX_VELOCITY = 5.0
+DEFAULT_MAX_ACCELERATION = 5.0
+
+
+def load_sequence(file_name):
+    params = load_executor_params(file_name)
+    steps = np.array([params[name] for name in params['step_names']], dtype=float)
+    return params['joint_names'], steps, float(params.get('duration', 10.0))
+
+
+def time_generation(function, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000.0
+
+
+def benchmark(file_name, args):
+    joint_names, steps, duration = load_sequence(file_name)
+    if args.joint_limits:
+        max_velocities, max_accelerations = load_joint_limits(args.joint_limits, joint_names)
+    else:
+        max_velocities = np.full(len(joint_names), args.max_velocity)
+        max_accelerations = np.full(len(joint_names), args.max_acceleration)
+    max_velocities = max_velocities * args.velocity_scaling
+    max_accelerations = max_accelerations * args.acceleration_scaling
+
+    start = np.full(len(joint_names), args.start)
+    waypoints = np.vstack([start, steps])
+    rate = args.sampling_rate
+
+    def run_steps(durations):
+        for i, segment in enumerate(durations):
+            create_quintic_trajectory(
+                waypoints[i], waypoints[i + 1], segment, get_num_points(segment, rate))
+
+    fixed = [duration] * len(steps)
+    limited = get_segment_durations(
+        waypoints, max_velocities, max_accelerations, args.min_duration)
+    blended = fit_via_point_durations(waypoints, limited, max_velocities, max_accelerations)
+
+    print(f'{os.path.basename(os.path.dirname(file_name))}/{os.path.basename(file_name)}: '
+          f'{len(steps)} step(s), start at {args.start} rad')
+    rows = [
+        ('fixed duration', fixed, lambda: run_steps(fixed)),
+        ('limit-aware', limited, lambda: run_steps(limited)),
+        ('limit-aware, blended', blended,
+         lambda: create_via_point_trajectory(waypoints, blended, rate)),
+    ]
+    for name, durations, generate in rows:
+        # every separate step also waits for convergence before the next one
+        print(f'  {name:22s} motion {sum(durations):7.3f} s   '
+              f'generation {time_generation(generate):7.3f} ms')
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Compare total motion time of executor step sequences.')
+    parser.add_argument('configs', nargs='*',
+                        help='executor yaml files (default: omy_3m initial and pack positions)')
+    parser.add_argument('--joint-limits', default='', help='MoveIt joint_limits.yaml')
+    parser.add_argument('--max-velocity', type=float, default=DEFAULT_MAX_VELOCITY)
+    parser.add_argument('--max-acceleration', type=float, default=DEFAULT_MAX_ACCELERATION)
+    parser.add_argument('--velocity-scaling', type=float, default=1.0)
+    parser.add_argument('--acceleration-scaling', type=float, default=1.0)
+    parser.add_argument('--min-duration', type=float, default=0.5)
+    parser.add_argument('--sampling-rate', type=float, default=DEFAULT_SAMPLING_RATE)
+    parser.add_argument('--start', type=float, default=0.0,
+                        help='position of every joint before the first step')
+    args = parser.parse_args(args)
+
+    configs = args.configs or [
+        os.path.join(get_config_directory(), config) for config in DEFAULT_CONFIGS
+    ]
+    for config in configs:
+        benchmark(config, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+from open_manipulator_bringup.trajectory_generator import create_trajectory
+from open_manipulator_bringup.trajectory_generator import get_durations
+from open_manipulator_bringup.trajectory_generator import get_joint_limits
+from open_manipulator_bringup.trajectory_generator import get_sampling_rate
+
+# Bump when the generated trajectories change for the same inputs
+CACHE_VERSION = 1
+
+# Start states are rounded to this many rad, the default executor epsilon
+DEFAULT_START_RESOLUTION = 0.01
+
+# Least recently used entries beyond this count are removed
+DEFAULT_MAX_ENTRIES = 256
+
+
+def get_default_cache_directory():
+    """Return the trajectory cache directory under ROS_HOME."""
+    ros_home = os.environ.get('ROS_HOME', os.path.join(os.path.expanduser('~'), '.ros'))
+    return os.path.join(ros_home, 'trajectory_cache')
+
+
+def get_config_directory():
+    """Return the config directory of the installed package, or of the source tree."""
+    try:
+        from ament_index_python.packages import get_package_share_directory
+        return os.path.join(get_package_share_directory('open_manipulator_bringup'), 'config')
+    except (ImportError, LookupError):
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config')
+
+
+def load_executor_params(file_name):
+    """Return the joint_trajectory_executor parameters of a yaml file, or None."""
+    import yaml
+
+    with open(file_name, encoding='utf-8') as infile:
+        data = yaml.safe_load(infile) or {}
+    return data.get('joint_trajectory_executor', {}).get('ros__parameters')
+
+
+def get_timing(duration, sampling_rate, max_velocities=None, max_accelerations=None,
+               min_duration=0.0, time_optimal=False):
+    """Return the timing parameters a cached trajectory depends on."""
+    return {
+        'duration': float(duration),
+        'sampling_rate': float(sampling_rate),
+        'max_velocities': None if max_velocities is None else max_velocities.tolist(),
+        'max_accelerations': None if max_accelerations is None else max_accelerations.tolist(),
+        'min_duration': float(min_duration),
+        'time_optimal': bool(time_optimal),
+    }
+
+
+def shift_start(trajectory, start_positions):
+    """
+    Return the trajectory moved to begin at start_positions, still ending where it did.
+
+    The start offset fades out along a rest-to-rest quintic blend over the whole
+    trajectory, so a single quintic move stays exact.
+    """
+    times, positions, velocities, accelerations = trajectory
+    offset = np.asarray(start_positions, dtype=float) - positions[0]
+    duration = float(times[-1])
+    t = (np.asarray(times, dtype=float) / duration)[:, None]
+    t2 = t * t
+    t3 = t2 * t
+    pos_coeff = 1.0 - (10.0 * t3 - 15.0 * t3 * t + 6.0 * t3 * t2)
+    vel_coeff = -(30.0 * t2 - 60.0 * t3 + 30.0 * t2 * t2) / duration
+    acc_coeff = -(60.0 * t - 180.0 * t2 + 120.0 * t3) / (duration * duration)
+    return (
+        times,
+        positions + pos_coeff * offset,
+        velocities + vel_coeff * offset,
+        accelerations + acc_coeff * offset,
+    )
+
+
+class TrajectoryCache:
+    """Generated trajectories stored as .npy files named by a hash of their inputs."""
+
+    def __init__(self, directory='', start_resolution=DEFAULT_START_RESOLUTION,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.directory = directory or get_default_cache_directory()
+        self.start_resolution = start_resolution
+        self.max_entries = max_entries
+
+    def quantize(self, positions):
+        """Return the center of the start-state bucket of positions."""
+        buckets = np.round(np.asarray(positions, dtype=float) / self.start_resolution)
+        return buckets * self.start_resolution
+
+    def get_key(self, joint_names, waypoints, timing):
+        waypoints = np.asarray(waypoints, dtype=float)
+        start_bucket = np.round(waypoints[0] / self.start_resolution).astype(int)
+        data = json.dumps({
+            'version': CACHE_VERSION,
+            'joint_names': list(joint_names),
+            'start_bucket': start_bucket.tolist(),
+            'steps': waypoints[1:].tolist(),
+            'timing': timing,
+        }, sort_keys=True)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.directory, key + '.npy')
+
+    def load(self, key):
+        """
+        Return times, positions, velocities and accelerations, or None if not cached.
+
+        The arrays are read-only views of a memory-mapped file.
+        """
+        path = self.get_path(key)
+        try:
+            data = np.load(path, mmap_mode='r')
+            # The modification time orders the entries for eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if data.ndim != 2 or (data.shape[1] - 1) % 3:
+            return None
+
+        num_joints = (data.shape[1] - 1) // 3
+        return (
+            data[:, 0],
+            data[:, 1:1 + num_joints],
+            data[:, 1 + num_joints:1 + 2 * num_joints],
+            data[:, 1 + 2 * num_joints:],
+        )
+
+    def save(self, key, times, positions, velocities, accelerations):
+        os.makedirs(self.directory, exist_ok=True)
+        data = np.column_stack([times, positions, velocities, accelerations])
+        path = self.get_path(key)
+        # Written under a temporary name so readers never map a partial file
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as outfile:
+            np.save(outfile, data)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def evict(self):
+        """Remove the least recently used entries beyond max_entries, 0 keeps all."""
+        if self.max_entries <= 0:
+            return
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.npy')):
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def get_sequence_waypoints(start, steps, blend_waypoints, cache):
+    """Return the waypoints of every goal the executor sends for a step sequence."""
+    if blend_waypoints:
+        return [[cache.quantize(start)] + list(steps)]
+    # Later steps start from the previous target, as the executor snaps them there
+    starts = [start] + list(steps[:-1])
+    return [[cache.quantize(step_start), step] for step_start, step in zip(starts, steps)]
+
+
+def prewarm(file_name, starts, cache):
+    """Generate the missing trajectories of one executor config, return (new, total)."""
+    params = load_executor_params(file_name)
+    if not params or not params.get('step_names'):
+        return 0, 0
+
+    joint_names = params['joint_names']
+    steps = np.array([params[name] for name in params['step_names']], dtype=float)
+    max_velocities, max_accelerations = get_joint_limits(
+        joint_names,
+        params.get('joint_limits_file', ''),
+        params.get('max_velocities', []),
+        params.get('max_accelerations', []),
+        params.get('velocity_scaling', 1.0),
+        params.get('acceleration_scaling', 1.0),
+    )
+    duration = params.get('duration', 10.0)
+    # The launch files pass the controller config next to the executor config
+    controller_config_file = params.get('controller_config_file') or os.path.join(
+        os.path.dirname(file_name), 'hardware_controller_manager.yaml'
+    )
+    if not os.path.exists(controller_config_file):
+        controller_config_file = ''
+    sampling_rate = get_sampling_rate(params.get('sampling_rate', 0.0), controller_config_file)
+    min_duration = params.get('min_duration', 0.5)
+    time_optimal = params.get('time_optimal', False)
+    timing = get_timing(
+        duration, sampling_rate, max_velocities, max_accelerations, min_duration, time_optimal
+    )
+
+    created = 0
+    total = 0
+    for start in starts:
+        if len(start) != len(joint_names):
+            continue
+        for waypoints in get_sequence_waypoints(
+            start, steps, params.get('blend_waypoints', False), cache
+        ):
+            total += 1
+            key = cache.get_key(joint_names, waypoints, timing)
+            if cache.load(key) is not None:
+                continue
+            durations = get_durations(
+                waypoints, duration, max_velocities, max_accelerations,
+                min_duration, time_optimal
+            )
+            cache.save(key, *create_trajectory(waypoints, durations, sampling_rate))
+            created += 1
+    return created, total
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Generate the joint trajectory executor cache for bringup configs.')
+    parser.add_argument('configs', nargs='*',
+                        help='executor yaml files (default: every *positions.yaml of the package)')
+    parser.add_argument('--cache-dir', default='', help='default: $ROS_HOME/trajectory_cache')
+    parser.add_argument('--start-resolution', type=float, default=DEFAULT_START_RESOLUTION)
+    parser.add_argument('--max-entries', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help='entries kept in the cache, 0 keeps all')
+    parser.add_argument('--start', type=float, nargs='+', action='append', default=[],
+                        help='start state before the first step, can be repeated '
+                             '(default: all zeros and the last step of every config)')
+    args = parser.parse_args(args)
+
+    configs = args.configs or sorted(
+        glob.glob(os.path.join(get_config_directory(), '*', '*positions.yaml'))
+    )
+    cache = TrajectoryCache(args.cache_dir, args.start_resolution, args.max_entries)
+
+    starts = args.start
+    if not starts:
+        # The robot usually starts at rest at zero or where another sequence ended
+        for config in configs:
+            params = load_executor_params(config)
+            if params and params.get('step_names'):
+                starts.append([0.0] * len(params['joint_names']))
+                starts.append(params[params['step_names'][-1]])
+    starts = list({tuple(start): start for start in starts}.values())
+
+    for config in configs:
+        created, total = prewarm(config, starts, cache)
+        print(f'{config}: {created} of {total} trajectories generated')
+    print(f'Cache directory: {cache.directory}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import lru_cache
+import math
+
+import numpy as np
+
+# Used without a sampling rate or controller update rate, 100 points for a 10 s move
+DEFAULT_SAMPLING_RATE = 10.0
+
+# Peak |velocity| * T / d and peak |acceleration| * T^2 / d of a rest-to-rest quintic
+QUINTIC_PEAK_VELOCITY = 1.875
+QUINTIC_PEAK_ACCELERATION = 5.7735
+
+# Sampling rate used when checking a blended trajectory against the limits
+LIMIT_CHECK_RATE = 100.0
+
+
+def load_controller_update_rate(file_name):
+    """Return the controller_manager update_rate of a ros2_control yaml file, or None."""
+    import yaml
+
+    # Like rcl, repeated keys such as '/**' are merged instead of the last one winning
+    def construct_mapping(loader, node):
+        mapping = {}
+        for key_node, value_node in node.value:
+            key = loader.construct_object(key_node, deep=True)
+            value = loader.construct_object(value_node, deep=True)
+            if isinstance(mapping.get(key), dict) and isinstance(value, dict):
+                mapping[key].update(value)
+            else:
+                mapping[key] = value
+        return mapping
+
+    class Loader(yaml.SafeLoader):
+        pass
+
+    Loader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_mapping)
+
+    with open(file_name, encoding='utf-8') as infile:
+        data = yaml.load(infile, Loader=Loader) or {}
+    # The controller_manager parameters may be nested under a node name wildcard
+    for scope in [data] + [value for value in data.values() if isinstance(value, dict)]:
+        update_rate = scope.get('controller_manager', {}).get('ros__parameters', {}).get(
+            'update_rate'
+        )
+        if update_rate:
+            return float(update_rate)
+    return None
+
+
+def get_sampling_rate(sampling_rate=0.0, controller_config_file=''):
+    """
+    Return the trajectory points per second.
+
+    A sampling_rate <= 0.0 gives one point per controller cycle, from the
+    update_rate of controller_config_file, or DEFAULT_SAMPLING_RATE without it.
+    """
+    if sampling_rate > 0.0:
+        return float(sampling_rate)
+    if controller_config_file:
+        update_rate = load_controller_update_rate(controller_config_file)
+        if update_rate:
+            return update_rate
+    return DEFAULT_SAMPLING_RATE
+
+
+def get_num_points(duration, sampling_rate=DEFAULT_SAMPLING_RATE):
+    """Return the number of trajectory points for a move of the given duration."""
+    return max(2, int(math.ceil(duration * sampling_rate - 1e-9)))
+
+
+@lru_cache(maxsize=64)
+def quintic_coefficients(duration, num_points):
+    """
+    Return times and the rest-to-rest quintic blend sampled at num_points.
+
+    The position, velocity and acceleration coefficients are multiplied by the
+    joint displacement to get the trajectory. The arrays are shared between
+    calls and are read-only.
+    """
+    times = np.linspace(0.0, duration, num_points)
+    t = times / duration
+    t2 = t * t
+    t3 = t2 * t
+    pos_coeff = 10.0 * t3 - 15.0 * t3 * t + 6.0 * t3 * t2
+    vel_coeff = (30.0 * t2 - 60.0 * t3 + 30.0 * t2 * t2) / duration
+    acc_coeff = (60.0 * t - 180.0 * t2 + 120.0 * t3) / (duration * duration)
+
+    for array in (times, pos_coeff, vel_coeff, acc_coeff):
+        array.flags.writeable = False
+    return times, pos_coeff, vel_coeff, acc_coeff
+
+
+def create_quintic_trajectory(start_pos, end_pos, duration, num_points):
+    """
+    Return times, positions, velocities and accelerations of a quintic move.
+
+    positions, velocities and accelerations have shape (num_points, joints).
+    """
+    start = np.asarray(start_pos, dtype=float)
+    delta = np.asarray(end_pos, dtype=float) - start
+    times, pos_coeff, vel_coeff, acc_coeff = quintic_coefficients(float(duration), int(num_points))
+
+    positions = start + np.outer(pos_coeff, delta)
+    velocities = np.outer(vel_coeff, delta)
+    accelerations = np.outer(acc_coeff, delta)
+    return times, positions, velocities, accelerations
+
+
+def get_via_velocities(waypoints, durations):
+    """
+    Return the velocity of every waypoint for a blended pass through them.
+
+    The trajectory starts and stops at rest. At a via point each joint keeps the
+    mean of the slopes of its two segments, or stops if the joint reverses there.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    slopes = np.diff(waypoints, axis=0) / np.asarray(durations, dtype=float)[:, None]
+    velocities = np.zeros_like(waypoints)
+    before = slopes[:-1]
+    after = slopes[1:]
+    velocities[1:-1] = np.where(np.sign(before) == np.sign(after), 0.5 * (before + after), 0.0)
+    return velocities
+
+
+def create_via_point_trajectory(waypoints, durations, sampling_rate=DEFAULT_SAMPLING_RATE):
+    """
+    Return times, positions, velocities and accelerations through all waypoints.
+
+    Each segment is a quintic that matches position, velocity and acceleration
+    at both ends, so the whole trajectory is continuous up to acceleration.
+    Via points are crossed with zero acceleration.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    via_velocities = get_via_velocities(waypoints, durations)
+
+    times = []
+    positions = []
+    velocities = []
+    accelerations = []
+    segment_start = 0.0
+    for i, duration in enumerate(durations):
+        duration = float(duration)
+        num_points = get_num_points(duration, sampling_rate)
+        tau = np.linspace(0.0, duration, num_points)
+        if i > 0:
+            tau = tau[1:]  # the first point repeats the end of the previous segment
+
+        p0, p1 = waypoints[i], waypoints[i + 1]
+        v0, v1 = via_velocities[i], via_velocities[i + 1]
+        h = p1 - p0
+        c3 = (20.0 * h - (8.0 * v1 + 12.0 * v0) * duration) / (2.0 * duration ** 3)
+        c4 = (-30.0 * h + (14.0 * v1 + 16.0 * v0) * duration) / (2.0 * duration ** 4)
+        c5 = (12.0 * h - 6.0 * (v1 + v0) * duration) / (2.0 * duration ** 5)
+
+        t1 = tau[:, None]
+        t2 = t1 * t1
+        t3 = t2 * t1
+        positions.append(p0 + v0 * t1 + c3 * t3 + c4 * t3 * t1 + c5 * t3 * t2)
+        velocities.append(v0 + 3.0 * c3 * t2 + 4.0 * c4 * t3 + 5.0 * c5 * t2 * t2)
+        accelerations.append(6.0 * c3 * t1 + 12.0 * c4 * t2 + 20.0 * c5 * t3)
+        times.append(segment_start + tau)
+        segment_start += duration
+
+    return (
+        np.concatenate(times),
+        np.concatenate(positions),
+        np.concatenate(velocities),
+        np.concatenate(accelerations),
+    )
+
+
+def load_joint_limits(file_name, joint_names):
+    """
+    Return max velocities and accelerations of joint_names from a joint_limits.yaml.
+
+    Joints without a limit, or with has_*_limits set to false, get inf.
+    """
+    import yaml
+
+    with open(file_name, encoding='utf-8') as infile:
+        limits = yaml.safe_load(infile).get('joint_limits', {})
+
+    max_velocities = np.full(len(joint_names), np.inf)
+    max_accelerations = np.full(len(joint_names), np.inf)
+    for i, name in enumerate(joint_names):
+        joint = limits.get(name, {})
+        if joint.get('has_velocity_limits', True) and 'max_velocity' in joint:
+            max_velocities[i] = joint['max_velocity']
+        if joint.get('has_acceleration_limits', True) and 'max_acceleration' in joint:
+            max_accelerations[i] = joint['max_acceleration']
+    return max_velocities, max_accelerations
+
+
+def get_joint_limits(joint_names, joint_limits_file='', max_velocities=(), max_accelerations=(),
+                     velocity_scaling=1.0, acceleration_scaling=1.0):
+    """
+    Return scaled max velocities and accelerations, or (None, None) without limits.
+
+    Per-joint max_velocities and max_accelerations override the limits file
+    when they have one value per joint; values <= 0.0 mean no limit.
+    """
+    limits = [np.full(len(joint_names), np.inf), np.full(len(joint_names), np.inf)]
+    if joint_limits_file:
+        limits = list(load_joint_limits(joint_limits_file, joint_names))
+
+    for i, values in enumerate((max_velocities, max_accelerations)):
+        if len(values) == len(joint_names):
+            limits[i][:] = [value if value > 0.0 else np.inf for value in values]
+
+    if np.all(np.isinf(limits[0])) and np.all(np.isinf(limits[1])):
+        return None, None
+    return limits[0] * velocity_scaling, limits[1] * acceleration_scaling
+
+
+def get_min_duration(start_pos, end_pos, max_velocities, max_accelerations):
+    """Return the shortest rest-to-rest quintic move that keeps every joint in its limits."""
+    distance = np.abs(np.asarray(end_pos, dtype=float) - np.asarray(start_pos, dtype=float))
+    velocity_time = QUINTIC_PEAK_VELOCITY * distance / max_velocities
+    acceleration_time = np.sqrt(QUINTIC_PEAK_ACCELERATION * distance / max_accelerations)
+    return float(max(np.max(velocity_time), np.max(acceleration_time)))
+
+
+def get_limit_ratio(velocities, accelerations, max_velocities, max_accelerations):
+    """
+    Return how much the trajectory has to be slowed down to respect the limits.
+
+    Stretching time by the ratio divides velocities by it and accelerations by
+    its square, so a ratio <= 1.0 means the trajectory is already feasible.
+    """
+    velocity_ratio = np.max(np.abs(velocities) / max_velocities)
+    acceleration_ratio = np.sqrt(np.max(np.abs(accelerations) / max_accelerations))
+    return float(max(velocity_ratio, acceleration_ratio))
+
+
+def get_segment_durations(waypoints, max_velocities, max_accelerations,
+                          min_duration=0.0, durations=None):
+    """
+    Return one duration per segment between waypoints.
+
+    Every segment takes at least its minimum feasible rest-to-rest time and
+    min_duration. If durations are given they are only stretched where the
+    limits require it.
+    """
+    waypoints = np.asarray(waypoints, dtype=float)
+    result = []
+    for i in range(len(waypoints) - 1):
+        duration = get_min_duration(
+            waypoints[i], waypoints[i + 1], max_velocities, max_accelerations)
+        if durations is not None:
+            duration = max(duration, durations[i])
+        result.append(max(duration, min_duration))
+    return result
+
+
+def fit_via_point_durations(waypoints, durations, max_velocities, max_accelerations):
+    """
+    Stretch via-point segment durations until the blended trajectory is feasible.
+
+    Via velocities scale with the segment times, so stretching every segment by
+    the limit ratio scales the whole trajectory uniformly and one pass suffices.
+    """
+    _, _, velocities, accelerations = create_via_point_trajectory(
+        waypoints, durations, LIMIT_CHECK_RATE)
+    ratio = get_limit_ratio(velocities, accelerations, max_velocities, max_accelerations)
+    if ratio <= 1.0:
+        return list(durations)
+    return [duration * ratio for duration in durations]
+
+
+def get_durations(waypoints, duration, max_velocities=None, max_accelerations=None,
+                  min_duration=0.0, time_optimal=False):
+    """
+    Return the segment durations the executor uses between waypoints.
+
+    Without limits every segment takes duration. With limits, time_optimal uses
+    the shortest feasible segments, otherwise duration is only stretched where
+    needed. Blended multi-segment trajectories are then fitted as a whole.
+    """
+    fixed = [duration] * (len(waypoints) - 1)
+    if max_velocities is None:
+        return fixed
+
+    durations = get_segment_durations(
+        waypoints, max_velocities, max_accelerations,
+        min_duration, None if time_optimal else fixed
+    )
+    if len(durations) > 1:
+        durations = fit_via_point_durations(
+            waypoints, durations, max_velocities, max_accelerations
+        )
+    return durations
+
+
+def create_trajectory(waypoints, durations, sampling_rate=DEFAULT_SAMPLING_RATE):
+    """Return times, positions, velocities and accelerations of a move through waypoints."""
+    if len(durations) == 1:
+        duration = float(durations[0])
+        return create_quintic_trajectory(
+            waypoints[0], waypoints[1], duration, get_num_points(duration, sampling_rate)
+        )
+    return create_via_point_trajectory(waypoints, durations, sampling_rate)
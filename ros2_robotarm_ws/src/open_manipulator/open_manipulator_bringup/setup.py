@@ -49,6 +49,10 @@ setup(
         'console_scripts': [
             'joint_trajectory_executor = open_manipulator_bringup.joint_trajectory_executor:main',
             'om_create_udev_rules = open_manipulator_bringup.om_create_udev_rules:main',
+            'readiness_monitor = open_manipulator_bringup.readiness_monitor:main',
+            'prewarm_trajectory_cache = open_manipulator_bringup.trajectory_cache:main',
+            'warm_robot_description_cache = open_manipulator_bringup.robot_description:main',
+            'trajectory_benchmark = open_manipulator_bringup.trajectory_benchmark:main',
         ],
     },
 )
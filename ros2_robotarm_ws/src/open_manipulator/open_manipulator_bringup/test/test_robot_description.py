@@ -0,0 +1,127 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+try:
+    from open_manipulator_bringup import robot_description
+except ImportError:
+    pytest.skip('needs the ROS 2 launch package', allow_module_level=True)
+
+
+@pytest.fixture
+def xacro_files(tmp_path, monkeypatch):
+    """Return a xacro file and its include, expanded by a stand-in counting its calls."""
+    main_file = tmp_path / 'robot.urdf.xacro'
+    include_file = tmp_path / 'arm.xacro'
+    main_file.write_text('<robot/>')
+    include_file.write_text('<link/>')
+    calls = []
+
+    def expand_xacro(xacro_file, mappings):
+        calls.append(dict(mappings))
+        urdf = f'<robot prefix="{mappings.get("prefix", "")}">{include_file.read_text()}</robot>'
+        return urdf, [xacro_file, str(include_file)]
+
+    monkeypatch.setattr(robot_description, 'expand_xacro', expand_xacro)
+    return str(main_file), include_file, calls
+
+
+def test_description_is_expanded_once(tmp_path, xacro_files):
+    main_file, _, calls = xacro_files
+    cache_directory = str(tmp_path / 'cache')
+
+    first = robot_description.get_robot_description(main_file, {'prefix': 'a'}, cache_directory)
+    second = robot_description.get_robot_description(main_file, {'prefix': 'a'}, cache_directory)
+
+    assert first == second == '<robot prefix="a"><link/></robot>'
+    assert calls == [{'prefix': 'a'}]
+
+
+def test_mappings_are_cached_separately(tmp_path, xacro_files):
+    main_file, _, calls = xacro_files
+    cache_directory = str(tmp_path / 'cache')
+
+    robot_description.get_robot_description(main_file, {'prefix': 'a'}, cache_directory)
+    other = robot_description.get_robot_description(main_file, {'prefix': 'b'}, cache_directory)
+
+    assert other == '<robot prefix="b"><link/></robot>'
+    assert len(calls) == 2
+
+
+def test_edited_include_regenerates_the_entry(tmp_path, xacro_files):
+    main_file, include_file, calls = xacro_files
+    cache_directory = str(tmp_path / 'cache')
+
+    robot_description.get_robot_description(main_file, {}, cache_directory)
+    include_file.write_text('<link name="changed"/>')
+    urdf = robot_description.get_robot_description(main_file, {}, cache_directory)
+
+    assert urdf == '<robot prefix=""><link name="changed"/></robot>'
+    assert len(calls) == 2
+
+
+def test_unwritable_cache_still_returns_the_description(tmp_path, xacro_files):
+    main_file, _, calls = xacro_files
+    # a file where the cache directory should be
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('')
+
+    urdf = robot_description.get_robot_description(main_file, {}, str(blocked / 'cache'))
+
+    assert urdf == '<robot prefix=""><link/></robot>'
+    assert len(calls) == 1
+
+
+def test_real_xacro_include_edit_regenerates_the_entry(tmp_path, monkeypatch):
+    pytest.importorskip('xacro')
+    include_file = tmp_path / 'arm.xacro'
+    include_file.write_text(
+        '<robot xmlns:xacro="http://www.ros.org/wiki/xacro">\n'
+        '  <xacro:macro name="arm" params="prefix">\n'
+        '    <link name="${prefix}link1"/>\n'
+        '  </xacro:macro>\n'
+        '</robot>\n'
+    )
+    main_file = tmp_path / 'robot.urdf.xacro'
+    main_file.write_text(
+        '<robot name="test" xmlns:xacro="http://www.ros.org/wiki/xacro">\n'
+        '  <xacro:arg name="prefix" default=""/>\n'
+        f'  <xacro:include filename="{include_file}"/>\n'
+        '  <xacro:arm prefix="$(arg prefix)"/>\n'
+        '</robot>\n'
+    )
+    cache_directory = str(tmp_path / 'cache')
+    calls = []
+    expand_xacro = robot_description.expand_xacro
+
+    def counting_expand_xacro(xacro_file, mappings):
+        calls.append(xacro_file)
+        return expand_xacro(xacro_file, mappings)
+
+    monkeypatch.setattr(robot_description, 'expand_xacro', counting_expand_xacro)
+
+    first = robot_description.get_robot_description(
+        str(main_file), {'prefix': 'a_'}, cache_directory)
+    cached = robot_description.get_robot_description(
+        str(main_file), {'prefix': 'a_'}, cache_directory)
+    assert '<link name="a_link1"/>' in first
+    assert cached == first
+    assert len(calls) == 1
+
+    include_file.write_text(include_file.read_text().replace('link1', 'base_link'))
+    edited = robot_description.get_robot_description(
+        str(main_file), {'prefix': 'a_'}, cache_directory)
+    assert '<link name="a_base_link"/>' in edited
+    assert len(calls) == 2
@@ -0,0 +1,81 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+from open_manipulator_bringup.trajectory_cache import get_timing
+from open_manipulator_bringup.trajectory_cache import shift_start
+from open_manipulator_bringup.trajectory_cache import TrajectoryCache
+from open_manipulator_bringup.trajectory_generator import create_quintic_trajectory
+from open_manipulator_bringup.trajectory_generator import create_trajectory
+
+JOINT_NAMES = ['joint1', 'joint2']
+TIMING = get_timing(2.0, 10.0)
+
+
+def test_key_depends_on_start_bucket_steps_and_timing(tmp_path):
+    cache = TrajectoryCache(str(tmp_path), 0.01)
+    key = cache.get_key(JOINT_NAMES, [[0.001, 0.0], [1.0, 1.0]], TIMING)
+
+    assert cache.get_key(JOINT_NAMES, [[-0.002, 0.003], [1.0, 1.0]], TIMING) == key
+    assert cache.get_key(JOINT_NAMES, [[0.02, 0.0], [1.0, 1.0]], TIMING) != key
+    assert cache.get_key(JOINT_NAMES, [[0.0, 0.0], [1.0, 0.5]], TIMING) != key
+    assert cache.get_key(JOINT_NAMES, [[0.0, 0.0], [1.0, 1.0]], get_timing(3.0, 10.0)) != key
+    np.testing.assert_allclose(cache.quantize([0.004, 0.016]), [0.0, 0.02])
+
+
+def test_saved_trajectory_loads_read_only(tmp_path):
+    cache = TrajectoryCache(str(tmp_path))
+    trajectory = create_trajectory([[0.0, 0.0], [1.0, 0.5], [0.0, 1.0]], [1.0, 1.0], 10.0)
+    cache.save('entry', *trajectory)
+
+    loaded = cache.load('entry')
+    for expected, array in zip(trajectory, loaded):
+        np.testing.assert_array_equal(array, expected)
+        assert not array.flags.writeable
+    assert cache.load('missing') is None
+
+
+def test_shifted_single_move_is_exact():
+    cached = create_quintic_trajectory([0.0, 0.0], [1.0, -1.0], 2.0, 21)
+    shifted = shift_start(cached, [0.004, -0.003])
+
+    expected = create_quintic_trajectory([0.004, -0.003], [1.0, -1.0], 2.0, 21)
+    for array, expected_array in zip(shifted, expected):
+        np.testing.assert_allclose(array, expected_array, atol=1e-12)
+
+
+def test_shifted_blended_move_keeps_its_end():
+    cached = create_trajectory([[0.0, 0.0], [1.0, 0.5], [0.0, 1.0]], [1.0, 1.0], 10.0)
+    _, positions, velocities, _ = shift_start(cached, [0.004, -0.003])
+
+    np.testing.assert_allclose(positions[0], [0.004, -0.003])
+    np.testing.assert_allclose(positions[-1], [0.0, 1.0])
+    np.testing.assert_allclose(velocities[[0, -1]], 0.0, atol=1e-12)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = TrajectoryCache(str(tmp_path), max_entries=2)
+    trajectory = create_quintic_trajectory([0.0], [1.0], 1.0, 11)
+    cache.save('a', *trajectory)
+    cache.save('b', *trajectory)
+    os.utime(cache.get_path('a'), (1000.0, 1000.0))
+    os.utime(cache.get_path('b'), (2000.0, 2000.0))
+
+    # loading marks 'a' as used, so 'b' is the oldest when 'c' is added
+    assert cache.load('a') is not None
+    cache.save('c', *trajectory)
+
+    assert sorted(os.listdir(str(tmp_path))) == ['a.npy', 'c.npy']
@@ -0,0 +1,132 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+from open_manipulator_bringup.trajectory_generator import create_quintic_trajectory
+from open_manipulator_bringup.trajectory_generator import create_trajectory
+from open_manipulator_bringup.trajectory_generator import create_via_point_trajectory
+from open_manipulator_bringup.trajectory_generator import DEFAULT_SAMPLING_RATE
+from open_manipulator_bringup.trajectory_generator import get_durations
+from open_manipulator_bringup.trajectory_generator import get_joint_limits
+from open_manipulator_bringup.trajectory_generator import get_limit_ratio
+from open_manipulator_bringup.trajectory_generator import get_min_duration
+from open_manipulator_bringup.trajectory_generator import get_sampling_rate
+
+CONFIG_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config')
+
+
+def test_sampling_rate_follows_controller_update_rate():
+    config = os.path.join(CONFIG_DIRECTORY, 'omy_3m', 'hardware_controller_manager.yaml')
+    assert get_sampling_rate(0.0, config) == 400.0
+    assert get_sampling_rate(25.0, config) == 25.0
+    assert get_sampling_rate() == DEFAULT_SAMPLING_RATE
+
+
+def test_sampling_rate_merges_repeated_node_keys(tmp_path):
+    config = tmp_path / 'controllers.yaml'
+    config.write_text(
+        '/**:\n'
+        '  controller_manager:\n'
+        '    ros__parameters:\n'
+        '      update_rate: 250\n'
+        '/**:\n'
+        '  arm_controller:\n'
+        '    ros__parameters:\n'
+        '      joints: [joint1]\n'
+    )
+    assert get_sampling_rate(0.0, str(config)) == 250.0
+
+
+def test_quintic_moves_rest_to_rest():
+    times, positions, velocities, accelerations = create_quintic_trajectory(
+        [0.0, 1.0], [1.0, -1.0], 2.0, 21)
+
+    assert times[0] == 0.0 and times[-1] == 2.0
+    np.testing.assert_allclose(positions[0], [0.0, 1.0])
+    np.testing.assert_allclose(positions[-1], [1.0, -1.0])
+    np.testing.assert_allclose(positions[10], [0.5, 0.0])
+    for array in (velocities, accelerations):
+        np.testing.assert_allclose(array[[0, -1]], 0.0, atol=1e-12)
+
+
+def test_via_points_are_passed_without_stopping():
+    waypoints = [[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]]
+    times, positions, velocities, accelerations = create_via_point_trajectory(
+        waypoints, [1.0, 1.0], 10.0)
+
+    # one shared point at the via point, no duplicated time
+    assert len(times) == 19 and np.all(np.diff(times) > 0.0)
+    np.testing.assert_allclose(positions[[0, 9, -1]], waypoints, atol=1e-12)
+    np.testing.assert_allclose(velocities[[0, -1]], 0.0, atol=1e-12)
+    # joint 1 keeps moving through the via point, joint 2 reverses and stops there
+    np.testing.assert_allclose(velocities[9], [1.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(accelerations[9], 0.0, atol=1e-12)
+
+
+def test_via_point_trajectory_is_continuous():
+    _, positions, velocities, _ = create_via_point_trajectory(
+        [[0.0], [0.5], [2.0], [2.5]], [1.0, 2.0, 1.0], 200.0)
+
+    # steps stay small everywhere, including across segment boundaries
+    assert np.max(np.abs(np.diff(positions, axis=0))) < 0.01
+    assert np.max(np.abs(np.diff(velocities, axis=0))) < 0.02
+
+
+def test_joint_limits_override_and_disable(tmp_path):
+    limits_file = tmp_path / 'joint_limits.yaml'
+    limits_file.write_text(
+        'joint_limits:\n'
+        '  joint1: {has_velocity_limits: true, max_velocity: 2.0,\n'
+        '           has_acceleration_limits: true, max_acceleration: 4.0}\n'
+        '  joint2: {has_velocity_limits: false, max_velocity: 9.0}\n'
+    )
+    max_velocities, max_accelerations = get_joint_limits(
+        ['joint1', 'joint2'], str(limits_file), [0.0, 1.0], [], 0.5, 1.0)
+
+    np.testing.assert_allclose(max_velocities, [np.inf, 0.5])
+    np.testing.assert_allclose(max_accelerations, [4.0, np.inf])
+    assert get_joint_limits(['joint1'], '', [0.0], [0.0]) == (None, None)
+
+
+def test_min_duration_reaches_the_limits():
+    limits = np.array([1.0, 1.0]), np.array([2.0, 2.0])
+    duration = get_min_duration([0.0, 0.0], [1.0, 0.5], *limits)
+
+    _, _, velocities, accelerations = create_quintic_trajectory(
+        [0.0, 0.0], [1.0, 0.5], duration, 1001)
+    assert abs(get_limit_ratio(velocities, accelerations, *limits) - 1.0) < 1e-3
+
+
+def test_durations_follow_the_limits():
+    waypoints = [[0.0], [2.0]]
+    limits = np.array([1.0]), np.array([10.0])
+
+    assert get_durations(waypoints, 10.0) == [10.0]
+    # a fixed duration is only stretched when it is too short
+    assert get_durations(waypoints, 10.0, *limits) == [10.0]
+    assert get_durations(waypoints, 1.0, *limits) == [3.75]
+    # time optimal moves take the shortest feasible time, but at least min_duration
+    assert get_durations(waypoints, 10.0, *limits, 0.5, True) == [3.75]
+    assert get_durations([[0.0], [0.01]], 10.0, *limits, 0.5, True) == [0.5]
+
+
+def test_blended_durations_keep_the_limits():
+    waypoints = [[0.0, 0.0], [1.0, 0.5], [2.0, 1.5], [1.0, 1.0]]
+    limits = np.array([1.0, 0.5]), np.array([2.0, 1.0])
+    durations = get_durations(waypoints, 1.0, *limits, 0.5, True)
+
+    _, _, velocities, accelerations = create_trajectory(waypoints, durations, 1000.0)
+    assert get_limit_ratio(velocities, accelerations, *limits) <= 1.0 + 1e-3
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+import os
+import select
+import sys
+import termios
+import threading
+import time
+import tty
+
+
+@dataclass
+class GripperConfig:
+    """Gripper moved in steps through the GripperCommand action."""
+
+    joint_name: str
+    min_position: float
+    max_position: float
+    delta: float
+    increase_key: str
+    decrease_key: str
+    max_effort: float = 10.0
+
+
+class KeyReader:
+    """Thread reading single key presses from stdin in cbreak mode."""
+
+    def __init__(self, callback, poll_timeout=0.05):
+        self.callback = callback
+        self.poll_timeout = poll_timeout
+        self.running = False
+        self.thread = None
+        self.old_settings = None
+
+    def start(self):
+        # The terminal mode is set once for the whole session, not for every key
+        fd = sys.stdin.fileno()
+        self.old_settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+        if self.old_settings is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self.old_settings)
+            self.old_settings = None
+
+    def run(self):
+        # Reads bypass the stdin buffer, which would hide keys that arrived together from select
+        fd = sys.stdin.fileno()
+        while self.running:
+            rlist, _, _ = select.select([fd], [], [], self.poll_timeout)
+            if rlist:
+                now = time.monotonic()
+                for key in os.read(fd, 64).decode(errors='ignore'):
+                    self.callback(key, now)
+
+
+class JointVelocityIntegrator:
+    """
+    Joint position commands integrated from velocity targets.
+
+    Velocities ramp toward their targets at max_acceleration and positions stay
+    within the limits. A target lasts until its hold time runs out.
+    """
+
+    def __init__(self, lower_limits, upper_limits, max_acceleration):
+        self.lower_limits = list(lower_limits)
+        self.upper_limits = list(upper_limits)
+        self.max_acceleration = max_acceleration
+        self.positions = None
+        self.velocities = [0.0] * len(self.lower_limits)
+        self.targets = [0.0] * len(self.lower_limits)
+        self.hold_until = [0.0] * len(self.lower_limits)
+
+    def reset(self, positions):
+        self.positions = [
+            min(max(position, lower), upper)
+            for position, lower, upper in zip(positions, self.lower_limits, self.upper_limits)
+        ]
+        self.velocities = [0.0] * len(self.positions)
+        self.targets = [0.0] * len(self.positions)
+
+    def set_target(self, index, velocity, hold_until):
+        self.targets[index] = velocity
+        self.hold_until[index] = hold_until
+
+    def stop(self):
+        self.targets = [0.0] * len(self.targets)
+
+    def is_moving(self):
+        return any(self.velocities) or any(self.targets)
+
+    def step(self, now, dt):
+        max_change = self.max_acceleration * dt
+        for i in range(len(self.positions)):
+            if now > self.hold_until[i]:
+                self.targets[i] = 0.0
+
+            change = self.targets[i] - self.velocities[i]
+            self.velocities[i] += min(max(change, -max_change), max_change)
+            position = self.positions[i] + self.velocities[i] * dt
+            if position <= self.lower_limits[i] or position >= self.upper_limits[i]:
+                position = min(max(position, self.lower_limits[i]), self.upper_limits[i])
+                self.velocities[i] = 0.0
+                self.targets[i] = 0.0
+            self.positions[i] = position
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+#
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import threading
+import time
+
+from control_msgs.action import GripperCommand
+from open_manipulator_teleop.teleop_core import JointVelocityIntegrator
+from open_manipulator_teleop.teleop_core import KeyReader
+import rclpy
+from rclpy.action import ActionClient
+from rclpy.node import Node
+from sensor_msgs.msg import JointState
+from trajectory_msgs.msg import JointTrajectory
+from trajectory_msgs.msg import JointTrajectoryPoint
+
+ESCAPE_KEY = '\x1b'
+STOP_KEY = ' '
+
+
+class TeleopEngine(Node):
+    """
+    Keyboard teleoperation streaming joint commands at a fixed rate.
+
+    Holding a key moves its joint at max_velocity. Terminals only report key
+    presses, so a joint keeps moving until no key repeat arrived for
+    repeat_timeout, or first_press_timeout after the first press, which covers
+    the keyboard's initial repeat delay. Space stops every joint.
+    """
+
+    def __init__(self, node_name, joint_names, joint_keys, lower_limits, upper_limits,
+                 gripper=None):
+        super().__init__(node_name)
+
+        # Declare parameters
+        self.declare_parameter('command_rate', 50.0)  # Hz
+        self.declare_parameter('max_velocity', 0.5)  # rad/s
+        self.declare_parameter('max_acceleration', 2.0)  # rad/s^2
+        self.declare_parameter('first_press_timeout', 0.55)  # s
+        self.declare_parameter('repeat_timeout', 0.12)  # s
+
+        command_rate = self.get_parameter('command_rate').value
+        self.max_velocity = self.get_parameter('max_velocity').value
+        self.first_press_timeout = self.get_parameter('first_press_timeout').value
+        self.repeat_timeout = self.get_parameter('repeat_timeout').value
+        self.period = 1.0 / command_rate
+
+        self.arm_joint_names = list(joint_names)
+        # Each joint has an increase key and a decrease key, e.g. '1q'
+        self.joint_keys = list(joint_keys)
+        self.key_bindings = {}
+        for i, keys in enumerate(joint_keys):
+            self.key_bindings[keys[0]] = (i, 1.0)
+            self.key_bindings[keys[1]] = (i, -1.0)
+        self.integrator = JointVelocityIntegrator(
+            lower_limits, upper_limits, self.get_parameter('max_acceleration').value
+        )
+        self.gripper = gripper
+
+        # Publisher for arm joint control
+        self.arm_publisher = self.create_publisher(
+            JointTrajectory, '/arm_controller/joint_trajectory', 10
+        )
+
+        # Action client for GripperCommand
+        self.gripper_client = None
+        if self.gripper is not None:
+            self.gripper_client = ActionClient(
+                self, GripperCommand, '/gripper_controller/gripper_cmd'
+            )
+
+        # Subscriber for joint states
+        self.subscription = self.create_subscription(
+            JointState, '/joint_states', self.joint_state_callback, 10
+        )
+
+        self.lock = threading.Lock()
+        self.last_key = None
+        self.last_key_time = 0.0
+        self.gripper_position = 0.0
+        self.was_moving = False
+        self.running = True
+
+        self.key_reader = KeyReader(self.key_callback)
+        self.last_step_time = None
+        self.timer = self.create_timer(self.period, self.timer_callback)
+
+        self.get_logger().info('Waiting for /joint_states...')
+
+    def joint_state_callback(self, msg):
+        if self.gripper is not None and self.gripper.joint_name in msg.name:
+            self.gripper_position = msg.position[msg.name.index(self.gripper.joint_name)]
+
+        # Commands are integrated from the first state on, later states do not move them
+        if self.integrator.positions is not None:
+            return
+        if not set(self.arm_joint_names).issubset(set(msg.name)):
+            return
+
+        with self.lock:
+            self.integrator.reset(
+                [msg.position[msg.name.index(joint)] for joint in self.arm_joint_names]
+            )
+        self.get_logger().info(f'Received joint states: {self.integrator.positions}')
+        self.get_logger().info('Ready to receive keyboard input!')
+        self.get_logger().info(self.get_usage())
+        self.key_reader.start()
+
+    def get_usage(self):
+        keys = ', '.join(f'{keys[0]}/{keys[1]}' for keys in self.joint_keys)
+        usage = f'Hold {keys} to move joints 1-{len(self.arm_joint_names)}'
+        if self.gripper is not None:
+            usage += f', {self.gripper.increase_key}/{self.gripper.decrease_key} for gripper'
+        return usage + '. Space stops, ESC exits.'
+
+    def key_callback(self, key, now):
+        if key == ESCAPE_KEY:
+            self.running = False
+            return
+
+        with self.lock:
+            if key == STOP_KEY:
+                self.integrator.stop()
+            elif key in self.key_bindings:
+                index, direction = self.key_bindings[key]
+                # Key repeats arrive quickly, a new press has to wait for the repeat delay
+                repeated = (
+                    key == self.last_key
+                    and now - self.last_key_time < self.first_press_timeout
+                )
+                timeout = self.repeat_timeout if repeated else self.first_press_timeout
+                self.integrator.set_target(index, direction * self.max_velocity, now + timeout)
+            self.last_key = key
+            self.last_key_time = now
+
+        if self.gripper is not None and key in (self.gripper.increase_key,
+                                                self.gripper.decrease_key):
+            delta = self.gripper.delta if key == self.gripper.increase_key else -self.gripper.delta
+            self.send_gripper_command(
+                min(max(self.gripper_position + delta, self.gripper.min_position),
+                    self.gripper.max_position)
+            )
+
+    def timer_callback(self):
+        now = time.monotonic()
+        if self.last_step_time is None:
+            self.last_step_time = now
+            return
+        # The measured period keeps the motion speed right if the timer runs late
+        dt = min(now - self.last_step_time, 5.0 * self.period)
+        self.last_step_time = now
+
+        with self.lock:
+            if self.integrator.positions is None:
+                return
+            self.integrator.step(now, dt)
+            moving = self.integrator.is_moving()
+            positions = list(self.integrator.positions)
+            velocities = list(self.integrator.velocities)
+
+        # Stream while moving, plus one message to settle at the final position
+        if moving or self.was_moving:
+            self.send_arm_command(positions, velocities)
+        self.was_moving = moving
+
+    def send_arm_command(self, positions, velocities):
+        # The point is one period ahead, so the controller interpolates up to the next command
+        arm_msg = JointTrajectory()
+        arm_msg.joint_names = self.arm_joint_names
+        arm_point = JointTrajectoryPoint()
+        arm_point.positions = [
+            position + velocity * self.period
+            for position, velocity in zip(positions, velocities)
+        ]
+        arm_point.velocities = velocities
+        arm_point.time_from_start.sec = int(self.period)
+        arm_point.time_from_start.nanosec = int(math.fmod(self.period, 1.0) * 1e9)
+        arm_msg.points.append(arm_point)
+        self.arm_publisher.publish(arm_msg)
+        self.get_logger().debug(f'Arm command sent: {arm_point.positions}')
+
+    def send_gripper_command(self, position):
+        goal_msg = GripperCommand.Goal()
+        goal_msg.command.position = position
+        goal_msg.command.max_effort = self.gripper.max_effort
+
+        if not self.gripper_client.server_is_ready():
+            self.get_logger().warn('Gripper action server is not available')
+            return
+        self.get_logger().info(f'Sending gripper command: {position}')
+        self.gripper_client.send_goal_async(goal_msg)
+
+    def shutdown(self):
+        self.key_reader.stop()
+
+
+def run_teleop(node_class):
+    rclpy.init()
+    node = node_class()
+    try:
+        while rclpy.ok() and node.running:
+            rclpy.spin_once(node, timeout_sec=0.1)
+    except KeyboardInterrupt:
+        print('\nCtrl+C detected. Shutting down...')
+    finally:
+        node.shutdown()
+        node.destroy_node()
+        rclpy.shutdown()
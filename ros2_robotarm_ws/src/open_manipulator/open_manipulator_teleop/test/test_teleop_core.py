@@ -0,0 +1,91 @@
+# Copyright 2025 ROBOTIS CO., LTD.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import time
+
+from open_manipulator_teleop.teleop_core import JointVelocityIntegrator
+from open_manipulator_teleop.teleop_core import KeyReader
+import pytest
+
+
+def make_integrator():
+    integrator = JointVelocityIntegrator([-1.0, -1.0], [1.0, 1.0], max_acceleration=2.0)
+    integrator.reset([0.0, 0.5])
+    return integrator
+
+
+def test_velocity_ramps_to_target_at_max_acceleration():
+    integrator = make_integrator()
+    integrator.set_target(0, 0.5, hold_until=10.0)
+
+    integrator.step(0.1, 0.1)
+    assert integrator.velocities[0] == pytest.approx(0.2)
+    for i in range(2, 6):
+        integrator.step(0.1 * i, 0.1)
+    assert integrator.velocities == pytest.approx([0.5, 0.0])
+    assert integrator.positions[1] == 0.5
+
+
+def test_target_expires_after_hold_time():
+    integrator = make_integrator()
+    integrator.set_target(0, 0.5, hold_until=0.05)
+    integrator.step(0.0, 0.1)
+    assert integrator.targets[0] == 0.5
+
+    for i in range(1, 5):
+        integrator.step(0.1 * i, 0.1)
+    assert integrator.targets[0] == 0.0
+    assert integrator.velocities[0] == 0.0
+    assert not integrator.is_moving()
+
+
+def test_positions_stop_at_the_limits():
+    integrator = make_integrator()
+    integrator.set_target(1, 2.0, hold_until=10.0)
+
+    for i in range(1, 20):
+        integrator.step(0.1 * i, 0.1)
+    assert integrator.positions[1] == 1.0
+    assert integrator.velocities[1] == 0.0
+    assert integrator.targets[1] == 0.0
+
+
+def test_reset_clamps_into_the_limits():
+    integrator = make_integrator()
+    integrator.reset([2.0, -3.0])
+    assert integrator.positions == [1.0, -1.0]
+    assert not integrator.is_moving()
+
+
+def test_key_reader_reports_single_key_presses(monkeypatch):
+    master_fd, slave_fd = os.openpty()
+    stdin = os.fdopen(slave_fd, 'r')
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    keys = []
+    reader = KeyReader(lambda key, now: keys.append(key), poll_timeout=0.01)
+    try:
+        reader.start()
+        # cbreak mode hands each key over without waiting for a newline
+        os.write(master_fd, b'qa')
+        end = time.monotonic() + 2.0
+        while len(keys) < 2 and time.monotonic() < end:
+            time.sleep(0.01)
+    finally:
+        reader.stop()
+        stdin.close()
+        os.close(master_fd)
+    assert keys == ['q', 'a']
+    assert reader.old_settings is None
@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+import math
+import threading
+import time
+
+import numpy as np
+from dynamixel_sdk import *  # Dynamixel SDK
+from joint_command_writer import JointCommandWriter
+from joint_state_reader import JointStateReader
+
+# -------------------------------
+# Executor configuration
+# -------------------------------
+COMMAND_RATE_HZ = 100      # servo command rate
+ENSEMBLE_DECAY = 0.01      # m in w_i = exp(-m * i), i = 0 for the oldest chunk still covering t
+MAX_CHUNKS = 8             # overlapping chunks kept for ensembling
+MAX_WRITE_ERRORS = 10      # consecutive failed writes before the executor stops
+
+
+@dataclass
+class ActionChunk:
+    start_time: float      # time.monotonic() of the first action
+    step: float            # seconds between actions
+    actions: np.ndarray    # (horizon, joints) rad, in writer.ids order
+
+    @property
+    def end_time(self):
+        return self.start_time + self.step * (len(self.actions) - 1)
+
+    def sample(self, t):
+        # linear interpolation between the two actions around t
+        position = (t - self.start_time) / self.step
+        lower = min(int(position), len(self.actions) - 1)
+        upper = min(lower + 1, len(self.actions) - 1)
+        fraction = position - lower
+        return self.actions[lower] * (1.0 - fraction) + self.actions[upper] * fraction
+
+
+# -------------------------------
+# Executor
+# -------------------------------
+# Streams policy action chunks to the servos on a fixed-period loop, so slow inference
+# (10-30 Hz) never stalls the bus cycle. Overlapping chunks are blended with temporal
+# ensembling: every chunk covering t predicts an action, weighted by w_i = exp(-m * i).
+class ActionChunkExecutor:
+
+    def __init__(self, writer, rate_hz=COMMAND_RATE_HZ, ensemble_decay=ENSEMBLE_DECAY, max_chunks=MAX_CHUNKS,
+                 max_write_errors=MAX_WRITE_ERRORS):
+        self.writer = writer
+        self.period = 1.0 / rate_hz
+        self.ensemble_decay = ensemble_decay
+        self.max_chunks = max_chunks
+        self.max_write_errors = max_write_errors
+
+        self.chunks = []
+        self.lock = threading.Lock()
+        self.thread = None
+        self.running = False
+        self.error = None          # write error that stopped the loop
+        self.stats = {"cycles": 0, "commands": 0, "overruns": 0, "max_lateness_ms": 0.0,
+                      "write_errors": 0, "last_error": None}
+
+    def submit(self, actions, step, start_time=None):
+        # a stopped loop would drop every chunk, so the caller gets the reason instead
+        if self.error is not None:
+            raise Exception(f"Executor stopped after {self.max_write_errors} failed writes: {self.error}")
+
+        # actions: (horizon, joints) array, or a list of {id: rad} dicts with every joint
+        if len(actions) and isinstance(actions[0], dict):
+            actions = [[action[dxl_id] for dxl_id in self.writer.ids] for action in actions]
+        actions = np.asarray(actions, dtype=float)
+        if actions.ndim != 2 or actions.shape[1] != len(self.writer.ids) or len(actions) == 0:
+            raise Exception(f"Expected (horizon, {len(self.writer.ids)}) actions, got shape {actions.shape}")
+
+        chunk = ActionChunk(time.monotonic() if start_time is None else start_time, step, actions)
+        with self.lock:
+            self.chunks.append(chunk)
+            del self.chunks[:-self.max_chunks]
+
+    def command_at(self, t):
+        with self.lock:
+            self.chunks = [chunk for chunk in self.chunks if chunk.end_time >= t]
+            active = [chunk for chunk in self.chunks if chunk.start_time <= t]
+        if not active:
+            return None
+
+        samples = np.array([chunk.sample(t) for chunk in active])
+        weights = np.exp(-self.ensemble_decay * np.arange(len(active)))
+        return weights @ samples / weights.sum()
+
+    def start(self):
+        self.error = None
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+
+    def run(self):
+        next_time = time.monotonic()
+        consecutive_errors = 0
+        while self.running:
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            now = time.monotonic()
+            lateness = now - next_time
+
+            # commands are computed for the current cycle's slot, not for when the loop woke up
+            positions = self.command_at(next_time)
+            written = False
+            error = None
+            if positions is not None:
+                # a failed write is retried with the next cycle's command, only a run of them stops the loop
+                try:
+                    self.writer.write(positions)
+                    written = True
+                    consecutive_errors = 0
+                except Exception as e:
+                    error = e
+                    consecutive_errors += 1
+
+            with self.lock:
+                self.stats["max_lateness_ms"] = max(self.stats["max_lateness_ms"], lateness * 1000.0)
+                self.stats["cycles"] += 1
+                if written:
+                    self.stats["commands"] += 1
+                if error is not None:
+                    self.stats["write_errors"] += 1
+                    self.stats["last_error"] = str(error)
+
+            if consecutive_errors >= self.max_write_errors:
+                self.error = error
+                self.running = False
+                break
+
+            next_time += self.period
+            if next_time < time.monotonic():
+                # missed whole cycles: skip them instead of sending a burst
+                with self.lock:
+                    self.stats["overruns"] += 1
+                next_time = time.monotonic()
+
+
+# -------------------------------
+# Example usage
+# -------------------------------
+if __name__ == "__main__":
+    PROTOCOL_VERSION = 2.0
+    BAUDRATE = 1000000
+    DEVICENAME = 'COM6'
+    DXL_IDS = [11, 12, 13, 14, 15]
+
+    POLICY_RATE_HZ = 15        # how often the policy emits a chunk
+    CHUNK_HORIZON = 20         # actions per chunk
+    ACTION_STEP = 0.05         # seconds between actions in a chunk
+
+    portHandler = PortHandler(DEVICENAME)
+    packetHandler = PacketHandler(PROTOCOL_VERSION)
+    if not portHandler.openPort():
+        raise Exception("Failed to open port")
+    if not portHandler.setBaudRate(BAUDRATE):
+        raise Exception("Failed to set baudrate")
+
+    reader = JointStateReader(portHandler, packetHandler, DXL_IDS)
+    writer = JointCommandWriter(portHandler, packetHandler, DXL_IDS)
+    home = reader.read().position
+
+    # stand-in for the policy: a small sine around the start pose
+    def policy(t):
+        times = t + ACTION_STEP * np.arange(CHUNK_HORIZON)
+        return home + 0.1 * np.sin(2 * math.pi * 0.5 * times)[:, None]
+
+    executor = ActionChunkExecutor(writer)
+    writer.set_torque(True)
+    executor.submit(policy(time.monotonic()), ACTION_STEP)
+    executor.start()
+    try:
+        while True:
+            time.sleep(1.0 / POLICY_RATE_HZ)
+            executor.submit(policy(time.monotonic()), ACTION_STEP)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.stop()
+        writer.set_torque(False)
+        portHandler.closePort()
+        print(executor.get_stats())
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+import math
+import os
+import time
+
+import numpy as np
+from dynamixel_easy_sdk.control_table import CONTROL_TABLE_PATH
+from dynamixel_easy_sdk.control_table import ControlTable
+from dynamixel_sdk import *  # Dynamixel SDK
+
+# -------------------------------
+# Dynamixel configuration
+# -------------------------------
+TORQUE_ENABLE       = 1
+TORQUE_DISABLE      = 0
+
+OPERATING_MODE_POSITION          = 3
+OPERATING_MODE_EXTENDED_POSITION = 4
+EXTENDED_POSITION_LIMIT          = 1048575   # +-256 revolutions
+
+# Constants
+TICKS_PER_REV = 4096
+RAD_TO_TICKS = TICKS_PER_REV / (2 * math.pi)
+
+
+# -------------------------------
+# Model file
+# -------------------------------
+def read_type_info(model_number):
+    # [type info] section of the model file, e.g. value_of_zero_radian_position
+    file_name = os.path.join(CONTROL_TABLE_PATH, ControlTable.getModelName(model_number))
+    type_info = {}
+    in_section = False
+    with open(file_name, encoding="utf-8") as infile:
+        for line in infile:
+            line = line.strip()
+            if line.startswith("["):
+                in_section = line == "[type info]"
+                continue
+            parts = line.split("\t")
+            if in_section and len(parts) == 2 and parts[0] != "name":
+                type_info[parts[0]] = float(parts[1])
+    return type_info
+
+
+@dataclass
+class JointConfig:
+    model_number: int
+    operating_mode: int
+    zero_tick: int        # tick commanded for 0 rad
+    min_tick: int
+    max_tick: int
+
+
+# -------------------------------
+# Writer
+# -------------------------------
+# Sends goal positions of every joint with one sync write per cycle
+class JointCommandWriter:
+
+    def __init__(self, port_handler, packet_handler, dxl_ids, offsets=None, centered=False):
+        # centered=False keeps the convention of read_data.py (0 rad at tick 0); centered=True
+        # puts 0 rad at the model file's zero radian position, like the easy SDK does.
+        # offsets are per-joint calibration offsets in rad, added before conversion.
+        self.port_handler = port_handler
+        self.packet_handler = packet_handler
+        self.ids = list(dxl_ids)
+        self.index = {dxl_id: i for i, dxl_id in enumerate(self.ids)}
+
+        self.joints = {dxl_id: self.load_joint(dxl_id, centered) for dxl_id in self.ids}
+        offsets = offsets or {}
+        self.offsets = np.array([offsets.get(dxl_id, 0.0) for dxl_id in self.ids])
+        self.zero_ticks = np.array([self.joints[dxl_id].zero_tick for dxl_id in self.ids])
+        self.min_ticks = np.array([self.joints[dxl_id].min_tick for dxl_id in self.ids])
+        self.max_ticks = np.array([self.joints[dxl_id].max_tick for dxl_id in self.ids])
+
+        control_table = ControlTable.getControlTable(self.joints[self.ids[0]].model_number)
+        self.torque_item = control_table["Torque Enable"]
+        goal_item = control_table["Goal Position"]
+        for dxl_id in self.ids[1:]:
+            other = ControlTable.getControlTable(self.joints[dxl_id].model_number)
+            if other["Goal Position"] != goal_item or other["Torque Enable"] != self.torque_item:
+                raise Exception(f"ID {dxl_id} has a different control table layout and cannot share a sync write")
+
+        self.goal_group = GroupSyncWrite(port_handler, packet_handler, goal_item.address, goal_item.size)
+        for dxl_id in self.ids:
+            self.goal_group.addParam(dxl_id, bytes(goal_item.size))
+        self.last_ticks = None
+
+    def load_joint(self, dxl_id, centered):
+        model_number, dxl_comm_result, dxl_error = self.packet_handler.ping(self.port_handler, dxl_id)
+        self.check(dxl_id, dxl_comm_result, dxl_error)
+        control_table = ControlTable.getControlTable(model_number)
+        type_info = read_type_info(model_number)
+
+        mode_item = control_table["Operating Mode"]
+        max_item = control_table["Max Position Limit"]
+        min_item = control_table["Min Position Limit"]
+        start = mode_item.address
+        end = max(max_item.address + max_item.size, min_item.address + min_item.size)
+        data, dxl_comm_result, dxl_error = self.packet_handler.readTxRx(
+            self.port_handler, dxl_id, start, end - start)
+        self.check(dxl_id, dxl_comm_result, dxl_error)
+
+        def field(item):
+            offset = item.address - start
+            return int.from_bytes(bytes(data[offset:offset + item.size]), "little", signed=True)
+
+        operating_mode = field(mode_item)
+        if operating_mode == OPERATING_MODE_EXTENDED_POSITION:
+            # position limits are not applied by the servo in extended position mode
+            min_tick, max_tick = -EXTENDED_POSITION_LIMIT, EXTENDED_POSITION_LIMIT
+        elif operating_mode == OPERATING_MODE_POSITION:
+            min_tick, max_tick = field(min_item), field(max_item)
+        else:
+            min_tick = int(type_info["value_of_min_radian_position"])
+            max_tick = int(type_info["value_of_max_radian_position"])
+
+        zero_tick = int(type_info["value_of_zero_radian_position"]) if centered else 0
+        return JointConfig(model_number, operating_mode, zero_tick, min_tick, max_tick)
+
+    def check(self, dxl_id, dxl_comm_result, dxl_error):
+        if dxl_comm_result != COMM_SUCCESS:
+            raise Exception(f"Comm error on {dxl_id}: {self.packet_handler.getTxRxResult(dxl_comm_result)}")
+        if dxl_error != 0:
+            raise Exception(f"Error on {dxl_id}: {self.packet_handler.getRxPacketError(dxl_error)}")
+
+    def set_torque(self, enable):
+        # one sync write for every joint
+        group = GroupSyncWrite(self.port_handler, self.packet_handler,
+                               self.torque_item.address, self.torque_item.size)
+        value = bytes([TORQUE_ENABLE if enable else TORQUE_DISABLE])
+        for dxl_id in self.ids:
+            group.addParam(dxl_id, value)
+        dxl_comm_result = group.txPacket()
+        if dxl_comm_result != COMM_SUCCESS:
+            raise Exception(f"Torque sync write failed: {self.packet_handler.getTxRxResult(dxl_comm_result)}")
+
+    def to_ticks(self, positions):
+        # positions: {id: rad} for some or all joints, or an array of rad in self.ids order
+        if isinstance(positions, dict):
+            rad = np.full(len(self.ids), np.nan)
+            for dxl_id, value in positions.items():
+                rad[self.index[dxl_id]] = value
+        else:
+            rad = np.asarray(positions, dtype=float)
+            if rad.shape != (len(self.ids),):
+                raise Exception(f"Expected {len(self.ids)} positions, got shape {rad.shape}")
+
+        ticks = np.rint((rad + self.offsets) * RAD_TO_TICKS) + self.zero_ticks
+        ticks = np.clip(ticks, self.min_ticks, self.max_ticks)
+        return ticks, ~np.isnan(rad)
+
+    def write(self, positions):
+        ticks, present = self.to_ticks(positions)
+        for i, dxl_id in enumerate(self.ids):
+            if present[i]:
+                self.goal_group.changeParam(dxl_id, int(ticks[i]).to_bytes(4, "little", signed=True))
+            elif self.last_ticks is None:
+                raise Exception(f"No position for ID {dxl_id} and no previous command to hold")
+
+        dxl_comm_result = self.goal_group.txPacket()
+        if dxl_comm_result != COMM_SUCCESS:
+            raise Exception(f"Goal sync write failed: {self.packet_handler.getTxRxResult(dxl_comm_result)}")
+        self.last_ticks = np.where(present, ticks, self.last_ticks if self.last_ticks is not None else ticks)
+        return self.last_ticks
+
+
+# -------------------------------
+# Throughput
+# -------------------------------
+def measure_throughput(writer, positions, iterations=200):
+    # Commands per second of one sync write per cycle against one acknowledged
+    # write4ByteTxRx per joint, sending the same goals
+    ticks, _ = writer.to_ticks(positions)
+    goal_address = writer.goal_group.start_address
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for i, dxl_id in enumerate(writer.ids):
+            writer.packet_handler.write4ByteTxRx(writer.port_handler, dxl_id, goal_address, int(ticks[i]) & 0xFFFFFFFF)
+    per_joint = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        writer.write(positions)
+    sync_write = time.perf_counter() - start
+
+    return {
+        "per_joint_hz": iterations / per_joint,
+        "sync_write_hz": iterations / sync_write,
+        "speedup": per_joint / sync_write,
+    }
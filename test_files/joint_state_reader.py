@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+import math
+import time
+
+import numpy as np
+from dynamixel_sdk import *  # Dynamixel SDK
+
+# -------------------------------
+# Dynamixel configuration
+# -------------------------------
+ADDR_PRESENT_CURRENT  = 126   # 2 bytes
+ADDR_PRESENT_VELOCITY = 128   # 4 bytes
+ADDR_PRESENT_POSITION = 132   # 4 bytes
+LEN_PRESENT_STATE     = 10    # current, velocity and position are contiguous (126..135)
+
+# Constants
+TICKS_PER_REV = 4096
+TICKS_TO_RAD = (2 * math.pi) / TICKS_PER_REV
+VELOCITY_TO_RAD_S = 0.229 * (2 * math.pi) / 60   # 0.229 rpm per unit
+
+# One record of the 10-byte block, little endian and signed, as laid out in the control table
+PRESENT_STATE_DTYPE = np.dtype([
+    ("current", "<i2"),
+    ("velocity", "<i4"),
+    ("position", "<i4"),
+])
+
+
+@dataclass
+class JointStateSample:
+    timestamp: float          # time.monotonic() halfway through the read
+    ids: list
+    current: np.ndarray       # raw signed current units
+    velocity: np.ndarray      # rad/s
+    position: np.ndarray      # rad
+    position_ticks: np.ndarray
+
+    def as_dicts(self):
+        return [
+            {
+                "id": dxl_id,
+                "position": int(self.position_ticks[i]),
+                "pos_rad": float(self.position[i]),
+                "vel_rad_s": float(self.velocity[i]),
+                "current": int(self.current[i]),
+            }
+            for i, dxl_id in enumerate(self.ids)
+        ]
+
+
+# -------------------------------
+# Reader
+# -------------------------------
+# Reads present current, velocity and position of every joint with one sync read
+class JointStateReader:
+
+    def __init__(self, port_handler, packet_handler, dxl_ids, use_fast_sync_read=True):
+        self.packet_handler = packet_handler
+        self.ids = list(dxl_ids)
+        self.use_fast_sync_read = use_fast_sync_read
+
+        self.group = GroupSyncRead(port_handler, packet_handler, ADDR_PRESENT_CURRENT, LEN_PRESENT_STATE)
+        for dxl_id in self.ids:
+            if not self.group.addParam(dxl_id):
+                raise Exception(f"Failed to add ID {dxl_id} to the sync read")
+
+        self.raw = bytearray(LEN_PRESENT_STATE * len(self.ids))
+
+    def read(self):
+        start = time.monotonic()
+        if self.use_fast_sync_read:
+            dxl_comm_result = self.group.fastSyncRead()
+        else:
+            dxl_comm_result = self.group.txRxPacket()
+        end = time.monotonic()
+        if dxl_comm_result != COMM_SUCCESS:
+            raise Exception(f"Sync read failed: {self.packet_handler.getTxRxResult(dxl_comm_result)}")
+
+        # pack every joint's block in ID order, then decode all joints at once
+        for i, dxl_id in enumerate(self.ids):
+            self.raw[i * LEN_PRESENT_STATE:(i + 1) * LEN_PRESENT_STATE] = self.group.data_dict[dxl_id]
+        state = np.frombuffer(self.raw, dtype=PRESENT_STATE_DTYPE)
+
+        position_ticks = state["position"].astype(np.int64)
+        return JointStateSample(
+            timestamp=(start + end) / 2,
+            ids=self.ids,
+            current=state["current"].astype(np.int64),
+            velocity=state["velocity"] * VELOCITY_TO_RAD_S,
+            position=position_ticks * TICKS_TO_RAD,
+            position_ticks=position_ticks,
+        )
+
+    # Yields samples at rate_hz; a late read does not shift the schedule of later ones
+    def stream(self, rate_hz, max_samples=None):
+        period = 1.0 / rate_hz
+        next_time = time.monotonic()
+        count = 0
+        while max_samples is None or count < max_samples:
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            yield self.read()
+            count += 1
+
+            next_time += period
+            if next_time < time.monotonic():
+                # fell behind by more than a period: skip the missed slots
+                next_time = time.monotonic()
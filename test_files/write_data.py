@@ -1,22 +1,14 @@
 from dynamixel_sdk import *  # Dynamixel SDK
-import math
+from joint_command_writer import JointCommandWriter, measure_throughput
 
 # -------------------------------
 # Dynamixel configuration
 # -------------------------------
-ADDR_TORQUE_ENABLE  = 64    # 1 byte
-ADDR_GOAL_POSITION  = 116   # 4 bytes
-TORQUE_ENABLE       = 1
-TORQUE_DISABLE      = 0
-
 PROTOCOL_VERSION = 2.0
 BAUDRATE = 1000000
 DEVICENAME = 'COM6'
 DXL_IDS = [11, 12, 13, 14,15]
-
-# Constants
-TICKS_PER_REV = 4096
-RAD_TO_TICKS = TICKS_PER_REV / (2 * math.pi)
+MEASURE_THROUGHPUT = False   # resends the same goals to compare with per-joint writes
 
 # -------------------------------
 # Initialize PortHandler and PacketHandler
@@ -29,27 +21,17 @@ if not portHandler.openPort():
 if not portHandler.setBaudRate(BAUDRATE):
     raise Exception("Failed to set baudrate")
 
+# Reads operating mode and position limits of each joint once, then sends
+# every command with a single sync write
+writer = JointCommandWriter(portHandler, packetHandler, DXL_IDS)
+
 # -------------------------------
 # Enable torque for all joints
 # -------------------------------
-for dxl_id in DXL_IDS:
-    dxl_comm_result, dxl_error = packetHandler.write1ByteTxRx(
-        portHandler, dxl_id, ADDR_TORQUE_ENABLE, TORQUE_ENABLE
-    )
-    if dxl_comm_result != COMM_SUCCESS:
-        print(f"Comm error on {dxl_id}: {packetHandler.getTxRxResult(dxl_comm_result)}")
-    elif dxl_error != 0:
-        print(f"Error on {dxl_id}: {packetHandler.getRxPacketError(dxl_error)}")
+writer.set_torque(True)
 
 print("Torque enabled on all joints.")
 
-# -------------------------------
-# Write joint command
-# -------------------------------
-def write_joint_position(dxl_id, pos_rad):
-    goal_ticks = int(pos_rad * RAD_TO_TICKS) % TICKS_PER_REV
-    packetHandler.write4ByteTxRx(portHandler, dxl_id, ADDR_GOAL_POSITION, goal_ticks)
-
 # -------------------------------
 # Example usage (from Groot output)
 # -------------------------------
@@ -67,16 +49,19 @@ groot_output = {
 # {'id': 14, 'position': 3109, 'pos_rad': 4.769146269536458}, 
 # {'id': 15, 'position': 1252, 'pos_rad': 1.9205439464328227}]
 
-for dxl_id, pos_rad in groot_output.items():
-    write_joint_position(dxl_id, pos_rad)
+goal_ticks = writer.write(groot_output)
+
+print(f"Commands sent to robot arm! Goal ticks: {goal_ticks.astype(int).tolist()}")
 
-print("Commands sent to robot arm!")
+if MEASURE_THROUGHPUT:
+    throughput = measure_throughput(writer, groot_output)
+    print(f"Per-joint writes: {throughput['per_joint_hz']:.1f} cycles/s, "
+          f"sync write: {throughput['sync_write_hz']:.1f} cycles/s ({throughput['speedup']:.1f}x)")
 
 # -------------------------------
 # Disable torque + cleanup
 # -------------------------------
-for dxl_id in DXL_IDS:
-    packetHandler.write1ByteTxRx(portHandler, dxl_id, ADDR_TORQUE_ENABLE, TORQUE_DISABLE)
+writer.set_torque(False)
 
 portHandler.closePort()
 print("Torque disabled and port closed.")